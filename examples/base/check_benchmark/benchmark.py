@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+from tenable.base.v1 import APIEndpoint
+import click, timeit, uuid
+
+
+def scenarios(size):
+    '''
+    Returns the list of named validation scenarios to be timed.  Each scenario
+    validates ``size`` items so that the rates are comparable.
+    '''
+    api = APIEndpoint(None)
+    uuids = [str(uuid.uuid4()) for _ in range(size)]
+    ints = list(range(size))
+    strs = ['{}'.format(i) for i in range(size)]
+    choices = ['info', 'low', 'medium', 'high', 'critical']
+    sevs = [choices[i % len(choices)] for i in range(size)]
+    return [
+        ('uuid (_check per item)',
+            lambda: [api._check('asset', u, 'uuid') for u in uuids]),
+        ('uuid (_check_list)',
+            lambda: api._check_list('asset', uuids, 'uuid')),
+        ('int (_check per item)',
+            lambda: [api._check('id', i, int) for i in ints]),
+        ('int (_check_list)',
+            lambda: api._check_list('id', ints, int)),
+        ('str recast to int',
+            lambda: api._check_list('id', strs, int)),
+        ('choices',
+            lambda: [api._check('sev', s, str, choices=choices) for s in sevs]),
+        ('choices with case',
+            lambda: [api._check('sev', s, str, choices=choices, case='lower')
+                for s in sevs]),
+        ('pattern',
+            lambda: [api._check('id', s, str, pattern=r'^\d+$') for s in strs]),
+    ]
+
+
+@click.command()
+@click.option('--size', '-s', default=100000,
+    help='The number of items validated within each scenario.')
+@click.option('--repeat', '-r', default=3,
+    help='The number of times to run each scenario.')
+def run(size, repeat):
+    '''
+    Micro-benchmarks the input validation performed by APIEndpoint._check.
+    '''
+    for name, func in scenarios(size):
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print('{:<24} {:>10.3f}s {:>14.0f} checks/sec'.format(
+            name, best, size / best))
+
+
+if __name__ == '__main__':
+    run()
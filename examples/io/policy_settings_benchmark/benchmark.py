@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+from restfly.utils import dict_merge
+from tenable.utils import policy_settings
+from vcr.serializers import yamlserializer
+import click, copy, glob, gzip, json, os, timeit
+
+CASSETTES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    '..', '..', '..', 'tests', 'io', 'cassettes')
+
+
+def recursive_policy_settings(item):
+    '''
+    The recursive implementation of policy_settings from pyTenable 1.3, used
+    as the baseline.
+    '''
+    resp = dict()
+    if 'id' in item and ('default' in item
+        or ('type' in item and item['type'] in [
+            'file',
+            'checkbox',
+            'entry',
+            'textarea',
+            'medium-fixed-entry',
+            'password'])):
+        if not 'default' in item:
+            item['default'] = ""
+        resp[item['id']] = item['default']
+
+    for key in item.keys():
+        if key == 'modes':
+            continue
+        if (isinstance(item[key], list)
+            and len(item[key]) > 0
+            and isinstance(item[key][0], dict)):
+            for i in item[key]:
+                resp = dict_merge(resp, recursive_policy_settings(i))
+        if isinstance(item[key], dict):
+            resp = dict_merge(resp, recursive_policy_settings(item[key]))
+    return resp
+
+
+def load_documents(path):
+    '''
+    Returns the editor documents recorded within the cassettes, keyed by the
+    cassette name and the request URI.
+    '''
+    docs = dict()
+    for fn in sorted(glob.glob(os.path.join(path, '*.yaml'))):
+        with open(fn) as fobj:
+            text = fobj.read()
+        if '/editor/' not in text:
+            continue
+        for item in yamlserializer.deserialize(text)['interactions']:
+            uri = item['request']['uri']
+            if '/editor/' not in uri or '/families/' in uri:
+                continue
+            body = item['response']['body']['string']
+            if isinstance(body, bytes):
+                if body[:2] == b'\x1f\x8b':
+                    body = gzip.decompress(body)
+                body = body.decode('utf-8')
+            try:
+                doc = json.loads(body)
+            except ValueError:
+                continue
+            if isinstance(doc, dict) and 'settings' in doc:
+                docs[uri] = doc
+    return docs
+
+
+def renumber(item, suffix):
+    '''
+    Appends the suffix to every setting id within the document so that the
+    copies of a document don't overwrite each other's settings.
+    '''
+    stack = [item]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if isinstance(node.get('id'), str):
+                node['id'] = '{}_{}'.format(node['id'], suffix)
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return item
+
+
+def large_template(doc, copies):
+    '''
+    Builds a large template by grafting renumbered copies of the document's
+    settings into the compliance section, as a compliance-heavy policy would
+    have.
+    '''
+    doc = copy.deepcopy(doc)
+    doc.setdefault('compliance', {'data': []})
+    for i in range(copies):
+        doc['compliance']['data'].append({
+            'name': 'copy {}'.format(i),
+            'settings': renumber(copy.deepcopy(doc['settings']), i),
+        })
+    return doc
+
+
+def measure(func, doc, repeat):
+    '''
+    Returns the number of settings found and the best time it took.
+    '''
+    settings = len(func(copy.deepcopy(doc)))
+    docs = [copy.deepcopy(doc) for _ in range(repeat)]
+    best = min(timeit.repeat(lambda: func(docs.pop()), number=1, repeat=repeat))
+    return settings, best
+
+
+@click.command()
+@click.option('--cassettes', '-c', default=CASSETTES,
+    type=click.Path(exists=True, file_okay=False),
+    help='The directory of recorded cassettes to load editor documents from.')
+@click.option('--copies', '-n', default=[1, 10, 100], multiple=True,
+    help='The number of copies of the settings to graft into the template.')
+@click.option('--repeat', '-r', default=3,
+    help='The number of times to walk each template.')
+def run(cassettes, copies, repeat):
+    '''
+    Compares the recursive and iterative policy_settings implementations using
+    the largest editor document recorded within the cassettes.
+    '''
+    docs = load_documents(cassettes)
+    uri, doc = max(docs.items(), key=lambda d: len(json.dumps(d[1])))
+    print('{} editor documents loaded, using {}'.format(len(docs), uri))
+
+    for count in copies:
+        tmpl = large_template(doc, count)
+        settings, old = measure(recursive_policy_settings, tmpl, repeat)
+        _, new = measure(policy_settings, tmpl, repeat)
+        print('{:>5} copies {:>8} settings {:>10.4f}s {:>10.4f}s {:>6.1f}x'.format(
+            count, settings, old, new, old / new))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+from tenable.reports import NessusReportv2
+from tenable.reports import nessusv2
+import click, time
+
+
+def measure(path, repeat, **kwargs):
+    '''
+    Parses the report the number of times specified and returns the number of
+    items parsed and the best time it took to parse them.
+    '''
+    best = None
+    for _ in range(repeat):
+        with open(path, 'rb') as report:
+            started = time.perf_counter()
+            items = sum(1 for _ in NessusReportv2(report, **kwargs))
+            elapsed = time.perf_counter() - started
+        if best is None or elapsed < best:
+            best = elapsed
+    return items, best
+
+
+@click.command()
+@click.argument('report', type=click.Path(exists=True))
+@click.option('--repeat', '-r', default=3,
+    help='The number of times to parse the report for each parser.')
+def run(report, repeat):
+    '''
+    Compares the parsing throughput of the standard and fast NessusReportv2
+    parsers.
+    '''
+    parsers = [('standard', {}), ('fast', {'fast': True})]
+    if nessusv2.lxml_iterparse:
+        parsers.append(('fast (no lxml)', {'fast': True, 'lxml': False}))
+
+    baseline = None
+    for name, kwargs in parsers:
+        if kwargs.pop('lxml', True) is False:
+            # Temporarily hide lxml so that the fast parser uses defusedxml.
+            lxml, nessusv2.lxml_iterparse = nessusv2.lxml_iterparse, None
+            items, elapsed = measure(report, repeat, **kwargs)
+            nessusv2.lxml_iterparse = lxml
+        else:
+            items, elapsed = measure(report, repeat, **kwargs)
+        rate = items / elapsed
+        baseline = baseline or rate
+        print('{:<16} {:>8} items {:>10.3f}s {:>12.0f} items/sec {:>6.1f}x'.format(
+            name, items, elapsed, rate, rate / baseline))
+
+
+if __name__ == '__main__':
+    run()
@@ -18,6 +18,7 @@ interface to use for your own uses, take a look at the RESTfly library.
 '''
 from __future__ import absolute_import
 import requests, sys, platform, logging, re, time, logging, warnings, json
+from functools import lru_cache
 from requests.exceptions import (
     ConnectionError as RequestsConnectionError,
     RequestException as RequestsRequestException
@@ -32,9 +33,78 @@ from tenable.errors import (
 		NotFoundError,
 		UnsupportedError,
 		FileDownloadError,
-		ServerError
+		ServerError,
+		UnknownError,
+		RetryError
 )
 
+# The patterns used to validate the uuid and scanner-uuid types within _check.
+_UUID_PATTERN = re.compile(
+    r'^[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$')
+_SCANNER_UUID_PATTERN = re.compile(
+    r'^[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12,32}$')
+_TYPE_PATTERNS = {
+    'uuid': _UUID_PATTERN,
+    'scanner-uuid': _SCANNER_UUID_PATTERN,
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern):
+    '''
+    Compiles (and caches) the regex patterns handed to _check.
+    '''
+    return re.compile(pattern)
+
+
+def _convert_case(obj, case):
+    '''
+    Case conversion function
+    '''
+    if case == 'lower':
+        if isinstance(obj, list):
+            return [i.lower() for i in obj if isinstance(i, str)]
+        elif isinstance(obj, str):
+            return obj.lower()
+    elif case == 'upper':
+        if isinstance(obj, list):
+            return [i.upper() for i in obj if isinstance(i, str)]
+        elif isinstance(obj, str):
+            return obj.upper()
+    return obj
+
+
+def _conditional(kwargs):
+    '''
+    Determines if the request keyword arguments make a conditional request,
+    for which a 304 Not Modified response is expected.
+    '''
+    headers = kwargs.get('headers') or dict()
+    return any(h.lower() in ['if-none-match', 'if-modified-since']
+               for h in headers)
+
+
+class _Choices(object):
+    '''
+    Wraps the list of choices handed to _check so that membership tests use a
+    frozenset whenever the choices (and the item being tested) are hashable.
+    '''
+    def __init__(self, choices):
+        self.choices = choices
+        try:
+            self._set = frozenset(choices)
+        except TypeError:
+            self._set = None
+
+    def __contains__(self, item):
+        if self._set is not None:
+            try:
+                return item in self._set
+            except TypeError:
+                pass
+        return item in self.choices
+
+
 class APIResultsIterator(object):
     '''
     The API iterator provides a scalable way to work through result sets of any
@@ -87,6 +157,34 @@ class APIResultsIterator(object):
     def _get_page(self):
         pass
 
+    def _close_pool(self):
+        pass
+
+    def close(self):
+        '''
+        Stops the iterator, cancelling any requests that are still running in
+        the background.  This is called once the iterator has been exhausted,
+        when leaving the iterator's context, and when the iterator is garbage
+        collected, so it only needs to be called when breaking out of the
+        iteration early.
+
+        Examples:
+            >>> with tio.agents.list() as agents:
+            ...     for agent in agents:
+            ...         if agent['name'] == 'example':
+            ...             break
+        '''
+        self._close_pool()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
     def __iter__(self):
         return self
 
@@ -175,28 +273,22 @@ class APIEndpoint(object):
              obj: Either the object or the default object depending.
         '''
 
-        # We have a simple function to convert the case of string values so that
-        # we can ensure correct output.
-        def conv(obj, case):
-            '''
-            Case conversion function
-            '''
-            if case == 'lower':
-                if isinstance(obj, list):
-                    return [i.lower() for i in obj if isinstance(i, str)]
-                elif isinstance(obj, str):
-                    return obj.lower()
-            elif case == 'upper':
-                if isinstance(obj, list):
-                    return [i.upper() for i in obj if isinstance(i, str)]
-                elif isinstance(obj, str):
-                    return obj.upper()
-            return obj
+        # As the vast majority of checks are simple type checks of an object
+        # that is already of the expected type (or a well-formed UUID), we will
+        # return those straight away without going through the full check.
+        if obj is not None and not case and choices is None and not pattern:
+            if expected_type.__class__ is str:
+                regex = _TYPE_PATTERNS.get(expected_type)
+                if regex and obj.__class__ is str and regex.match(obj):
+                    return obj
+            elif obj.__class__ is expected_type:
+                return obj
 
         # Convert the case of the inputs.
-        obj = conv(obj, case)
-        choices = conv(choices, case)
-        default = conv(default, case)
+        if case:
+            obj = _convert_case(obj, case)
+            choices = _convert_case(choices, case)
+            default = _convert_case(default, case)
 
         # If the object sent to us has a None value, then we will return None.
         # If a default was set, then we will return the default value.
@@ -209,18 +301,18 @@ class APIEndpoint(object):
         # is a singular type, and we will want to wrap it into a list before
         # passing to the etypes list.
         if isinstance(expected_type, list) and len(expected_type) > 0:
-            etypes = expected_type
+            etypes = list(expected_type)
         else:
             etypes = [expected_type,]
 
         # If the type is of "uuid", then we will specify a pattern and then
         # overload the type to be a type of str.
         if 'uuid' in etypes:
-            pattern = r'^[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$'
+            pattern = _UUID_PATTERN
             etypes[etypes.index('uuid')] = str
 
         if 'scanner-uuid' in etypes:
-            pattern = r'^[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12,32}$'
+            pattern = _SCANNER_UUID_PATTERN
             etypes[etypes.index('scanner-uuid')] = str
 
         # If we are checking for a string type, we will also want to check for
@@ -283,24 +375,26 @@ class APIEndpoint(object):
         # we should check against that and raise an exception if the the actual
         # value is outside of what we expect.
 
-        if isinstance(obj, list):
-            for item in obj:
-                if isinstance(choices, list) and item not in choices:
-                    raise UnexpectedValueError(
-                        '{} has value of {}.  Expected one of {}'.format(
-                            name, obj, ','.join([str(i) for i in choices])
-                    ))
-        elif isinstance(choices, list) and obj not in choices:
-            raise UnexpectedValueError(
-                '{} has value of {}.  Expected one of {}'.format(
-                    name, obj, ','.join([str(i) for i in choices])
-            ))
+        if isinstance(choices, list):
+            allowed = _Choices(choices)
+            if isinstance(obj, list):
+                for item in obj:
+                    if item not in allowed:
+                        raise UnexpectedValueError(
+                            '{} has value of {}.  Expected one of {}'.format(
+                                name, obj, ','.join([str(i) for i in choices])
+                        ))
+            elif obj not in allowed:
+                raise UnexpectedValueError(
+                    '{} has value of {}.  Expected one of {}'.format(
+                        name, obj, ','.join([str(i) for i in choices])
+                ))
 
         if pattern and isinstance(obj, str):
-            if len(re.findall(pattern, str(obj))) <= 0:
+            if not _compile_pattern(pattern).search(str(obj)):
                 raise UnexpectedValueError(
                     '{} has value of {}.  Does not match pattern {}'.format(
-                        name, obj, pattern)
+                        name, obj, getattr(pattern, 'pattern', pattern))
                 )
 
 
@@ -308,6 +402,47 @@ class APIEndpoint(object):
         # everything is good to go and return the object passed to us initially.
         return obj
 
+    def _check_list(self, name, objs, expected_type, choices=None, case=None,
+                    pattern=None):
+        '''
+        Validates every item within the list using the same rules as
+        ``_check()``, returning the list of validated items.  When validating
+        lists of UUIDs (or simple types), the whole list is validated in a
+        single pass, and only the items that fail the fast check are run
+        through ``_check()`` to raise the appropriate error (or recast them).
+
+        Args:
+            name (str): The name of the items (for exception reporting)
+            objs (list): The list of items that we will be checking
+            expected_type (type):
+                The expected type of each item.
+            choices (list, optional):
+                The finite set of values each item is allowed to be.
+            case (string, optional):
+                Forces the item values to be ``upper`` or ``lower`` case.
+            pattern (string, optional):
+                A regex pattern that each item must match.
+
+        Returns:
+            :obj:`list`:
+                The list of validated items.
+
+        Examples:
+            >>> assets = self._check_list('asset', assets, 'uuid')
+        '''
+        if not choices and not case and not pattern:
+            if expected_type.__class__ is str:
+                regex = _TYPE_PATTERNS.get(expected_type)
+                if regex:
+                    match = regex.match
+                    return [o if o.__class__ is str and match(o)
+                        else self._check(name, o, expected_type) for o in objs]
+            elif expected_type.__class__ is type:
+                return [o if o.__class__ is expected_type
+                    else self._check(name, o, expected_type) for o in objs]
+        return [self._check(name, o, expected_type, choices=choices,
+            case=case, pattern=pattern) for o in objs]
+
 
 class APISession(object):
     '''
@@ -372,6 +507,28 @@ class APISession(object):
     an exception.
     '''
 
+    _log_body_limit = 4096
+    '''
+    int: The maximum number of characters of the params and the body of each
+    request that will be written to the debug log.  If set to None, then the
+    params and body are logged in full.
+    '''
+
+    request_hook = None
+    '''
+    callable: An optional hook that is called with an event dictionary after
+    every request attempt (including each retry).  The event contains the
+    ``method``, ``path``, ``url``, ``attempt``, ``status``, ``request_uuid``,
+    ``elapsed`` seconds, and the ``error`` raised by requests (if any).  This
+    is intended for feeding metrics and tracing without needing to enable
+    debug logging.
+
+    Example:
+        >>> def hook(event):
+        ...     stats.timing(event['path'], event['elapsed'])
+        >>> tio.request_hook = hook
+    '''
+
     def __init__(self, url=None, retries=None, backoff=None,
                  ua_identity=None, session=None, proxies=None,
                  vendor=None, product=None, build=None, timeout=None,
@@ -468,6 +625,50 @@ class APISession(object):
         '''
         return kwargs
 
+    def _request_log(self, method, path, kwargs):
+        '''
+        Builds the debug log line for the request.  The params and body are
+        serialized incrementally and cut off once the serialized form grows
+        beyond ``_log_body_limit`` characters.  Truncated values are logged as
+        a string of the partial JSON document.
+        '''
+        def serialize(obj):
+            if self._log_body_limit is None:
+                return json.dumps(obj, default=str)
+            encoder = json.JSONEncoder(default=str)
+            chunks, size = list(), 0
+            for chunk in encoder.iterencode(obj):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > self._log_body_limit:
+                    return json.dumps('{}...'.format(
+                        ''.join(chunks)[:self._log_body_limit]))
+            return ''.join(chunks)
+
+        if path in self._restricted_paths:
+            # The path was a restricted path (one that would contain sensitive
+            # data, such as login information), so redact the information.
+            params = body = '"REDACTED"'
+        else:
+            params = serialize(kwargs.get('params', {}))
+            body = serialize(kwargs.get('json', {}))
+        return '{{"method": {}, "url": {}, "params": {}, "body": {}}}'.format(
+            json.dumps(method),
+            json.dumps('{}/{}'.format(self._url, path)),
+            params, body)
+
+    def _request_event(self, event, started):
+        '''
+        Passes the event for a request attempt on to the request hook.
+        '''
+        if self.request_hook:
+            event['elapsed'] = time.time() - started
+            try:
+                self.request_hook(event)
+            except Exception as err:
+                # A broken hook should never take down the request itself.
+                self._log.warning('Request hook error: {}'.format(str(err)))
+
     def _request(self, method, path, **kwargs):
         '''
         Request call builder
@@ -483,27 +684,21 @@ class APISession(object):
             del(kwargs['retry_on'])
 
         while retries <= self._retries:
-            if path not in self._restricted_paths:
-                # If the path is not one of the paths that would contain
-                # sensitive data (such as login information) then pass the
-                # log on un-redacted.
-                self._log.debug(json.dumps({
-                        'method': method,
-                        'url': '{}/{}'.format(self._url, path),
-                        'params': kwargs.get('params', {}),
-                        'body': kwargs.get('json', {})
-                    })
-                )
-            else:
-                # The path was a restricted path, generate the log, however
-                # redact the information.
-                self._log.debug(json.dumps({
-                        'method': method,
-                        'url': '{}/{}'.format(self._url, path),
-                        'params': 'REDACTED',
-                        'body': 'REDACTED'
-                    })
-                )
+            # Building the debug log means serializing the params and the body
+            # of the request, which can be quite large (think asset imports).
+            # So we will only do so if someone is actually listening.
+            if self._log.isEnabledFor(logging.DEBUG):
+                self._log.debug(self._request_log(method, path, kwargs))
+            event = {
+                'method': method,
+                'path': path,
+                'url': '{}/{}'.format(self._url, path),
+                'attempt': retries,
+                'status': None,
+                'request_uuid': None,
+                'error': None,
+            }
+            started = time.time()
 
             # Make the call to the API and pull the status code.
             try:
@@ -511,17 +706,23 @@ class APISession(object):
                     '{}/{}'.format(self._url, path),
                     timeout=self._timeout, **kwargs)
                 status = resp.status_code
+                event['status'] = status
+                event['request_uuid'] = resp.headers.get('x-request-uuid')
 
             # This series of error blocks will catch any underlying exceptions
             # thrown from the requests library, log them, iterate the retry
             # counter, then release the attempt for the next iteration.
             except (RequestsConnectionError, RequestsRequestException) as err:
                 self._log.error('Requests Error: {}'.format(str(err)))
+                event['error'] = err
+                self._request_event(event, started)
                 time.sleep(1)
                 retries += 1
 
             # The following code will run when a request successfully returned.
             else:
+                self._request_event(event, started)
+
                 # If there is a Request UUID then we will want to log the UUID
                 # just in case we may need it for tracking down what happened
                 # within the Tenable.io platform.
@@ -552,6 +753,12 @@ class APISession(object):
                     # will want to raise the appropriate Error.
                     raise self._error_codes[status](resp)
 
+                elif status == 304 and _conditional(kwargs):
+                    # A conditional request was made and the resource hasn't
+                    # changed, so the caller will want the response to reuse
+                    # what it already has.
+                    return resp
+
                 elif status >= 200 and status <= 299:
                     # As everything looks ok, lets pass the response on to the
                     # error checker and then return the response.
@@ -5,6 +5,7 @@
 .. autoclass:: NotFoundError
 .. autoclass:: PackageMissingError
 .. autoclass:: PasswordComplexityError
+.. autoclass:: PollingTimeout
 .. autoclass:: RetryError
 .. autoclass:: ServerError
 .. autoclass:: TenableException
@@ -86,6 +87,14 @@ class PackageMissingError(TenableException):
     pass
 
 
+class PollingTimeout(TenableException):
+    '''
+    PollingTimeout is thrown when a job that is being polled for its status
+    has not reached a completed state before the polling deadline.
+    '''
+    pass
+
+
 class TioExportsError(TenableException):
     '''
     When the exports APIs throw an error when processing an export, pyTenable
@@ -7,6 +7,7 @@
 .. automodule:: tenable.io.agent_exclusions
 .. automodule:: tenable.io.agent_groups
 .. automodule:: tenable.io.agents
+.. automodule:: tenable.io.aio
 .. automodule:: tenable.io.assets
 .. automodule:: tenable.io.audit_log
 .. automodule:: tenable.io.credentials
@@ -128,6 +129,11 @@ class TenableIO(APISession):
             The connection timeout parameter informing the library how long to
             wait in seconds for a stalled response before terminating the
             connection.  If unspecified, the default is 120 seconds.
+        template_cache_ttl (int, optional):
+            If specified, the editor template listings and template documents
+            are cached within this session for this many seconds, so that
+            repeatedly creating scans and policies from the same templates
+            doesn't refetch them.  If unspecified, templates aren't cached.
 
     Examples:
         Basic Example:
@@ -290,7 +296,8 @@ class TenableIO(APISession):
 
     def __init__(self, access_key=None, secret_key=None, url=None, retries=None,
                  backoff=None, ua_identity=None, session=None, proxies=None,
-                 vendor=None, product=None, build=None, timeout=None, ssl_verify=None):
+                 vendor=None, product=None, build=None, timeout=None, ssl_verify=None,
+                 template_cache_ttl=None):
         if access_key:
             self._access_key = access_key
         else:
@@ -304,6 +311,11 @@ class TenableIO(APISession):
         if not self._access_key or not self._secret_key:
             raise UnexpectedValueError('No valid API Keypair Defined')
 
+        # The editor template cache is held within the session so that it's
+        # never shared between sessions.
+        self._template_cache_ttl = template_cache_ttl
+        self._template_cache = dict()
+
         super(TenableIO, self).__init__(url,
             retries=retries,
             backoff=backoff,
@@ -142,7 +142,7 @@ class AccessGroupsAPI(TIOEndpoint):
         payload = {
             # run the rules through the filter parser...
             'rules': self._parse_filters(rules,
-                self._api.filters.access_group_asset_rules_filters(),
+                self._api.filters._filterset('access_group_asset_filters'),
                     rtype='accessgroup')['rules'],
 
             # run the principals through the principal parser...
@@ -199,7 +199,7 @@ class AccessGroupsAPI(TIOEndpoint):
         # If any rules are specified, then run them through the filter parser.
         if 'rules' in kw:
             kw['rules'] = self._parse_filters(kw['rules'],
-                self._api.filters.access_group_asset_rules_filters(),
+                self._api.filters._filterset('access_group_asset_filters'),
                     rtype='accessgroup')['rules']
 
         # if any principals are specified, then run them through the principal
@@ -309,7 +309,7 @@ class AccessGroupsAPI(TIOEndpoint):
         offset = 0
         pages = None
         query = self._parse_filters(filters,
-            self._api.filters.access_group_filters(), rtype='colon')
+            self._api.filters._filterset('access_groups'), rtype='colon')
 
         # If the offset was set to something other than the default starting
         # point of 0, then we will update offset to reflect that.
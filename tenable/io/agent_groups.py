@@ -236,7 +236,7 @@ class AgentGroupsAPI(TIOEndpoint):
         offset = 0
         pages = None
         query = self._parse_filters(filters,
-            self._api.filters.agents_filters(), rtype='colon')
+            self._api.filters._filterset('agents'), rtype='colon')
 
         # Overload the scanner_id with a new value if it has been requested
         # to do so.
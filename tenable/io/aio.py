@@ -0,0 +1,201 @@
+'''
+aio
+===
+
+The asyncio client exposes the same endpoint classes as :obj:`TenableIO`, with
+every endpoint method returned as a coroutine.  As pyTenable doesn't depend on
+an asynchronous HTTP library, this isn't a native async transport: the
+synchronous calls are dispatched onto a bounded pool of worker threads sharing
+a connection pool that is sized to match, so that many requests may be in
+flight at once without blocking the event loop.  As the calls are made through
+the same session as the synchronous client, the retry codes, ``Retry-After``
+handling, and the ``X-Tio-Retry-Count`` and ``X-Tio-Last-Request-Uuid`` headers
+all behave exactly as they do within :obj:`TenableIO`.
+
+Any method returning an iterator (such as ``agents.list`` or
+``exports.vulns``) will instead return an asynchronous iterator that can be
+used with ``async for``.
+
+Example:
+
+.. code-block:: python
+
+    import asyncio
+    from tenable.io.aio import AsyncTenableIO
+
+    async def main():
+        async with AsyncTenableIO('ACCESS_KEY', 'SECRET_KEY') as tio:
+            agents, scanners = await asyncio.gather(
+                tio.agents.details(1),
+                tio.scanners.list(),
+            )
+            async for vuln in await tio.exports.vulns(workers=4):
+                print(vuln)
+
+    asyncio.run(main())
+
+.. autoclass:: AsyncTenableIO
+    :members:
+'''
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from tenable.base.v1 import APIEndpoint, APIResultsIterator
+from tenable.io import TenableIO
+
+# asyncio.get_running_loop was added in Python 3.7.  Within a coroutine, the
+# get_event_loop call returns the running loop on earlier versions.
+_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+class AsyncWrapper(object):
+    '''
+    Wraps a synchronous object so that each of its public methods is returned
+    as a coroutine function.  Any other attributes are passed through as-is.
+    '''
+    def __init__(self, client, obj):
+        self._client = client
+        self._obj = obj
+
+    def __getattr__(self, name):
+        attr = getattr(self._obj, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self._client._run(attr, *args, **kwargs)
+        return method
+
+
+class AsyncResultsIterator(AsyncWrapper):
+    '''
+    Wraps one of the synchronous results iterators as an asynchronous
+    iterator.  Every page request made by the wrapped iterator is run within
+    the client's worker pool.
+    '''
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        def step():
+            # StopIteration cannot be raised into a future, so we will return
+            # a flag informing the caller if the iterator was exhausted.
+            try:
+                return True, next(self._obj)
+            except StopIteration:
+                return False, None
+
+        found, item = await self._client._run(step)
+        if not found:
+            raise StopAsyncIteration()
+        return item
+
+
+class AsyncTenableIO(object):
+    '''
+    The asyncio Tenable.io client.  All of the endpoint classes available on
+    :obj:`TenableIO` are available here, with the methods returned as
+    coroutines.
+
+    Args:
+        access_key (str, optional):
+            The user's API access key for Tenable.io.  Refer to
+            :obj:`TenableIO` for details.
+        secret_key (str, optional):
+            The user's API secret key for Tenable.io.  Refer to
+            :obj:`TenableIO` for details.
+        workers (int, optional):
+            The maximum number of requests that may be in flight at once.  The
+            connection pool is sized to match.  The default is ``10``.
+        **kwargs (dict):
+            Any other keyword arguments supported by :obj:`TenableIO`.
+
+    Attributes:
+        tio (TenableIO): The synchronous client that the calls are made with.
+
+    Examples:
+        >>> async with AsyncTenableIO('ACCESS_KEY', 'SECRET_KEY') as tio:
+        ...     tags = await tio.tags.list()
+    '''
+    def __init__(self, access_key=None, secret_key=None, workers=10, **kwargs):
+        self.tio = TenableIO(access_key, secret_key, **kwargs)
+        self.workers = workers
+
+        # The default connection pool only keeps 10 connections per host, so
+        # we will size the pool to match the number of workers.
+        adapter = HTTPAdapter(pool_maxsize=workers)
+        self.tio._session.mount('https://', adapter)
+        self.tio._session.mount('http://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+    def __getattr__(self, name):
+        attr = getattr(self.tio, name)
+        if isinstance(attr, APIEndpoint):
+            return AsyncWrapper(self, attr)
+        return attr
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def _run(self, func, *args, **kwargs):
+        '''
+        Runs the function within the worker pool, wrapping any results
+        iterators that are returned.
+        '''
+        loop = _running_loop()
+        resp = await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+        if isinstance(resp, APIResultsIterator):
+            return AsyncResultsIterator(self, resp)
+        return resp
+
+    def close(self):
+        '''
+        Shuts down the worker pool and closes the underlying session.  As this
+        waits for any in-flight calls to complete, use :obj:`aclose` instead
+        from within a coroutine.
+        '''
+        self._executor.shutdown(wait=True)
+        self.tio._session.close()
+
+    async def aclose(self):
+        '''
+        Shuts down the worker pool and closes the underlying session without
+        blocking the event loop while the in-flight calls complete.
+        '''
+        await _running_loop().run_in_executor(None, self.close)
+
+    async def get(self, path, **kwargs):
+        '''
+        Initiates an HTTP GET request.  Refer to :obj:`TenableIO.get`.
+        '''
+        return await self._run(self.tio.get, path, **kwargs)
+
+    async def post(self, path, **kwargs):
+        '''
+        Initiates an HTTP POST request.  Refer to :obj:`TenableIO.post`.
+        '''
+        return await self._run(self.tio.post, path, **kwargs)
+
+    async def put(self, path, **kwargs):
+        '''
+        Initiates an HTTP PUT request.  Refer to :obj:`TenableIO.put`.
+        '''
+        return await self._run(self.tio.put, path, **kwargs)
+
+    async def patch(self, path, **kwargs):
+        '''
+        Initiates an HTTP PATCH request.  Refer to :obj:`TenableIO.patch`.
+        '''
+        return await self._run(self.tio.patch, path, **kwargs)
+
+    async def delete(self, path, **kwargs):
+        '''
+        Initiates an HTTP DELETE request.  Refer to :obj:`TenableIO.delete`.
+        '''
+        return await self._run(self.tio.delete, path, **kwargs)
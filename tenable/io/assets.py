@@ -11,6 +11,7 @@ Methods available on ``tio.assets``:
 .. autoclass:: AssetsAPI
 
     .. automethod:: asset_import
+    .. automethod:: bulk_import
     .. automethod:: delete
     .. automethod:: details
     .. automethod:: import_job_details
@@ -18,8 +19,244 @@ Methods available on ``tio.assets``:
     .. automethod:: list_import_jobs
     .. automethod:: tags
     .. automethod:: bulk_delete
+
+.. autoclass:: AssetImporter
+    :members:
 '''
-from tenable.io.base import TIOEndpoint
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import json
+import threading
+import time
+
+from tenable.io.base import TIOEndpoint, StatusPoller
+
+
+class AssetImporter(object):
+    '''
+    The asset importer streams assets from any iterable (such as a generator
+    reading a CMDB dump) into Tenable.io.  The assets are serialized into
+    batches as they are read, so only the batches that are in flight are held
+    in memory.  The batches are submitted concurrently and each of the
+    resulting import jobs is tracked until it has completed.  A failing batch
+    doesn't stop the rest of the batches from being imported, as the error is
+    reported within that batch's result instead and the batch's status is set
+    to ``FAILED``.  Likewise, assets that aren't dictionaries or can't be
+    serialized are left out of the batch they were read into and are reported
+    within that batch's ``rejected`` list.
+
+    Args:
+        api (TenableIO): The Tenable.io session.
+        source (str): An identifier to be used to upload the assets.
+        assets (iterable): The asset dictionaries to import.
+        batch_size (int, optional):
+            The maximum number of assets to send within each request.  The
+            default is ``1000``.
+        max_bytes (int, optional):
+            The maximum size in bytes of each request body.  If left
+            unspecified, the batches are only limited by ``batch_size``.
+        workers (int, optional):
+            The number of batches to import at once.  The default is ``4``.
+        wait (bool, optional):
+            Should each import job be polled until it has completed?  The
+            default is ``True``.
+        done (list, optional):
+            The statuses of a job that has completed.  The default is
+            ``['COMPLETE', 'FAILED', 'CANCELLED']``.
+        poller (dict, optional):
+            The keyword arguments to build the :obj:`StatusPoller` for each job
+            with.  The default is ``{'delay': 2, 'max_delay': 30}``.
+
+    Attributes:
+        results (list):
+            A result dictionary for each batch, in the order that the batches
+            were read.  Each result has the ``batch`` number, the number of
+            ``assets`` and ``bytes`` within the batch, the ``job_uuid``, the
+            last ``status`` and ``job`` record of the import job, any
+            ``error`` raised while importing the batch, the ``rejected``
+            assets, and the ``elapsed`` seconds.  Each rejected asset is
+            recorded with its ``index`` within the stream and the ``error``
+            that it was rejected with.
+
+    Examples:
+        >>> importer = AssetImporter(tio, 'cmdb', read_cmdb(), workers=8)
+        >>> importer.run()
+        >>> pprint(importer.stats)
+    '''
+    def __init__(self, api, source, assets, batch_size=1000, max_bytes=None,
+                 workers=4, wait=True, done=None, poller=None):
+        self._api = api
+        self.source = source
+        self.assets = assets
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self.wait = wait
+        self.done = [d.upper() for d in (done or
+            ['COMPLETE', 'FAILED', 'CANCELLED'])]
+        self.poller = poller or {'delay': 2, 'max_delay': 30}
+        self.results = list()
+        self._lock = threading.Lock()
+        self._started = None
+        self._finished = None
+        self._stats = {
+            'batches': 0,
+            'failed': 0,
+            'assets': 0,
+            'bytes': 0,
+            'uploaded_assets': 0,
+            'failed_assets': 0,
+            'rejected_assets': 0,
+        }
+
+    @property
+    def stats(self):
+        '''
+        The throughput counters for the importer.
+
+        Returns:
+            :obj:`dict`:
+                The number of ``batches`` submitted, the number of batches
+                that ``failed``, the number of ``assets`` and ``bytes`` sent,
+                the ``uploaded_assets`` and ``failed_assets`` reported by the
+                completed import jobs, the number of ``rejected_assets``
+                that were never sent, the ``elapsed`` seconds, and the
+                ``assets_per_sec`` and ``bytes_per_sec`` throughput.
+        '''
+        with self._lock:
+            stats = dict(self._stats)
+        elapsed = 0
+        if self._started:
+            elapsed = (self._finished or time.time()) - self._started
+        stats['elapsed'] = elapsed
+        stats['assets_per_sec'] = stats['assets'] / elapsed if elapsed else 0
+        stats['bytes_per_sec'] = stats['bytes'] / elapsed if elapsed else 0
+        return stats
+
+    def batches(self):
+        '''
+        Reads the assets and serializes them into request bodies, yielding
+        each batch as soon as it's full.
+
+        Yields:
+            :obj:`tuple`:
+                The number of assets, the serialized request body, and the
+                list of assets that were rejected.  If every asset read into
+                the batch was rejected, then the body is ``None``.
+        '''
+        head = '{{"source": {}, "assets": ['.format(
+            json.dumps(self.source)).encode('utf-8')
+        tail = b']}'
+        chunks = list()
+        rejected = list()
+        size = len(head) + len(tail)
+        for index, asset in enumerate(self.assets):
+            # An asset that can't be imported is recorded against the batch
+            # that it was read into instead of raising, as the batches before
+            # it may have already been submitted.
+            try:
+                if not isinstance(asset, dict):
+                    raise TypeError('asset is of type {}.  Expected dict.'
+                        .format(asset.__class__.__name__))
+                data = json.dumps(asset).encode('utf-8')
+            except (TypeError, ValueError) as err:
+                rejected.append({'index': index, 'error': err})
+                continue
+            if chunks and (len(chunks) >= self.batch_size
+              or (self.max_bytes and size + len(data) + 1 > self.max_bytes)):
+                yield len(chunks), head + b','.join(chunks) + tail, rejected
+                chunks = list()
+                rejected = list()
+                size = len(head) + len(tail)
+            chunks.append(data)
+            size += len(data) + 1
+        if chunks:
+            yield len(chunks), head + b','.join(chunks) + tail, rejected
+        elif rejected:
+            yield 0, None, rejected
+
+    def _process(self, result, body):
+        '''
+        Imports a single batch and tracks the job until it has completed.
+        '''
+        started = time.time()
+        try:
+            result['job_uuid'] = self._api.post('import/assets', data=body,
+                headers={'Content-Type': 'application/json'}
+            ).json()['asset_import_job_uuid']
+            result['status'] = 'SUBMITTED'
+            if self.wait:
+                job = StatusPoller(**self.poller).poll(
+                    lambda: self._api.assets.import_job_details(
+                        result['job_uuid']),
+                    lambda j: str(j.get('status')).upper() in self.done)
+                result['job'] = job
+                result['status'] = str(job.get('status')).upper()
+                with self._lock:
+                    self._stats['uploaded_assets'] += job.get(
+                        'uploaded_assets', 0)
+                    self._stats['failed_assets'] += job.get(
+                        'failed_assets', 0)
+        except Exception as err:
+            # Any error is kept within the batch's result so that a single
+            # failing batch doesn't stop the rest of the stream from being
+            # imported.
+            result['error'] = err
+            result['status'] = 'FAILED'
+            with self._lock:
+                self._stats['failed'] += 1
+        result['elapsed'] = time.time() - started
+        return result
+
+    def run(self):
+        '''
+        Imports all of the assets, keeping a couple of batches per worker in
+        flight, and waits for the import jobs to complete.
+
+        Returns:
+            :obj:`list`:
+                The result for each batch.
+        '''
+        self.results = list()
+        self._started = time.time()
+        self._finished = None
+        pending = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for count, body, rejected in self.batches():
+                # Only read further into the assets once one of the in-flight
+                # batches has completed.
+                if len(pending) >= self.workers * 2:
+                    _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                result = {
+                    'batch': len(self.results),
+                    'assets': count,
+                    'bytes': len(body) if body else 0,
+                    'job_uuid': None,
+                    'status': None,
+                    'job': None,
+                    'error': None,
+                    'rejected': rejected,
+                    'elapsed': None,
+                }
+                self.results.append(result)
+                with self._lock:
+                    self._stats['batches'] += 1
+                    self._stats['assets'] += count
+                    self._stats['bytes'] += result['bytes']
+                    self._stats['rejected_assets'] += len(rejected)
+
+                # A batch made up entirely of rejected assets has nothing to
+                # send, so it's failed without a request being made.
+                if body is None:
+                    result['error'] = rejected[-1]['error']
+                    result['status'] = 'FAILED'
+                    result['elapsed'] = 0
+                    with self._lock:
+                        self._stats['failed'] += 1
+                    continue
+                pending.add(pool.submit(self._process, result, body))
+        self._finished = time.time()
+        return self.results
+
 
 class AssetsAPI(TIOEndpoint):
     '''
@@ -109,8 +346,8 @@ class AssetsAPI(TIOEndpoint):
         return self._api.post(
             'tags/assets/assignments', json={
                 'action': self._check('action', action, str, choices=['add', 'remove']),
-                'assets': [self._check('asset', i, 'uuid') for i in assets],
-                'tags': [self._check('source', i, 'uuid') for i in tags]
+                'assets': self._check_list('asset', assets, 'uuid'),
+                'tags': self._check_list('source', tags, 'uuid')
             }).json()
 
     def tags(self, uuid):
@@ -174,6 +411,68 @@ class AssetsAPI(TIOEndpoint):
                 'source': self._check('source', source, str)
             }).json()['asset_import_job_uuid']
 
+    def bulk_import(self, source, assets, **kw):
+        '''
+        Streams any number of assets into Tenable.io.  The assets may be any
+        iterable, including a generator, and are serialized into batches as
+        they're read.  The batches are imported concurrently and each of the
+        import jobs is tracked until it has completed.  Refer to
+        :obj:`AssetImporter` for details.
+
+        :devportal:`assets: import <assets-import>`
+
+        Args:
+            source (str):
+                An identifier to be used to upload the assets.
+            assets (iterable):
+                The asset dictionaries to import.
+            batch_size (int, optional):
+                The maximum number of assets to send within each request.  The
+                default is ``1000``.
+            max_bytes (int, optional):
+                The maximum size in bytes of each request body.
+            workers (int, optional):
+                The number of batches to import at once.  The default is
+                ``4``.
+            wait (bool, optional):
+                Should each import job be polled until it has completed?  The
+                default is ``True``.
+            done (list, optional):
+                The statuses of a job that has completed.  The default is
+                ``['COMPLETE', 'FAILED', 'CANCELLED']``.
+            poller (dict, optional):
+                The keyword arguments for the :obj:`StatusPoller` used to poll
+                each job.
+
+        Returns:
+            :obj:`AssetImporter`:
+                The completed importer, with the ``results`` of each batch and
+                the throughput ``stats``.  Assets that aren't dictionaries are
+                reported within the ``rejected`` list of their batch's result
+                instead of raising an error.
+
+        Examples:
+            >>> def read_cmdb(path):
+            ...     with open(path) as fobj:
+            ...         for line in fobj:
+            ...             yield json.loads(line)
+            >>> importer = tio.assets.bulk_import('cmdb', read_cmdb('dump.json'))
+            >>> pprint(importer.stats)
+        '''
+        importer = AssetImporter(self._api,
+            source=self._check('source', source, str),
+            assets=assets,
+            batch_size=self._check('batch_size',
+                kw.get('batch_size'), int, default=1000),
+            max_bytes=self._check('max_bytes', kw.get('max_bytes'), int),
+            workers=self._check('workers', kw.get('workers'), int, default=4),
+            wait=self._check('wait', kw.get('wait'), bool, default=True),
+            done=self._check('done', kw.get('done'), list),
+            poller=self._check('poller', kw.get('poller'), dict),
+        )
+        importer.run()
+        return importer
+
     def list_import_jobs(self):
         '''
         Returns a list of asset import jobs.
@@ -275,7 +574,7 @@ class AssetsAPI(TIOEndpoint):
         filter_type = self._check('filter_type', filter_type, str,
             choices=['and', 'or'], default='and', case='lower')
         parsed = self._parse_filters(
-            filters, self._api.filters.workbench_asset_filters(), rtype='assets')['asset']
+            filters, self._api.filters._filterset('asset'), rtype='assets')['asset']
 
         payload['query'] = {filter_type: parsed}
 
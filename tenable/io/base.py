@@ -5,9 +5,124 @@ base
 The following methods in classes allow for page iteration
 and centralized data processing utility
 '''
+import hashlib
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from tenable.base import APIResultsIterator, APIEndpoint, FileDownloadError
-from tenable.errors import UnexpectedValueError
+from tenable.errors import UnexpectedValueError, PollingTimeout
+
+
+def tenant_key(api):
+    '''
+    Returns a short key identifying the Tenable.io tenant that the session is
+    connected to, for use when naming on-disk caches.  As the API keys are tied
+    to the tenant, the key is derived from the URL and the access key instead
+    of requiring an extra call to look it up.
+    '''
+    return hashlib.sha256('{}|{}'.format(
+        api._url, getattr(api, '_access_key', '')
+    ).encode('utf-8')).hexdigest()[:16]
+
+
+class StatusPoller(object):
+    '''
+    The status poller is the shared polling engine used when waiting on long
+    running jobs (exports, file downloads, scans, etc.) to complete.  Instead
+    of polling at a fixed interval, the delay between each status check will
+    grow exponentially (with some random jitter to keep concurrent pollers
+    from synchronizing) up to a maximum delay.  Whenever the progress hook
+    reports that the job has progressed, the delay is reset back to the
+    initial delay.
+
+    Args:
+        delay (float, optional):
+            The initial delay in seconds between status checks.  The default
+            is ``1`` second.
+        max_delay (float, optional):
+            The maximum delay in seconds between status checks.  The default
+            is ``30`` seconds.
+        multiplier (float, optional):
+            The factor that the delay is multiplied by after every status
+            check.  The default is ``2``.
+        jitter (float, optional):
+            The fraction of each delay that will be randomized.  The default
+            is ``0.25``.
+        deadline (int, optional):
+            The number of seconds that the poller will wait for the job to
+            complete before raising a :obj:`PollingTimeout`.  If left
+            unspecified, the poller will wait indefinitely.
+        progress (callable, optional):
+            A hook that is passed every status response and returns a value
+            representing the progress of the job (such as the number of chunks
+            available).  Whenever the value changes, the delay is reset.
+
+    Examples:
+        >>> poller = StatusPoller(max_delay=10, deadline=3600)
+        >>> status = poller.poll(
+        ...     lambda: tio.get('path/to/status').json(),
+        ...     lambda s: s['status'] == 'ready')
+    '''
+    def __init__(self, delay=1, max_delay=30, multiplier=2, jitter=0.25,
+                 deadline=None, progress=None):
+        self.delay = delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.progress = progress
+        self._started = time.time()
+        self.reset()
+
+    def reset(self):
+        '''
+        Resets the delay back to the initial delay.
+        '''
+        self._delay = self.delay
+
+    def sleep(self):
+        '''
+        Sleeps for the current delay and then increases the delay for the next
+        call.  If the deadline has passed, then a :obj:`PollingTimeout` will be
+        raised instead.
+        '''
+        delay = min(self._delay, self.max_delay)
+        delay -= delay * self.jitter * random.random()
+        if self.deadline is not None:
+            remaining = self._started + self.deadline - time.time()
+            if remaining <= 0:
+                raise PollingTimeout(
+                    'job did not complete within {} seconds'.format(
+                        self.deadline))
+            delay = min(delay, remaining)
+        time.sleep(delay)
+        self._delay = min(self._delay * self.multiplier, self.max_delay)
+
+    def poll(self, fetch, done):
+        '''
+        Calls ``fetch`` to get the status of the job until ``done`` returns
+        ``True`` for the status returned, sleeping between each call.
+
+        Args:
+            fetch (callable): Returns the current status of the job.
+            done (callable):
+                Is passed the status and returns ``True`` if the job is done.
+
+        Returns:
+            :obj:`object`:
+                The last status returned from ``fetch``.
+        '''
+        status = fetch()
+        last = self.progress(status) if self.progress else None
+        while not done(status):
+            self.sleep()
+            status = fetch()
+            if self.progress:
+                current = self.progress(status)
+                if current != last:
+                    self.reset()
+                    last = current
+        return status
 
 class TIOEndpoint(APIEndpoint):
     '''
@@ -107,17 +222,21 @@ class TIOEndpoint(APIEndpoint):
 
         return resp
 
-    def _wait_for_download(self, path, resource, resource_id, file_id, **kw):
+    def _wait_for_download(self, path, resource, resource_id, file_id,
+                           poller=None, deadline=None, **kw):
         '''
         A simple method to centralize waiting for an export to enter a
         completed state.  The initial request will be made and then we will
-        recheck every two and a half seconds after that.  Once the status
-        returns one of the completed states, we will return the status.
+        recheck using the status poller's backoff after that.  Once the status
+        returns one of the completed states, we will return the status.  If a
+        deadline is specified and the export isn't ready in time, then a
+        :obj:`PollingTimeout` will be raised.
         '''
-        status = self._api.get(path, **kw).json()['status']
-        while status not in ['error', 'ready']:
-            time.sleep(2.5)
-            status = self._api.get(path, **kw).json()['status']
+        if not poller:
+            poller = StatusPoller(max_delay=10, deadline=deadline)
+        status = poller.poll(
+            lambda: self._api.get(path, **kw).json()['status'],
+            lambda s: s in ['error', 'ready'])
 
         # If the status that has been reported back is "error", then we will
         # need to throw the appropriate error back to the user.
@@ -130,40 +249,102 @@ class TIOEndpoint(APIEndpoint):
 class TIOIterator(APIResultsIterator):
     '''
     The following methods allows us to iterate through pages and get data
+
+    Attributes:
+        prefetch (int):
+            The number of pages to request in the background while the current
+            page is being worked through.  Once the total number of records is
+            known, up to this many pages will be requested at once.  Records
+            are still returned in order.  The default of ``0`` disables
+            prefetching.
+
+    When prefetching, breaking out of the iteration early leaves the
+    prefetched requests running until the iterator is closed, so the iterator
+    should either be closed or used as a context manager.
+
+    Examples:
+        >>> agents = tio.agents.list()
+        >>> agents.prefetch = 4
+        >>> for agent in agents:
+        ...     pprint(agent)
+
+        >>> with tio.agents.list() as agents:
+        ...     agents.prefetch = 4
+        ...     for agent in agents:
+        ...         if agent['name'] == 'example':
+        ...             break
     '''
     _path = None
     _resource = None
     _size = 100
     _page_num = 0
     _api_version = 1
+    _pool = None
+    _pending = None
+    prefetch = 0
 
-    def _get_data(self):
+    def _next_query(self):
         '''
-        Request the next page of data
+        Construct the query for the next page and advance the offset (or the
+        page number) to the page following it.
         '''
-        # The first thing that we need to do is construct the query with the
-        # current offset and limits
-        query = self._query
+        query = dict(self._query)
 
         if self._api_version == 2:
             query['size'] = self._size
             query['page'] = self._page_num
+            self._page_num += 1
         else:
             query['limit'] = self._limit
             query['offset'] = self._offset
-
-        # Lets make the actual call at this point.
-        resp = self._api.get(self._path, params=query).json()
-
-        if self._api_version == 2:
-            self._page_num += 1
-        else:
             self._offset += self._limit
+        return query
+
+    def _get_data(self):
+        '''
+        Request the next page of data
+        '''
+        # The first thing that we need to do is construct the query with the
+        # current offset and limits, then lets make the actual call.
+        resp = self._api.get(self._path, params=self._next_query()).json()
 
         # Lastly we need to return the data from the response and the data key
         # so that _get_page() knows where the information is stored.
         return resp, self._resource
 
+    def _has_more_pages(self):
+        '''
+        Determine if there are any more pages left to request.
+        '''
+        if (self._pages_total
+          and self._pages_requested + len(self._pending) >= self._pages_total):
+            return False
+        if self._api_version == 2:
+            return (self._page_num - 1) * self._size < self.total
+        return self._offset < self.total
+
+    def _schedule(self):
+        '''
+        Request the pages following the current page in the background.
+        '''
+        if not self._pool:
+            self._pool = ThreadPoolExecutor(max_workers=self.prefetch)
+            self._pending = list()
+        while len(self._pending) < self.prefetch and self._has_more_pages():
+            self._pending.append(self._pool.submit(
+                self._api.get, self._path, params=self._next_query()))
+
+    def _close_pool(self):
+        '''
+        Cancel any outstanding requests and shut down the prefetch pool.
+        '''
+        if self._pool:
+            for future in self._pending:
+                future.cancel()
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self._pending = list()
+
     def _get_page(self):
         '''
         Get the next page of records
@@ -174,8 +355,13 @@ class TIOIterator(APIResultsIterator):
         if self._pages_total and self._pages_requested >= self._pages_total:
             raise StopIteration()
 
-        # Lets make the actual call at this point.
-        resp, key = self._get_data()
+        # Lets make the actual call at this point.  If we are prefetching, then
+        # the page may have already been requested in the background.  The
+        # first page is always requested directly so that we know the total.
+        if self.prefetch > 0 and self._pending:
+            resp, key = self._pending.pop(0).result().json(), self._resource
+        else:
+            resp, key = self._get_data()
 
         # Now that we have the response, lets reset any counters we need to,
         # and increment things like the page counter, offset, etc.
@@ -190,3 +376,18 @@ class TIOIterator(APIResultsIterator):
         else:
             self.page = resp[key]
             self.total = resp['pagination']['total']
+
+        # Now that we know the total, we can request the following pages in
+        # the background while this page is being worked through.
+        if self.prefetch > 0:
+            self._schedule()
+
+    def next(self):
+        '''
+        Ask for the next record
+        '''
+        try:
+            return super(TIOIterator, self).next()
+        except StopIteration:
+            self._close_pool()
+            raise
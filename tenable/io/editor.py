@@ -20,11 +20,82 @@ Methods available on ``io.editor``:
     .. automethod:: template_details
     .. automethod:: template_list
 '''
-from .base import TIOEndpoint
+from concurrent.futures import ThreadPoolExecutor
+from .base import TIOEndpoint, tenant_key
 from tenable.utils import dict_merge, policy_settings
 from io import BytesIO
+import copy
+import time
 
 class EditorAPI(TIOEndpoint):
+    '''
+    This will contain all methods related to the editor
+
+    If the session was created with a ``template_cache_ttl``, then the
+    template listings and template documents are cached within the session,
+    keyed by the template UUID.  Once a cached document is no longer fresh,
+    it's revalidated using the ETag that was returned with it (if any) and only
+    refetched if it has changed.  The plugin listings for the mixed families of
+    a cached template are memoized alongside the document, so that expanding
+    the same template repeatedly only fetches the family listings once.
+
+    Attributes:
+        family_workers (int):
+            The maximum number of mixed plugin family listings that will be
+            requested concurrently when parsing the plugin settings.  The
+            default is ``8``.
+
+    Examples:
+        >>> tio = TenableIO('ACCESS_KEY', 'SECRET_KEY', template_cache_ttl=600)
+        >>> tmpl = tio.editor.template_details('scan', uuid)
+    '''
+    family_workers = 8
+
+    def _fresh(self, fetched):
+        '''
+        Determines if a template fetched at the time specified is still fresh.
+        '''
+        return time.time() - fetched < self._api._template_cache_ttl
+
+    def _template(self, etype, uuid=None):
+        '''
+        Returns the cache entry for the template document (or the template
+        listing if no UUID is specified), fetching or revalidating it as
+        needed.  Anything derived from the document may be stored within the
+        entry, as a new entry is created whenever the document changes.  If
+        the session isn't caching templates, then a new entry is always
+        returned.
+        '''
+        key = (tenant_key(self._api), etype, uuid)
+        if uuid:
+            path = 'editor/{}/templates/{}'.format(etype, uuid)
+        else:
+            path = 'editor/{}/templates'.format(etype)
+
+        caching = self._api._template_cache_ttl is not None
+        entry = self._api._template_cache.get(key) if caching else None
+        if entry and self._fresh(entry['fetched']):
+            return entry
+
+        # If we have a stale copy of the template that came with an ETag, then
+        # we will ask the API to only return the template if it has changed.
+        kwargs = dict()
+        if entry and entry['etag']:
+            kwargs['headers'] = {'If-None-Match': entry['etag']}
+        resp = self._api.get(path, **kwargs)
+        if entry and resp.status_code == 304:
+            entry['fetched'] = time.time()
+            return entry
+
+        entry = {
+            'fetched': time.time(),
+            'etag': resp.headers.get('ETag'),
+            'document': resp.json(),
+        }
+        if caching:
+            self._api._template_cache[key] = entry
+        return entry
+
     def parse_creds(self, data):
         '''
         Walks through the credential data list and returns the configured
@@ -93,12 +164,27 @@ class EditorAPI(TIOEndpoint):
                         })
         return resp
 
-    def parse_plugins(self, etype, families, id, callfmt='editor/{etype}/{id}/families/{fam}'):
+    def _family_plugins(self, path):
+        '''
+        Retrieves the plugin listing for a plugin family and returns it as a
+        dictionary of plugin_id:status.
+        '''
+        plugins = dict()
+        for plugin in self._api.get(path).json()['plugins']:
+            plugins[plugin['id']] = plugin['status']
+        return plugins
+
+    def parse_plugins(self, etype, families, id,
+                      callfmt='editor/{etype}/{id}/families/{fam}',
+                      template=False):
         '''
         Walks through the plugin settings and will return the the configured
-        settings for a given scan/policy
+        settings for a given scan/policy.  If ``template`` is set, then the id
+        is a template UUID and the mixed family listings will be memoized
+        within the template's cache entry.
         '''
         resp = dict()
+        mixed = dict()
 
         for family in families:
             if families[family]['status'] != 'mixed':
@@ -108,20 +194,46 @@ class EditorAPI(TIOEndpoint):
             else:
                 # if the plugin family is set to mixed, we will need to get
                 # the currently enabled status of every plugin within the
-                # mixed families.  To do so, we will need to query the
-                # scan editor for each mixed family, getting the plugin
-                # listing w/ status an interpreting that into a simple
-                # dictionary of plugin_id:status.
-                plugins = dict()
-                plugs = self._api.get(callfmt.format(
-                    etype=etype, id=id, fam=families[family]['id'])).json()['plugins']
-                for plugin in plugs:
-                    plugins[plugin['id']] = plugin['status']
-                resp[family] = {
-                    'mixedDefault': 'enabled',
-                    'status': 'mixed',
-                    'individual': plugins,
-                }
+                # mixed families.  We will hold the place for the family here
+                # and request the listings for all of the mixed families at
+                # once below.
+                resp[family] = None
+                mixed[family] = families[family]['id']
+
+        if not mixed:
+            return resp
+
+        # The family listings for a cached template can be reused for every
+        # expansion of that version of the template, so they're stored within
+        # the cache entry and expire along with it.  Scans and policies can be
+        # changed, so they (and uncached templates) always get a fresh set of
+        # listings.
+        entry = None
+        if template and self._api._template_cache_ttl is not None:
+            entry = self._api._template_cache.get(
+                (tenant_key(self._api), etype, id))
+        memo = entry.setdefault('families', dict()) if entry else dict()
+
+        # Query the scan editor for each mixed family that we don't already
+        # know about, getting the plugin listing w/ status and interpreting
+        # that into a simple dictionary of plugin_id:status.  The listings
+        # are requested concurrently using a bounded pool of workers.
+        fids = [f for f in sorted(set(mixed.values())) if f not in memo]
+        paths = [callfmt.format(etype=etype, id=id, fam=f) for f in fids]
+        workers = min(self.family_workers, len(fids))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                listings = list(pool.map(self._family_plugins, paths))
+        else:
+            listings = [self._family_plugins(p) for p in paths]
+        memo.update(zip(fids, listings))
+
+        for family, fid in mixed.items():
+            resp[family] = {
+                'mixedDefault': 'enabled',
+                'status': 'mixed',
+                'individual': dict(memo[fid]),
+            }
         return resp
 
     def audits(self, etype, object_id, file_id, fobj=None):
@@ -186,11 +298,9 @@ class EditorAPI(TIOEndpoint):
             :obj:`dict`:
                 Details on the requested template
         '''
-        return self._api.get(
-            'editor/{}/templates/{}'.format(
-                self._check('etype', etype, str, choices=['scan', 'policy']),
-                self._check('uuid', uuid, str)
-            )).json()
+        return copy.deepcopy(self._template(
+            self._check('etype', etype, str, choices=['scan', 'policy']),
+            self._check('uuid', uuid, str))['document'])
 
     def obj_details(self, etype, id):
         '''
@@ -228,10 +338,9 @@ class EditorAPI(TIOEndpoint):
             :obj:`list`:
                 Listing of template records.
         '''
-        return self._api.get(
-            'editor/{}/templates'.format(
-                self._check('etype', etype, str, choices=['scan', 'policy'])
-            )).json()['templates']
+        return copy.deepcopy(self._template(
+            self._check('etype', etype, str, choices=['scan', 'policy'])
+        )['document']['templates'])
 
     def plugin_description(self, policy_id, family_id, plugin_id):
         '''
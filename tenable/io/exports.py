@@ -13,18 +13,137 @@ Methods available on ``tio.exports``:
     .. automethod:: assets
     .. automethod:: vulns
     .. automethod:: compliance
+    .. automethod:: multi
+
+.. autoclass:: ExportCheckpoint
+    :members:
+
+.. autoclass:: ExportsIterator
+    :members: spool, cancel
+
+.. autoclass:: MultiExportsIterator
+    :members: route, cancel
 '''
+import gzip
+import itertools
+import json
+import logging
+import os
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from ipaddress import IPv4Network
 from appdirs import unicode
-from tenable.errors import TioExportsError, TioExportsTimeout
-from tenable.io.base import TIOEndpoint, APIResultsIterator, UnexpectedValueError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from tenable.errors import NotFoundError, TioExportsError, TioExportsTimeout
+from tenable.io.base import (
+    TIOEndpoint, APIResultsIterator, UnexpectedValueError, StatusPoller
+)
+from tenable.utils import json_array_iterator
 try:
     from json.decoder import JSONDecodeError
 except ImportError:
     JSONDecodeError = ValueError
 
+def _size_connection_pool(session, workers):
+    '''
+    Grows the session's connection pools so that there is a connection for each
+    of the workers, as the default pool only keeps 10 connections per host.
+    '''
+    for prefix in ['https://', 'http://']:
+        adapter = session.get_adapter(prefix)
+        if (isinstance(adapter, HTTPAdapter)
+          and adapter._pool_maxsize < workers):
+            session.mount(prefix, HTTPAdapter(pool_maxsize=workers,
+                max_retries=adapter.max_retries))
+
+
+class ExportCheckpoint(object):
+    '''
+    A JSON file-backed store recording the export UUID and the chunks that
+    have been completely worked through.  Passing the same checkpoint to a
+    restarted export will re-attach to the export and skip any chunks that
+    were already consumed.  Once the export has been completely consumed the
+    checkpoint file is removed, so that the next run starts a new export.
+
+    Args:
+        path (str): The path to the checkpoint file.
+
+    Attributes:
+        type (str): The type of export that the checkpoint is tracking.
+        uuid (str): The UUID of the export that the checkpoint is tracking.
+        chunks (list): The chunk ids that have been completely consumed.
+
+    Examples:
+        >>> checkpoint = ExportCheckpoint('vulns.checkpoint')
+        >>> for vuln in tio.exports.vulns(checkpoint=checkpoint):
+        ...     pprint(vuln)
+    '''
+    def __init__(self, path):
+        self.path = path
+        self.type = None
+        self.uuid = None
+        self.chunks = list()
+        self.load()
+
+    def load(self):
+        '''
+        Loads the checkpoint state from disk if the checkpoint file exists.
+        '''
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as fobj:
+                data = json.load(fobj)
+            self.type = data.get('type')
+            self.uuid = data.get('uuid')
+            self.chunks = data.get('chunks', list())
+
+    def save(self):
+        '''
+        Writes the checkpoint state to disk.  The state is written to a
+        temporary file first and then moved into place so that an interrupted
+        write never leaves a corrupted checkpoint behind.
+        '''
+        tmp = '{}.tmp'.format(self.path)
+        with open(tmp, 'w') as fobj:
+            json.dump({
+                'type': self.type,
+                'uuid': self.uuid,
+                'chunks': self.chunks
+            }, fobj)
+        os.replace(tmp, self.path)
+
+    def attach(self, export_type, uuid):
+        '''
+        Associates the checkpoint to the export specified.  If the checkpoint
+        was tracking a different export, then the completed chunk list is
+        reset.
+        '''
+        if self.type != export_type or self.uuid != uuid:
+            self.chunks = list()
+        self.type = export_type
+        self.uuid = uuid
+        self.save()
+
+    def complete(self, chunk_id):
+        '''
+        Records the chunk id as having been completely consumed.
+        '''
+        if chunk_id not in self.chunks:
+            self.chunks.append(chunk_id)
+            self.save()
+
+    def clear(self):
+        '''
+        Removes the checkpoint file and resets the checkpoint state.
+        '''
+        self.type = None
+        self.uuid = None
+        self.chunks = list()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
 class ExportsIterator(APIResultsIterator):
     '''
     The exports iterator handles the chunk status and retrieval management
@@ -41,125 +160,317 @@ class ExportsIterator(APIResultsIterator):
         total (int):
             The total number of records that exist for the current request.
     '''
+    _stream_block_size = 65536
+
     def __init__(self, api, **kw):
         self.type = None
         self.uuid = None
         self.chunk_id = None
         self.timeout = None
+        self.workers = 1
         self.chunks = list()
         self.processed = list()
+        self.checkpoint = None
+        self.streaming = False
         self._wait_for_complete = False
+        self._finished = False
+        self._pool = None
+        self._futures = list()
         APIResultsIterator.__init__(self, api, **kw)
 
+        # When streaming, pages are iterators of records decoded from the
+        # response stream instead of lists.
+        if self.streaming:
+            self.page = iter(list())
+
+        if self.workers > 1:
+            _size_connection_pool(self._api._session, self.workers)
+
+        # If a checkpoint was passed, then we will attach it to this export and
+        # seed the processed list with the chunks that were already consumed.
+        if self.checkpoint:
+            self.checkpoint.attach(self.type, self.uuid)
+            self.processed = list(self.checkpoint.chunks)
+
     def _process_page(self, page_data):
         '''
         Processes a page of data
         '''
         self.page = page_data
 
-    def _get_page(self):
+    def _get_status(self):
         '''
-        Get the next chunk
+        Query the API for the status of the export.
         '''
-        def get_status():
-            # Query the API for the status of the export.
-            status = self._api.get('{}/export/{}/status'.format(self.type, self.uuid)).json()
-            log_message = f'EXPORT {self.type} {self.uuid} is status {status.get("status")}'
-            self._log.debug(log_message)
-
-            # We need to get the list of chunks that we haven't completed yet and are
-            # available for download.
-            chunks_available = status['chunks_available'] \
-                if 'chunks_available' in status else list()
-            unfinished = [c for c in chunks_available if c not in self.processed]
-
-            # Add the chunks_unfinished key with the unfinished list as the
-            # associated value and then return the status to the caller.
-            status['chunks_unfinished'] = unfinished
-
-            # if there are no more chunks to process and the export status is
-            # set to finished, then we will break the iteration.
-            if (status['status'] == 'FINISHED'
-              and len(status['chunks_unfinished']) < 1):
-                raise StopIteration()
-
-            if status['status'] != 'FINISHED' and self._wait_for_complete:
-                status['chunks_unfinished'] = list()
-
-            if status['status'] == 'ERROR':
-                raise TioExportsError(self.type, self.uuid)
-
-            if (status['status'] == 'QUEUED' and self.timeout
-              and time.time() > self.timeout):
-                self.cancel()
-                raise TioExportsTimeout(self.type, self.uuid)
-
-            return status
+        # If the export no longer exists, then the checkpoint can't be resumed
+        # from and is cleared so that the next run starts a new export.
+        try:
+            status = self._api.get(
+                '{}/export/{}/status'.format(self.type, self.uuid)).json()
+        except NotFoundError:
+            self._clear_checkpoint()
+            raise
+        log_message = f'EXPORT {self.type} {self.uuid} is status {status.get("status")}'
+        self._log.debug(log_message)
+
+        # We need to get the list of chunks that we haven't completed yet and are
+        # available for download.
+        chunks_available = status['chunks_available'] \
+            if 'chunks_available' in status else list()
+        unfinished = [c for c in chunks_available if c not in self.processed]
+
+        # Add the chunks_unfinished key with the unfinished list as the
+        # associated value and then return the status to the caller.
+        status['chunks_unfinished'] = unfinished
+        self._finished = status['status'] == 'FINISHED'
+
+        # if there are no more chunks to process and the export status is
+        # set to finished, then we will break the iteration.
+        if (status['status'] == 'FINISHED'
+          and len(status['chunks_unfinished']) < 1):
+            raise StopIteration()
+
+        if status['status'] != 'FINISHED' and self._wait_for_complete:
+            status['chunks_unfinished'] = list()
+
+        if status['status'] in ['ERROR', 'CANCELLED']:
+            self._clear_checkpoint()
+            raise TioExportsError(self.type, self.uuid)
+
+        if (status['status'] == 'QUEUED' and self.timeout
+          and time.time() > self.timeout):
+            self.cancel()
+            raise TioExportsTimeout(self.type, self.uuid)
+
+        return status
+
+    def _get_chunks(self):
+        '''
+        Refresh the local chunk queue, waiting for the export to present new
+        chunks if none are currently available.
+        '''
+        # if the export is still processing, but there aren't any chunks for
+        # us to process yet, then we will wait here and poll for the status
+        # until we get something else to work on.  The poller will back off
+        # for as long as the export isn't reporting any progress.
+        poller = StatusPoller(delay=2, max_delay=30, progress=lambda s: (
+            s.get('status'),
+            len(s.get('chunks_available', list())),
+            s.get('finished_chunks'),
+        ))
+        status = poller.poll(self._get_status,
+            lambda s: len(s['chunks_unfinished']) > 0)
+
+        # now that we have some chunks to work on, lets refresh the local
+        # chunk cache and continue.
+        self.chunks = status['chunks_unfinished']
+
+    def _stream_chunk(self, chunk_id):
+        '''
+        Download the chunk specified and yield the records as they are decoded
+        from the response stream.
+        '''
+        # Just like a regular download, a chunk that fails to decode will be
+        # retried up to 3 times.  As some of the records may have already been
+        # returned, the retried download will skip past those records.
+        yielded = 0
+        counter = 0
+        while counter <= 3:
+            resp = self._api.get('{}/export/{}/chunks/{}'.format(
+                self.type, self.uuid, chunk_id), stream=True)
+            try:
+                records = json_array_iterator(
+                    resp.iter_content(chunk_size=self._stream_block_size))
+                for idx, record in enumerate(records):
+                    if idx >= yielded:
+                        yielded += 1
+                        yield record
+                return
+            except (JSONDecodeError, RequestException):
+                log_message = 'Invalid Chunk {} on export {}'.format(
+                               str(chunk_id), str(self.uuid))
+                self._log.warning(log_message)
+                counter += 1
+            finally:
+                resp.close()
 
-        # If there are no chunks in our local queue, then we will need to query
-        # the status API for more chunks to to work on.
-        if len(self.chunks) < 1:
-            status = get_status()
-
-            backoff_counter = 1
-            # if the export is still processing, but there aren't any chunks for
-            # us to process yet, then we will wait here in a loop and call for
-            # status once a second until we get something else to work on.
-            while len(status['chunks_unfinished']) < 1:
-                backoff_counter += 1
-                time.sleep(backoff_counter if backoff_counter < 30 else 30)
-                status = get_status()
-
-            # now that we have some chunks to work on, lets refresh the local
-            # chunk cache and continue.
-            self.chunks = status['chunks_unfinished']
-
-        # now to take the first chunk off the local queue, move it to the
-        # processed list, and then set store the results to the page attribute.
-        self.chunk_id = self.chunks[0]
-        self.chunks.pop(0)
-        self.processed.append(self.chunk_id)
+    def _download_chunk(self, chunk_id):
+        '''
+        Download the chunk specified and return the decoded records.
+        '''
+        # When streaming, we will read the first record so that empty chunks
+        # can be detected, and then return an iterator of the records.
+        if self.streaming:
+            records = self._stream_chunk(chunk_id)
+            first = next(records, None)
+            if first is None:
+                return list()
+            return itertools.chain([first], records)
 
         # We will attempt to download a chunk of data and convert it into JSON.
         # If the conversion fails, then we will increment our own retry counter
         # and attempt to download the chunk again.  After 3 attempts, we will
         # assume that the chunk is dead and simply expire the chunk id.
+        page = list()
         downloaded = False
         counter = 0
         while not downloaded and counter <= 3:
             try:
-                self.page = self._api.get('{}/export/{}/chunks/{}'.format(
-                    self.type, self.uuid, self.chunk_id)).json()
+                page = self._api.get('{}/export/{}/chunks/{}'.format(
+                    self.type, self.uuid, chunk_id)).json()
                 downloaded = True
             except JSONDecodeError:
                 log_message = 'Invalid Chunk {} on export {}'.format(
-                               str(self.chunk_id), str(self.uuid))
+                               str(chunk_id), str(self.uuid))
                 self._log.warning(log_message)
-                self.page = list()
+                page = list()
                 counter += 1
+        return page
 
-        # If the chunk of data is empty, then we will call ourselves to get the
-        # next page of data.  This allows us to properly handle empty chunks of
-        # data.
-        if len(self.page) < 1:
-            log_message = 'Empty Chunk {} on Export {}'.format(
-                           str(self.chunk_id), str(self.uuid))
-            self._log.warning(log_message)
-            self._get_page()
+    def _fill_pool(self):
+        '''
+        Submit chunks from the local queue to the worker pool until there are
+        as many downloads in flight as there are workers.
+        '''
+        if not self._pool:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        while len(self.chunks) > 0 and len(self._futures) < self.workers:
+            chunk_id = self.chunks.pop(0)
+            self.processed.append(chunk_id)
+            self._futures.append(
+                (chunk_id, self._pool.submit(self._download_chunk, chunk_id)))
+
+    def _close_pool(self):
+        '''
+        Cancel any outstanding downloads and shut down the worker pool.
+        '''
+        for _, future in self._futures:
+            future.cancel()
+        self._futures = list()
+        if self._pool:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def _get_concurrent_page(self):
+        '''
+        Get the next chunk from the worker pool, keeping the pool saturated
+        with downloads of the chunks that follow it.
+        '''
+        # If nothing is queued locally, then we will want to find out if there
+        # are any new chunks to work on.  When downloads are still in flight
+        # we only check once without waiting, as we still have work to do.
+        if len(self.chunks) < 1:
+            if len(self._futures) < 1:
+                try:
+                    self._get_chunks()
+                except StopIteration:
+                    self._close_pool()
+                    raise
+            elif not self._finished:
+                try:
+                    self.chunks = self._get_status()['chunks_unfinished']
+                except StopIteration:
+                    pass
+                except Exception:
+                    self._close_pool()
+                    raise
+
+        self._fill_pool()
+
+        # Chunks are returned in the order that they were submitted in, and
+        # once we have taken one off the queue, we will backfill the pool so
+        # that the downloads continue while the page is being worked through.
+        chunk_id, future = self._futures.pop(0)
+        self._fill_pool()
+        try:
+            page = future.result()
+        except Exception:
+            self._close_pool()
+            raise
+        return chunk_id, page
+
+    def _clear_checkpoint(self):
+        '''
+        Removes the checkpoint, if one is attached to the export.
+        '''
+        if self.checkpoint:
+            self.checkpoint.clear()
+
+    def _chunk_completed(self):
+        '''
+        Records the current chunk as consumed within the checkpoint.
+        '''
+        if self.checkpoint and self.chunk_id is not None:
+            self.checkpoint.complete(self.chunk_id)
+
+    def _get_page(self):
+        '''
+        Get the next chunk
+        '''
+        # As we are only asked for the next chunk once the current one has
+        # been worked through, the current chunk can be checkpointed.
+        self._chunk_completed()
+        self.page = list()
+
+        # If the chunk of data is empty, then we will continue on to the next
+        # chunk of data.  This allows us to properly handle empty chunks.
+        while not self.page:
+            try:
+                self._get_next_chunk()
+            except StopIteration:
+                # The export has been completely consumed, so there is nothing
+                # left to resume from.
+                self._clear_checkpoint()
+                raise
+
+            if not self.page:
+                log_message = 'Empty Chunk {} on Export {}'.format(
+                               str(self.chunk_id), str(self.uuid))
+                self._log.warning(log_message)
+                self._chunk_completed()
+
+    def _get_next_chunk(self):
+        '''
+        Retrieve the next chunk, storing the chunk id and page of data.
+        '''
+        if self.workers > 1:
+            self.chunk_id, self.page = self._get_concurrent_page()
+        else:
+            # If there are no chunks in our local queue, then we will need
+            # to query the status API for more chunks to to work on.
+            if len(self.chunks) < 1:
+                self._get_chunks()
+
+            # now to take the first chunk off the local queue, move it to
+            # the processed list, and then store the results to the page
+            # attribute.
+            self.chunk_id = self.chunks.pop(0)
+            self.processed.append(self.chunk_id)
+            self.page = self._download_chunk(self.chunk_id)
 
     def next(self):
         '''
         Ask for the next object
         '''
-        # If we have worked through the current page of records then we should
-        # query the next page of records.
-        if self.page_count >= len(self.page):
-            self._get_page()
-            self.page_count = 0
-
-        # Get the relevant record, increment the counters, and return the
-        # record.
-        item = self.page[self.page_count]
+        if self.streaming:
+            # When streaming, the page is an iterator of records, so we will
+            # request the next page once the iterator has been exhausted.
+            item = next(self.page, None)
+            if item is None:
+                self._get_page()
+                self.page_count = 0
+                item = next(self.page)
+        else:
+            # If we have worked through the current page of records then we
+            # should query the next page of records.
+            if self.page_count >= len(self.page):
+                self._get_page()
+                self.page_count = 0
+
+            # Get the relevant record from the page.
+            item = self.page[self.page_count]
+
+        # increment the counters, and return the record.
         self.count += 1
         self.page_count += 1
         return item
@@ -168,13 +479,334 @@ class ExportsIterator(APIResultsIterator):
         '''
         Cancels the export.
         '''
+        self._close_pool()
+        self._clear_checkpoint()
         self._api.get('{}/export/{}/cancel'.format(self.type, self.uuid)).json()
 
+    def _spool_path(self, directory, chunk_id, compress):
+        '''
+        Returns the file path that the chunk will be spooled to.
+        '''
+        return os.path.join(directory, '{}-{}-{}.json{}'.format(
+            self.type, self.uuid, chunk_id, '.gz' if compress else ''))
+
+    def _spool_chunk(self, chunk_id, directory, compress):
+        '''
+        Writes the raw body of the chunk specified to disk and returns the
+        manifest entry for the chunk file.
+        '''
+        path = self._spool_path(directory, chunk_id, compress)
+        tmp = '{}.tmp'.format(path)
+        opener = gzip.open if compress else open
+
+        # As with downloading a chunk, we will retry a failed download up to 3
+        # times before giving up on the chunk.  The body is written to a
+        # temporary file first so that a partial chunk is never left behind.
+        counter = 0
+        while True:
+            size = 0
+            resp = self._api.get('{}/export/{}/chunks/{}'.format(
+                self.type, self.uuid, chunk_id), stream=True)
+            try:
+                with opener(tmp, 'wb') as fobj:
+                    for block in resp.iter_content(
+                      chunk_size=self._stream_block_size):
+                        fobj.write(block)
+                        size += len(block)
+            except RequestException:
+                counter += 1
+                log_message = 'Invalid Chunk {} on export {}'.format(
+                               str(chunk_id), str(self.uuid))
+                self._log.warning(log_message)
+                if counter > 3:
+                    raise
+            else:
+                break
+            finally:
+                resp.close()
+
+        os.replace(tmp, path)
+        return {'chunk_id': chunk_id, 'path': path, 'size': size}
+
+    def spool(self, directory, compress=False):
+        '''
+        Writes the raw chunk bodies of the export into the directory specified
+        without decoding them, and returns a manifest of the chunk files.  The
+        chunk discovery and status polling are the same as when iterating over
+        the export.  If more than one worker was specified, then the chunks
+        will be downloaded concurrently.
+
+        Args:
+            directory (str):
+                The directory to write the chunk files into.  The directory
+                will be created if it doesn't already exist.
+            compress (bool, optional):
+                Should the chunk files be gzip-compressed?  If left unspecified,
+                the default is ``False``.
+
+        Returns:
+            :obj:`list`:
+                The manifest of chunk files.  Each entry is a dictionary with
+                the ``chunk_id``, the ``path`` to the file, and the ``size`` of
+                the raw (uncompressed) chunk body in bytes.
+
+        Examples:
+            >>> manifest = tio.exports.vulns(workers=4).spool('/data/vulns',
+            ...     compress=True)
+            >>> for chunk in manifest:
+            ...     print(chunk['path'])
+        '''
+        os.makedirs(directory, exist_ok=True)
+        manifest = list()
+
+        # If we are resuming from a checkpoint, then any chunk files that were
+        # already written will be added to the manifest.
+        for chunk_id in self.processed:
+            path = self._spool_path(directory, chunk_id, compress)
+            if os.path.exists(path):
+                manifest.append({
+                    'chunk_id': chunk_id,
+                    'path': path,
+                    'size': None
+                })
+
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            while True:
+                try:
+                    if len(self.chunks) < 1:
+                        self._get_chunks()
+                except StopIteration:
+                    break
+
+                # Spool all of the chunks that are currently available, then
+                # head back to the status API for more.
+                chunk_ids = self.chunks
+                self.chunks = list()
+                self.processed.extend(chunk_ids)
+                entries = pool.map(
+                    lambda c: self._spool_chunk(c, directory, compress),
+                    chunk_ids)
+                for entry in entries:
+                    manifest.append(entry)
+                    if self.checkpoint:
+                        self.checkpoint.complete(entry['chunk_id'])
+        finally:
+            pool.shutdown()
+
+        if self.checkpoint:
+            self.checkpoint.clear()
+        return manifest
+
+
+class MultiExportsIterator(object):
+    '''
+    The multi-exports iterator works through several exports at the same time.
+    The status of every export that needs more chunks is polled within a
+    single loop and the chunk downloads are interleaved across the exports
+    using a shared pool of workers.  Each record is returned as a tuple of the
+    export type and the record.
+
+    Args:
+        iterators (list[ExportsIterator]):
+            The export iterators to work through.
+        workers (int, optional):
+            The number of chunks to download concurrently across all of the
+            exports.  The default is ``4``.
+
+    Attributes:
+        counts (dict): The number of records returned for each export type.
+    '''
+    def __init__(self, iterators, workers=4):
+        self.iterators = iterators
+        self.workers = workers
+        self.counts = dict([(i.type, 0) for i in iterators])
+        self._log = logging.getLogger('{}.{}'.format(
+            self.__module__, self.__class__.__name__))
+        self._active = list(iterators)
+        self._pool = None
+        self._futures = list()
+        self._records = iter(list())
+        self._current = None
+        self._poller = StatusPoller(delay=2, max_delay=30)
+        if self.workers > 1 and iterators:
+            _size_connection_pool(iterators[0]._api._session, self.workers)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    def _refresh(self):
+        '''
+        Queries the status of each active export that doesn't have any chunks
+        queued locally, and removes the exports that have been completed.
+        '''
+        for export in list(self._active):
+            if len(export.chunks) < 1:
+                try:
+                    export.chunks = export._get_status()['chunks_unfinished']
+                except StopIteration:
+                    self._active.remove(export)
+
+    def _fill_pool(self):
+        '''
+        Submits the queued chunks to the worker pool, taking one chunk from
+        each export in turn so that the downloads are interleaved.
+        '''
+        if not self._pool:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        submitted = True
+        while submitted and len(self._futures) < self.workers:
+            submitted = False
+            for export in self.iterators:
+                if len(export.chunks) > 0 and len(self._futures) < self.workers:
+                    chunk_id = export.chunks.pop(0)
+                    export.processed.append(chunk_id)
+                    self._futures.append((export, chunk_id,
+                        self._pool.submit(export._download_chunk, chunk_id)))
+                    submitted = True
+
+    def _close_pool(self):
+        '''
+        Cancel any outstanding downloads and shut down the worker pool.
+        '''
+        for _, _, future in self._futures:
+            future.cancel()
+        self._futures = list()
+        if self._pool:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def _chunk_completed(self):
+        '''
+        Records the chunk that was just worked through within the checkpoint
+        of the export it belongs to.
+        '''
+        if self._current:
+            export, chunk_id = self._current
+            export.chunk_id = chunk_id
+            export._chunk_completed()
+            self._current = None
+
+    def _get_chunk(self):
+        '''
+        Waits for the next chunk of data from any of the exports.
+        '''
+        self._chunk_completed()
+        while True:
+            # Only go back to the status APIs when the pool is running short
+            # of work to do.
+            queued = sum([len(e.chunks) for e in self._active])
+            if queued + len(self._futures) < self.workers:
+                self._refresh()
+            self._fill_pool()
+
+            if len(self._futures) > 0:
+                self._poller.reset()
+                export, chunk_id, future = self._futures.pop(0)
+                self._fill_pool()
+                try:
+                    page = future.result()
+                except Exception:
+                    self._close_pool()
+                    raise
+                if not page:
+                    self._log.warning('Empty Chunk {} on Export {}'.format(
+                        str(chunk_id), str(export.uuid)))
+                    export.chunk_id = chunk_id
+                    export._chunk_completed()
+                    continue
+                self._current = (export, chunk_id)
+                return export, page
+
+            # If all of the exports have been completed, then we are done.
+            # Otherwise none of the exports have any chunks ready for us yet
+            # and we will wait before asking again.
+            if len(self._active) < 1:
+                self._close_pool()
+                for export in self.iterators:
+                    if export.checkpoint:
+                        export.checkpoint.clear()
+                raise StopIteration()
+            self._poller.sleep()
+
+    def next(self):
+        '''
+        Ask for the next record
+        '''
+        item = next(self._records, None)
+        while item is None:
+            export, page = self._get_chunk()
+            self._records = zip(itertools.repeat(export.type), page)
+            item = next(self._records, None)
+        self.counts[item[0]] += 1
+        return item
+
+    def route(self, sinks):
+        '''
+        Works through all of the exports, passing each record to the sink for
+        the type of export that the record came from.
+
+        Args:
+            sinks (dict):
+                A dictionary of export types and the callable that each record
+                of that type should be passed to.
+
+        Returns:
+            :obj:`dict`:
+                The number of records that were routed for each export type.
+
+        Examples:
+            >>> multi = tio.exports.multi(vulns={}, assets={})
+            >>> multi.route({
+            ...     'vulns': vuln_writer.write,
+            ...     'assets': asset_writer.write,
+            ... })
+        '''
+        for export_type, record in self:
+            sinks[export_type](record)
+        return self.counts
+
+    def cancel(self):
+        '''
+        Cancels all of the exports.
+        '''
+        self._close_pool()
+        for export in self._active:
+            export.cancel()
+        self._active = list()
+
 
 class ExportsAPI(TIOEndpoint):
     '''
     This class contains all methods related to exports
     '''
+    def _checkpoint(self, export_type, checkpoint):
+        '''
+        Validates the checkpoint passed and returns the checkpoint object.  If
+        the checkpoint is tracking a different type of export, or an export
+        that has errored, been cancelled, or has expired, then it will be
+        reset so that a new export is requested.
+        '''
+        if isinstance(checkpoint, str):
+            checkpoint = ExportCheckpoint(checkpoint)
+        self._check('checkpoint', checkpoint, ExportCheckpoint)
+        if checkpoint and checkpoint.type not in [None, export_type]:
+            checkpoint.clear()
+        if checkpoint and checkpoint.uuid:
+            try:
+                status = self._api.get('{}/export/{}/status'.format(
+                    export_type, checkpoint.uuid)).json().get('status')
+            except NotFoundError:
+                status = None
+            if status in [None, 'ERROR', 'CANCELLED']:
+                self._api._log.debug('Discarding checkpoint for {} export {}'
+                    .format(export_type, checkpoint.uuid))
+                checkpoint.clear()
+        return checkpoint
+
     def vulns(self, **kw):
         '''
         Initiate an vulnerability export.
@@ -216,6 +848,18 @@ class ExportsAPI(TIOEndpoint):
                 List of tag key-value pairs that must be associated to the
                 vulnerability data to be returned.  Key-value pairs are tuples
                 ``('key', 'value')`` and are case-sensitive.
+            checkpoint (str or ExportCheckpoint, optional):
+                A checkpoint file path or :obj:`ExportCheckpoint` object used to
+                record the export UUID and the chunks that have been consumed.
+                If the checkpoint is tracking an export that wasn't finished,
+                then the iterator will re-attach to that export and skip the
+                chunks that were already consumed.
+            streaming (bool, optional):
+                Decode the records from each chunk as the chunk is being
+                downloaded instead of loading the whole chunk into memory
+                first.  This keeps the memory footprint down to a single record
+                instead of a whole chunk.  If left unspecified, the default is
+                ``False``.
             timeout (int, optional):
                 Number of seconds to wait before timing out the export.  If left
                 unspecified the iterator will wait indefinitely for the export to
@@ -245,6 +889,12 @@ class ExportsAPI(TIOEndpoint):
                 Wait to start working through the data until the export has finished
                 processing.  If left unspecified the default behavior is to download
                 chunks as they are available.
+            workers (int, optional):
+                The number of chunks to download concurrently.  If more than one
+                worker is specified, the chunks following the one currently being
+                worked through will be downloaded in the background.  Records are
+                still returned in chunk order.  If left unspecified, the default
+                is ``1``, which downloads a single chunk at a time.
 
         Returns:
             :obj:`ExportIterator`:
@@ -261,8 +911,18 @@ class ExportsAPI(TIOEndpoint):
 
             >>> for vuln in tio.exports.vulns(severity=['critical']):
             ...     pprint(vuln)
+
+            Export the vulnerability data, downloading 4 chunks at a time:
+
+            >>> for vuln in tio.exports.vulns(workers=4):
+            ...     pprint(vuln)
+
+            Write the raw chunks to disk instead of decoding them:
+
+            >>> manifest = tio.exports.vulns().spool('/tmp/vulns', compress=True)
         '''
-        uuid = kw.get('uuid')
+        checkpoint = self._checkpoint('vulns', kw.get('checkpoint'))
+        uuid = kw.get('uuid', checkpoint.uuid if checkpoint else None)
         payload = {'filters': dict()}
 
         # Instead of a long and drawn-out series of if statements for all of
@@ -351,7 +1011,10 @@ class ExportsAPI(TIOEndpoint):
             type='vulns',
             uuid=uuid,
             timeout=self._check('timeout', kw.get('timeout'), int),
-            _wait_for_cmplete=self._check('when_done', kw.get('when_done'), bool, default=False)
+            workers=self._check('workers', kw.get('workers'), int, default=1),
+            checkpoint=checkpoint,
+            streaming=self._check('streaming', kw.get('streaming'), bool, default=False),
+            _wait_for_complete=self._check('when_done', kw.get('when_done'), bool, default=False)
         )
 
     def assets(self, **kw):
@@ -410,6 +1073,18 @@ class ExportsAPI(TIOEndpoint):
                 List of tag key-value pairs that must be associated to the
                 asset data to be returned.  Key-value pairs are tuples
                 ``('key', 'value')`` and are case-sensitive.
+            checkpoint (str or ExportCheckpoint, optional):
+                A checkpoint file path or :obj:`ExportCheckpoint` object used to
+                record the export UUID and the chunks that have been consumed.
+                If the checkpoint is tracking an export that wasn't finished,
+                then the iterator will re-attach to that export and skip the
+                chunks that were already consumed.
+            streaming (bool, optional):
+                Decode the records from each chunk as the chunk is being
+                downloaded instead of loading the whole chunk into memory
+                first.  This keeps the memory footprint down to a single record
+                instead of a whole chunk.  If left unspecified, the default is
+                ``False``.
             timeout (int, optional):
                 Number of seconds to wait before timing out the export.  If left
                 unspecified the iterator will wait indefinitely for the export to
@@ -422,6 +1097,12 @@ class ExportsAPI(TIOEndpoint):
                 Wait to start working through the data until the export has finished
                 processing.  If left unspecified the default behavior is to download
                 chunks as they are available.
+            workers (int, optional):
+                The number of chunks to download concurrently.  If more than one
+                worker is specified, the chunks following the one currently being
+                worked through will be downloaded in the background.  Records are
+                still returned in chunk order.  If left unspecified, the default
+                is ``1``, which downloads a single chunk at a time.
 
         Returns:
             :obj:`ExportIterator`:
@@ -440,8 +1121,13 @@ class ExportsAPI(TIOEndpoint):
             >>> last_week = int(time.time()) - 604800
             >>> for asset in tio.exports.assets(updated_at=last_week):
             ...     pprint(asset)
+
+            Write the raw chunks to disk instead of decoding them:
+
+            >>> manifest = tio.exports.assets().spool('/tmp/assets')
         '''
-        uuid = kw.get('uuid')
+        checkpoint = self._checkpoint('assets', kw.get('checkpoint'))
+        uuid = kw.get('uuid', checkpoint.uuid if checkpoint else None)
         payload = {'filters': dict()}
         payload['chunk_size'] = self._check('chunk_size',
             kw['chunk_size'] if 'chunk_size' in kw else None,
@@ -496,7 +1182,10 @@ class ExportsAPI(TIOEndpoint):
             type='assets',
             uuid=uuid,
             timeout=self._check('timeout', kw.get('timeout'), int),
-            _wait_for_cmplete=self._check('when_done', kw.get('when_done'), bool, default=False)
+            workers=self._check('workers', kw.get('workers'), int, default=1),
+            checkpoint=checkpoint,
+            streaming=self._check('streaming', kw.get('streaming'), bool, default=False),
+            _wait_for_complete=self._check('when_done', kw.get('when_done'), bool, default=False)
         )
 
     def compliance(self, **kw):
@@ -521,6 +1210,18 @@ class ExportsAPI(TIOEndpoint):
 
                 Note: The first_seen filter cannot be used by itself.
                 You must use last_seen and first_seen together or only last_seen.
+            checkpoint (str or ExportCheckpoint, optional):
+                A checkpoint file path or :obj:`ExportCheckpoint` object used to
+                record the export UUID and the chunks that have been consumed.
+                If the checkpoint is tracking an export that wasn't finished,
+                then the iterator will re-attach to that export and skip the
+                chunks that were already consumed.
+            streaming (bool, optional):
+                Decode the records from each chunk as the chunk is being
+                downloaded instead of loading the whole chunk into memory
+                first.  This keeps the memory footprint down to a single record
+                instead of a whole chunk.  If left unspecified, the default is
+                ``False``.
             timeout (int, optional):
                 Number of seconds to wait before timing out the export.  If left
                 unspecified the iterator will wait indefinitely for the export to
@@ -533,6 +1234,12 @@ class ExportsAPI(TIOEndpoint):
                 Wait to start working through the data until the export has finished
                 processing.  If left unspecified the default behavior is to download
                 chunks as they are available.
+            workers (int, optional):
+                The number of chunks to download concurrently.  If more than one
+                worker is specified, the chunks following the one currently being
+                worked through will be downloaded in the background.  Records are
+                still returned in chunk order.  If left unspecified, the default
+                is ``1``, which downloads a single chunk at a time.
 
         Returns:
             :obj:`ExportIterator`:
@@ -555,7 +1262,8 @@ class ExportsAPI(TIOEndpoint):
         '''
         # initialize payload
         payload=dict()
-        uuid = kw.get('uuid')
+        checkpoint = self._checkpoint('compliance', kw.get('checkpoint'))
+        uuid = kw.get('uuid', checkpoint.uuid if checkpoint else None)
 
         # set the number of compliance findings per exported chunk
         if 'num_findings' in kw and self._check('num_findings', kw['num_findings'], int,
@@ -566,8 +1274,8 @@ class ExportsAPI(TIOEndpoint):
         # the count of asset UUIDs can be maximum of 200 UUID values.
         if 'asset' in kw and self._check('asset', kw['asset'], list):
             if len(kw['asset']) <= 200:
-                payload['asset'] = [
-                    self._check('asset_value', asset, 'uuid') for asset in kw['asset']]
+                payload['asset'] = self._check_list(
+                    'asset_value', kw['asset'], 'uuid')
             else:
                 raise UnexpectedValueError("The list can contain a maximum of 200 asset UUIDs")
 
@@ -590,5 +1298,60 @@ class ExportsAPI(TIOEndpoint):
             type='compliance',
             uuid=uuid,
             timeout=self._check('timeout', kw.get('timeout'), int),
-            _wait_for_cmplete=self._check('when_done', kw.get('when_done'), bool, default=False)
+            workers=self._check('workers', kw.get('workers'), int, default=1),
+            checkpoint=checkpoint,
+            streaming=self._check('streaming', kw.get('streaming'), bool, default=False),
+            _wait_for_complete=self._check('when_done', kw.get('when_done'), bool, default=False)
         )
+
+    def multi(self, workers=4, **exports):
+        '''
+        Initiate several exports and work through them at the same time.  The
+        status of all of the exports is polled in a single loop and the chunks
+        are downloaded concurrently, interleaving the downloads across the
+        exports.
+
+        Args:
+            assets (dict, optional):
+                The keyword arguments for the asset export.  Refer to
+                :obj:`ExportsAPI.assets` for the supported arguments.
+            compliance (dict, optional):
+                The keyword arguments for the compliance export.  Refer to
+                :obj:`ExportsAPI.compliance` for the supported arguments.
+            vulns (dict, optional):
+                The keyword arguments for the vulnerability export.  Refer to
+                :obj:`ExportsAPI.vulns` for the supported arguments.
+            workers (int, optional):
+                The number of chunks to download concurrently across all of the
+                exports.  If left unspecified, the default is ``4``.
+
+        Returns:
+            :obj:`MultiExportsIterator`:
+                An iterator returning tuples of the export type and the record.
+
+        Examples:
+            Export the vulnerability and the asset data together:
+
+            >>> for export_type, record in tio.exports.multi(
+            ...   vulns={'severity': ['critical']}, assets={}):
+            ...     print(export_type, record)
+
+            Route the records for each export type to their own sinks:
+
+            >>> tio.exports.multi(vulns={}, assets={}).route({
+            ...     'vulns': vuln_writer.write,
+            ...     'assets': asset_writer.write,
+            ... })
+        '''
+        self._check('workers', workers, int)
+        self._check('exports', list(exports.keys()), list,
+            choices=['vulns', 'assets', 'compliance'])
+        if len(exports) < 1:
+            raise UnexpectedValueError('No exports were specified')
+
+        iterators = list()
+        for export_type in ['vulns', 'assets', 'compliance']:
+            if export_type in exports:
+                kw = self._check(export_type, exports[export_type], dict)
+                iterators.append(getattr(self, export_type)(**kw))
+        return MultiExportsIterator(iterators, workers=workers)
@@ -16,13 +16,56 @@ Methods available on ``tio.filters``:
     .. automethod:: workbench_asset_filters
     .. automethod:: workbench_vuln_filters
 '''
-from tenable.io.base import TIOEndpoint
+from tenable.io.base import TIOEndpoint, tenant_key
+import copy
+import json
+import os
+import time
 
 class FiltersAPI(TIOEndpoint):
     '''
     This will contain all methods related to filters
+
+    The filter definitions are cached (for all sessions within the process)
+    along with the normalized form of the filters, so that repeated calls
+    don't need to refetch or re-normalize them.  Each method returns a copy of
+    the cached filters, so the caller is free to modify them.  The cache is
+    configured on the class itself.
+
+    Attributes:
+        cache_ttl (int):
+            The number of seconds that the cached filter definitions are
+            considered fresh for.  If set to None, then the cached definitions
+            never expire.  The default is ``3600`` seconds.
+        cache_dir (str):
+            An optional directory to persist the filter definitions within.
+            Processes sharing the directory (such as short-lived workers) will
+            load the definitions from disk instead of fetching them again, as
+            long as they are still fresh.
+
+    Examples:
+        >>> from tenable.io.filters import FiltersAPI
+        >>> FiltersAPI.cache_ttl = 600
+        >>> FiltersAPI.cache_dir = '/path/to/cache'
     '''
     _cache = dict()
+    cache_ttl = 3600
+    cache_dir = None
+
+    # The API path and the response field of each of the cached filter sets.
+    _filtersets = {
+        'access_group_asset_filters': ('access-groups/rules/filters', 'rules'),
+        'access_groups': ('access-groups/filters', 'filters'),
+        'access_groups_v2': ('v2/access-groups/filters', 'filters'),
+        'access_group_asset_filters_v2': (
+            'v2/access-groups/rules/filters', 'rules'),
+        'agents': ('filters/scans/agents', 'filters'),
+        'vulns': ('filters/workbenches/vulnerabilities', 'filters'),
+        'asset': ('filters/workbenches/assets', 'filters'),
+        'scan': ('filters/scans/reports', 'filters'),
+        'credentials': ('filters/credentials', 'filters'),
+        'tags': ('tags/assets/filters', 'filters'),
+    }
 
     def _normalize(self, filterset):
         '''
@@ -52,17 +95,88 @@ class FiltersAPI(TIOEndpoint):
             filters[item['name']] = datablock
         return filters
 
+    def _fresh(self, fetched):
+        '''
+        Determines if filter definitions fetched at the time specified are
+        still fresh.
+        '''
+        return self.cache_ttl is None or time.time() - fetched < self.cache_ttl
+
+    def _cache_path(self, name):
+        '''
+        Returns the path of the on-disk cache file for the filters.
+        '''
+        return os.path.join(self.cache_dir, 'filters_{}_{}.json'.format(
+            tenant_key(self._api), name))
+
+    def _load_filters(self, name):
+        '''
+        Loads the filter definitions from the on-disk cache, returning None if
+        they don't exist, can't be read, or are no longer fresh.
+        '''
+        try:
+            with open(self._cache_path(name)) as fobj:
+                data = json.load(fobj)
+        except (IOError, OSError, ValueError):
+            return None
+        if self._fresh(data.get('fetched', 0)):
+            return data
+
+    def _save_filters(self, name, data):
+        '''
+        Writes the filter definitions to the on-disk cache.  The cache file is
+        written to a temporary file first and then moved into place so that
+        other processes never read a partially written file.
+        '''
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        path = self._cache_path(name)
+        tmp = '{}.{}.tmp'.format(path, os.getpid())
+        with open(tmp, 'w') as fobj:
+            json.dump(data, fobj)
+        os.replace(tmp, path)
+
     def _use_cache(self, name, path, field_name='filters', normalize=True):
         '''
         Leverages the filter cache and will return the results as expected.
+        Both the raw and the normalized filters are cached, so the filters are
+        only normalized once each time that they are fetched.  The returned
+        filters are shared with the cache and should not be modified.
         '''
-        if name not in self._cache:
-            self._cache[name] = self._api.get(path).json()[field_name]
+        key = (tenant_key(self._api), name)
+        cached = self._cache.get(key)
+        if not cached or not self._fresh(cached['fetched']):
+            data = self._load_filters(name) if self.cache_dir else None
+            if not data:
+                data = {
+                    'fetched': time.time(),
+                    'filters': self._api.get(path).json()[field_name]
+                }
+                if self.cache_dir:
+                    self._save_filters(name, data)
+            cached = {
+                'fetched': data['fetched'],
+                'filters': data['filters'],
+                'normalized': None
+            }
+            self._cache[key] = cached
 
         if normalize:
-            return self._normalize(self._cache[name])
+            if cached['normalized'] is None:
+                cached['normalized'] = self._normalize(cached['filters'])
+            return cached['normalized']
+
+        return cached['filters']
 
-        return self._cache[name]
+    def _filterset(self, name, normalize=True):
+        '''
+        Returns the cached filter set specified.  The filters are shared with
+        the cache, and are only meant to be handed to ``_parse_filters``, which
+        doesn't modify them.
+        '''
+        path, field_name = self._filtersets[name]
+        return self._use_cache(name, path,
+            field_name=field_name, normalize=normalize)
 
     def access_group_asset_rules_filters(self, normalize=True):
         '''
@@ -77,9 +191,8 @@ class FiltersAPI(TIOEndpoint):
         Examples:
             >>> filters = tio.filters.access_group_rules_filters()
         '''
-        return self._use_cache('access_group_asset_filters',
-            'access-groups/rules/filters',
-            field_name='rules', normalize=normalize)
+        return copy.deepcopy(
+            self._filterset('access_group_asset_filters', normalize))
 
     def access_group_filters(self, normalize=True):
         '''
@@ -94,8 +207,7 @@ class FiltersAPI(TIOEndpoint):
         Examples:
             >>> filters = tio.filters.access_group_filters()
         '''
-        return self._use_cache('access_groups',
-            'access-groups/filters', normalize=normalize)
+        return copy.deepcopy(self._filterset('access_groups', normalize))
 
     def access_group_filters_v2(self, normalize=True):
         '''
@@ -110,8 +222,7 @@ class FiltersAPI(TIOEndpoint):
         Examples:
             >>> filters = tio.filters.access_group_filters_v2()
         '''
-        return self._use_cache('access_groups_v2',
-            'v2/access-groups/filters', normalize=normalize)
+        return copy.deepcopy(self._filterset('access_groups_v2', normalize))
 
     def access_group_asset_rules_filters_v2(self, normalize=True):
         '''
@@ -127,9 +238,8 @@ class FiltersAPI(TIOEndpoint):
         Examples:
             >>> filters = tio.filters.access_group_rules_filters_v2()
         '''
-        return self._use_cache('access_group_asset_filters_v2',
-            'v2/access-groups/rules/filters',
-            field_name='rules', normalize=normalize)
+        return copy.deepcopy(
+            self._filterset('access_group_asset_filters_v2', normalize))
 
     def agents_filters(self, normalize=True):
         '''
@@ -144,8 +254,7 @@ class FiltersAPI(TIOEndpoint):
         Examples:
             >>> filters = tio.filters.agents_filters()
         '''
-        return self._use_cache('agents', 'filters/scans/agents',
-                               normalize=normalize)
+        return copy.deepcopy(self._filterset('agents', normalize))
 
     def workbench_vuln_filters(self, normalize=True):
         '''
@@ -160,8 +269,7 @@ class FiltersAPI(TIOEndpoint):
         Examples:
             >>> filters = tio.filters.workbench_vuln_filters()
         '''
-        return self._use_cache('vulns',
-            'filters/workbenches/vulnerabilities', normalize=normalize)
+        return copy.deepcopy(self._filterset('vulns', normalize))
 
     def workbench_asset_filters(self, normalize=True):
         '''
@@ -176,8 +284,7 @@ class FiltersAPI(TIOEndpoint):
         Examples:
             >>> filters = tio.filters.workbench_asset_filters()
         '''
-        return self._use_cache('asset', 'filters/workbenches/assets',
-                               normalize=normalize)
+        return copy.deepcopy(self._filterset('asset', normalize))
 
     def scan_filters(self, normalize=True):
         '''
@@ -190,8 +297,7 @@ class FiltersAPI(TIOEndpoint):
         Examples:
             >>> filters = tio.filters.scan_filters()
         '''
-        return self._use_cache('scan', 'filters/scans/reports',
-                               normalize=normalize)
+        return copy.deepcopy(self._filterset('scan', normalize))
 
     def credentials_filters(self, normalize=True):
         '''
@@ -206,8 +312,7 @@ class FiltersAPI(TIOEndpoint):
         Examples:
             >>> filters = tio.filters.scan_filters()
         '''
-        return self._use_cache('scan', 'filters/credentials',
-                               normalize=normalize)
+        return copy.deepcopy(self._filterset('credentials', normalize))
 
     def networks_filters(self):
         '''
@@ -239,4 +344,4 @@ class FiltersAPI(TIOEndpoint):
         Examples:
             >>> tio.tags.asset_tag_filters()
         '''
-        return self._use_cache('tags', 'tags/assets/filters')
+        return copy.deepcopy(self._filterset('tags'))
@@ -10,13 +10,22 @@ Methods available on ``tio.plugins``:
 .. rst-class:: hide-signature
 .. autoclass:: PluginsAPI
 
+    .. automethod:: catalog
     .. automethod:: families
     .. automethod:: family_details
     .. automethod:: list
     .. automethod:: plugin_details
+
+.. autoclass:: PluginCatalog
+    :members:
 '''
-from datetime import date
-from tenable.io.base import TIOEndpoint, TIOIterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from tenable.io.base import TIOEndpoint, TIOIterator, tenant_key
+import json
+import os
+import sqlite3
 
 
 class PluginIterator(TIOIterator):
@@ -40,9 +49,28 @@ class PluginIterator(TIOIterator):
         populate_maptable (bool):
             Informs the iterator whether to construct the plugin to family maps
             for injecting the plugin family data into each item.
+        family_cache (str):
+            The directory to store the plugin to family maps within.  If set,
+            the maps are saved to disk (keyed by the Tenable.io tenant) along
+            with the plugin feed that they were built from.  As long as the
+            plugin feed hasn't changed, later runs will load the maps from
+            disk instead of rebuilding them.  If the feed has changed, then
+            only the families whose plugin counts have changed are refreshed.
+        family_workers (int):
+            The number of plugin families to retrieve concurrently when
+            building the plugin to family maps.  The default is ``8``.
+
+    Examples:
+        >>> plugins = tio.plugins.list()
+        >>> plugins.populate_maptable = True
+        >>> plugins.family_cache = '/path/to/cache'
+        >>> for plugin in plugins:
+        ...     pprint(plugin)
     '''
     _maptable = None
     populate_maptable = False
+    family_cache = None
+    family_workers = 8
 
     def _populate_family_cache(self):
         '''
@@ -53,22 +81,99 @@ class PluginIterator(TIOIterator):
         by the plugin membership.  This information is currently lacking in the
         plugin listing output and was requested by a customer.
 
-        .. note::
-            This currently seems to add about 7-10 seconds before the first item
-            is returned, as it seems to take this long to generate the data. We
-            can focus on reducing this time later on with the introduction of
-            multi-threaded iterators && async API calls.
+        The plugin membership of each family is retrieved concurrently (refer
+        to ``family_workers``).  If ``family_cache`` is set, then the
+        membership is also saved to and loaded from disk.
+        '''
+        cache = self._load_family_cache() if self.family_cache else None
+        plugin_set = None
+        if cache is not None:
+            plugin_set = self._api.server.properties().get('plugin_set')
+            if plugin_set and cache.get('plugin_set') == plugin_set:
+                self._build_maptable(cache['families'])
+                return
+
+        # Either there wasn't anything cached or the plugin feed has changed
+        # since the cache was built, so we will have to get the family listing
+        # and retrieve the membership of any families that are new or whose
+        # plugin counts have changed.
+        cached = cache['families'] if cache else dict()
+        families = dict()
+        stale = list()
+        for family in self._api.plugins.families():
+            fid = str(family['id'])
+            families[fid] = {
+                'name': family['name'],
+                'count': family.get('count'),
+                'plugins': None,
+            }
+            if (fid in cached
+              and cached[fid].get('count') == family.get('count')):
+                families[fid]['plugins'] = cached[fid]['plugins']
+            else:
+                stale.append(fid)
+
+        with ThreadPoolExecutor(max_workers=self.family_workers) as pool:
+            details = pool.map(
+                lambda fid: self._api.plugins.family_details(int(fid)), stale)
+            for fid, detail in zip(stale, details):
+                families[fid]['plugins'] = [
+                    p['id'] for p in detail.get('plugins', list())]
+
+        self._build_maptable(families)
+
+        if self.family_cache:
+            if plugin_set is None:
+                plugin_set = self._api.server.properties().get('plugin_set')
+            self._save_family_cache({
+                'plugin_set': plugin_set,
+                'families': families
+            })
+
+    def _build_maptable(self, families):
+        '''
+        Builds the maptable from the family membership.
         '''
         self._maptable = {
             'plugins': dict(),
             'families': dict()
         }
-        for family in self._api.plugins.families():
-            self._maptable['families'][family['id']] = family['name']
+        for fid, family in families.items():
+            self._maptable['families'][int(fid)] = family['name']
+            for plugin_id in family['plugins']:
+                self._maptable['plugins'][plugin_id] = int(fid)
+
+    def _family_cache_path(self):
+        '''
+        Returns the path to the family cache file for the tenant.
+        '''
+        return os.path.join(self.family_cache,
+            'plugin_families_{}.json'.format(tenant_key(self._api)))
+
+    def _load_family_cache(self):
+        '''
+        Loads the family cache from disk, returning None if it doesn't exist
+        or can't be read.
+        '''
+        try:
+            with open(self._family_cache_path()) as fobj:
+                return json.load(fobj)
+        except (IOError, OSError, ValueError):
+            return None
 
-        for fam_id in self._maptable['families'].keys():
-            for plugin in self._api.plugins.family_details(fam_id)['plugins']:
-                self._maptable['plugins'][plugin['id']] = fam_id
+    def _save_family_cache(self, data):
+        '''
+        Writes the family cache to disk.  The cache is written to a temporary
+        file first and then moved into place so that an interrupted write never
+        leaves a corrupted cache behind.
+        '''
+        path = self._family_cache_path()
+        if not os.path.isdir(self.family_cache):
+            os.makedirs(self.family_cache)
+        tmp = '{}.tmp'.format(path)
+        with open(tmp, 'w') as fobj:
+            json.dump(data, fobj)
+        os.replace(tmp, path)
 
     def next(self):
         item = super(PluginIterator, self).next()
@@ -93,10 +198,263 @@ class PluginIterator(TIOIterator):
 
 
 
+class PluginCatalog(object):
+    '''
+    A local copy of the plugin catalog stored within a SQLite database and
+    indexed by the plugin id, family, and CVE.  The catalog is synced
+    incrementally from :py:meth:`PluginsAPI.list` using the date of the last
+    successful sync, so that only the plugins updated since then are
+    downloaded.  All lookups are served from the local database.
+
+    As looking up the same plugins over and over is common when enriching
+    vulnerability data, the most recent plugin lookups are also kept in
+    memory.  The records returned are shared with this in-memory cache and
+    should not be modified.
+
+    Args:
+        api (PluginsAPI): The plugins API to sync the catalog from.
+        path (str): The path to the SQLite database file.
+        family_cache (str, optional):
+            The directory to cache the plugin family maps within.  Refer to
+            :obj:`PluginIterator` for details.
+        cache_size (int, optional):
+            The number of plugin lookups to keep in memory.  The default is
+            ``10000``.
+
+    Examples:
+        >>> catalog = tio.plugins.catalog('plugins.db')
+        >>> catalog.sync()
+        >>> plugin = catalog.get(19506)
+        >>> plugins = catalog.cve('CVE-2017-0144')
+    '''
+    _batch_size = 1000
+
+    def __init__(self, api, path, family_cache=None, cache_size=10000):
+        self._api = api
+        self._family_cache = family_cache
+        self._db = sqlite3.connect(path)
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (
+                key     TEXT PRIMARY KEY,
+                value   TEXT
+            );
+            CREATE TABLE IF NOT EXISTS plugins (
+                id          INTEGER PRIMARY KEY,
+                name        TEXT,
+                family_id   INTEGER,
+                family_name TEXT,
+                data        TEXT
+            );
+            CREATE INDEX IF NOT EXISTS plugins_family_id
+                ON plugins (family_id);
+            CREATE INDEX IF NOT EXISTS plugins_family_name
+                ON plugins (family_name);
+            CREATE TABLE IF NOT EXISTS plugin_cves (
+                cve         TEXT,
+                plugin_id   INTEGER,
+                PRIMARY KEY (cve, plugin_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS plugin_cves_plugin_id
+                ON plugin_cves (plugin_id);
+        ''')
+        self._get = lru_cache(maxsize=cache_size)(self._lookup)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM plugins').fetchone()[0]
+
+    def __contains__(self, plugin_id):
+        return self.get(plugin_id) is not None
+
+    @property
+    def last_updated(self):
+        '''
+        The date of the last successful sync, or None if the catalog has never
+        been synced.
+        '''
+        row = self._db.execute(
+            'SELECT value FROM meta WHERE key = ?', ('last_updated',)
+        ).fetchone()
+        if row:
+            return datetime.strptime(row[0], '%Y-%m-%d').date()
+
+    def sync(self, full=False):
+        '''
+        Syncs the catalog with Tenable.io.  Only the plugins updated since the
+        last successful sync are downloaded unless a full sync is requested.
+        The sync date is only stored once all of the plugins have been
+        written, so an interrupted sync will be picked up again next time.
+
+        Args:
+            full (bool, optional):
+                Should the whole catalog be downloaded?  The default is
+                ``False``.
+
+        Returns:
+            :obj:`int`:
+                The number of plugins that were added or updated.
+
+        Examples:
+            >>> catalog.sync()
+            1543
+        '''
+        started = datetime.utcnow().date()
+        last_updated = None if full else self.last_updated
+        plugins = self._api.list(last_updated=last_updated)
+        plugins.populate_maptable = True
+        plugins.family_cache = self._family_cache
+
+        count = 0
+        batch = list()
+        for plugin in plugins:
+            batch.append(plugin)
+            if len(batch) >= self._batch_size:
+                count += self._store(batch)
+                batch = list()
+        if batch:
+            count += self._store(batch)
+
+        with self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                ('last_updated', started.strftime('%Y-%m-%d')))
+        self._get.cache_clear()
+        return count
+
+    def _store(self, plugins):
+        '''
+        Writes the batch of plugins (and their CVEs) to the database.
+        '''
+        ids = [(p['id'],) for p in plugins]
+        cves = list()
+        for plugin in plugins:
+            for cve in plugin.get('attributes', dict()).get('cve') or list():
+                cves.append((cve, plugin['id']))
+
+        with self._db:
+            self._db.executemany(
+                'DELETE FROM plugin_cves WHERE plugin_id = ?', ids)
+            self._db.executemany('''
+                INSERT OR REPLACE INTO plugins
+                    (id, name, family_id, family_name, data)
+                VALUES (?, ?, ?, ?, ?)''', [(
+                    p['id'],
+                    p.get('name'),
+                    p.get('family_id'),
+                    p.get('family_name'),
+                    json.dumps(p)
+                ) for p in plugins])
+            self._db.executemany(
+                'INSERT OR IGNORE INTO plugin_cves (cve, plugin_id) VALUES (?, ?)',
+                cves)
+        return len(plugins)
+
+    def _lookup(self, plugin_id):
+        row = self._db.execute(
+            'SELECT data FROM plugins WHERE id = ?', (plugin_id,)).fetchone()
+        if row:
+            return json.loads(row[0])
+
+    def _query(self, sql, params):
+        return [json.loads(r[0]) for r in self._db.execute(sql, params)]
+
+    def get(self, plugin_id):
+        '''
+        Retrieves the plugin from the catalog.
+
+        Args:
+            plugin_id (int): The plugin id.
+
+        Returns:
+            :obj:`dict`:
+                The plugin record or None if the plugin isn't in the catalog.
+
+        Examples:
+            >>> catalog.get(19506)
+        '''
+        return self._get(int(plugin_id))
+
+    def family(self, family):
+        '''
+        Retrieves the plugins within a plugin family.
+
+        Args:
+            family (int or str): The plugin family id or name.
+
+        Returns:
+            :obj:`list`:
+                The list of plugin records within the family.
+
+        Examples:
+            >>> catalog.family('Windows')
+        '''
+        if isinstance(family, int):
+            return self._query(
+                'SELECT data FROM plugins WHERE family_id = ?', (family,))
+        return self._query(
+            'SELECT data FROM plugins WHERE family_name = ?', (family,))
+
+    def cve(self, cve):
+        '''
+        Retrieves the plugins that cover the CVE.
+
+        Args:
+            cve (str): The CVE id.
+
+        Returns:
+            :obj:`list`:
+                The list of plugin records covering the CVE.
+
+        Examples:
+            >>> catalog.cve('CVE-2017-0144')
+        '''
+        return self._query('''
+            SELECT plugins.data FROM plugin_cves
+            JOIN plugins ON plugins.id = plugin_cves.plugin_id
+            WHERE plugin_cves.cve = ?''', (cve.upper(),))
+
+    def close(self):
+        '''
+        Closes the catalog database.
+        '''
+        self._db.close()
+
+
 class PluginsAPI(TIOEndpoint):
     '''
     This will contain all methods related to plugins
     '''
+    def catalog(self, path, family_cache=None, cache_size=10000):
+        '''
+        Opens (or creates) a local plugin catalog.  Refer to
+        :obj:`PluginCatalog` for details.
+
+        Args:
+            path (str): The path to the SQLite database file.
+            family_cache (str, optional):
+                The directory to cache the plugin family maps within.
+            cache_size (int, optional):
+                The number of plugin lookups to keep in memory.  The default
+                is ``10000``.
+
+        Returns:
+            :obj:`PluginCatalog`:
+                The plugin catalog.
+
+        Examples:
+            >>> with tio.plugins.catalog('plugins.db') as catalog:
+            ...     catalog.sync()
+            ...     pprint(catalog.get(19506))
+        '''
+        return PluginCatalog(self, path,
+            family_cache=family_cache,
+            cache_size=self._check('cache_size', cache_size, int))
+
     def families(self):
         '''
         List the available plugin families.
@@ -22,6 +22,7 @@ Methods available on ``tio.policies``:
 from .base import TIOEndpoint
 from tenable.utils import policy_settings, dict_merge
 from io import BytesIO
+import copy
 
 class PoliciesAPI(TIOEndpoint):
     def templates(self):
@@ -56,16 +57,27 @@ class PoliciesAPI(TIOEndpoint):
             >>> pprint(template)
 
         Please note that template_details is reverse-engineered from the
-        responses from the editor API and isn't guaranteed to work.
+        responses from the editor API and isn't guaranteed to work.  The
+        parsed document is cached alongside the editor template, so repeated
+        calls for the same template don't need to walk the template again.
         '''
 
         # Get the policy template UUID
         tmpl = self.templates()
         tmpl_uuid = tmpl[self._check('name', name, str, choices=tmpl.keys())]
 
-        # Get the editor object
-        editor = self._api.editor.template_details('policy', tmpl_uuid)
+        # Get the editor object from the template cache.  If we have already
+        # parsed this version of the template, then we can return it as-is.
+        entry = self._api.editor._template('policy', tmpl_uuid)
+        if 'policy' not in entry:
+            entry['policy'] = self._parse_template(tmpl_uuid, entry['document'])
+        return copy.deepcopy(entry['policy'])
 
+    def _parse_template(self, tmpl_uuid, editor):
+        '''
+        Walks the editor template and builds the policy configuration resource
+        from it.
+        '''
         # define the initial skeleton of the scan object
         scan = {
             'settings': policy_settings(editor['settings']),
@@ -115,7 +127,8 @@ class PoliciesAPI(TIOEndpoint):
             # if the plugins sub-document exists, then lets walk down the
             # plugins dataset.
             scan['plugins'] = self._api.editor.parse_plugins(
-                'policy', editor['plugins']['families'], tmpl_uuid)
+                'policy', editor['plugins']['families'], tmpl_uuid,
+                template=True)
 
         # return the scan document to the caller.
         return scan
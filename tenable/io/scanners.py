@@ -64,8 +64,9 @@ class ScannersAPI(TIOEndpoint):
                     return item['options']
             return []
 
-        vm_tmpl = self._api.policies.templates().get('advanced', None)
-        was_tmpl = self._api.policies.templates().get('was_scan', None)
+        templates = self._api.policies.templates()
+        vm_tmpl = templates.get('advanced', None)
+        was_tmpl = templates.get('was_scan', None)
         scanners = get_scanners(self._api.editor.template_details('scan', vm_tmpl))
         if was_tmpl is not None:
             scanners.extend(get_scanners(self._api.editor.template_details('scan', was_tmpl)))
@@ -42,7 +42,7 @@ from restfly.utils import dict_clean
 from tenable.constants import IOConstants
 from tenable.utils import dict_merge
 from tenable.errors import UnexpectedValueError
-from tenable.io.base import TIOEndpoint, TIOIterator
+from tenable.io.base import TIOEndpoint, TIOIterator, StatusPoller
 
 
 class ScanHistoryIterator(TIOIterator):
@@ -74,18 +74,17 @@ class ScansAPI(TIOEndpoint):
     schedule_const = IOConstants.ScanScheduleConst
     case_const = IOConstants.CaseConst
 
-    def _block_while_running(self, scan_id, sleeper=5):
+    def _block_while_running(self, scan_id, sleeper=5, deadline=None):
         '''
         A simple function to block while the scan_id specified is still in a
-        running state.
+        running state.  The status is polled starting with a delay of sleeper
+        seconds, backing off while the scan status remains unchanged.
         '''
-        running = True
-        while running:
-            status = self.results(scan_id)['info']['status']
-            if status[-2:].lower() == 'ed':
-                running = False
-            if running:
-                time.sleep(sleeper)
+        poller = StatusPoller(delay=sleeper, max_delay=60, deadline=deadline,
+            progress=lambda status: status)
+        poller.poll(
+            lambda: self.results(scan_id)['info']['status'],
+            lambda status: status[-2:].lower() == 'ed')
 
     def _create_scan_document(self, kwargs):
         '''
@@ -889,6 +888,10 @@ class ScansAPI(TIOEndpoint):
                 data.  While this is an optional parameter, it is highly
                 recommended to use this parameter as exported files can be quite
                 large, and BytesIO objects are stored in memory, not on disk.
+            timeout (int, optional):
+                The number of seconds to wait for the export to become ready
+                before raising a :obj:`PollingTimeout`.  If left unspecified,
+                the export will be waited on indefinitely.
 
         Returns:
             :obj:`FileObject`:
@@ -913,7 +916,7 @@ class ScansAPI(TIOEndpoint):
         filters = self._check('filters',
             kw.get('filters', filters), (list, tuple))
         payload = self._parse_filters(filters,
-            self._api.filters.scan_filters(), rtype='sjson')
+            self._api.filters._filterset('scan'), rtype='sjson')
         params = dict()
         dl_params = dict()
 
@@ -951,6 +954,7 @@ class ScansAPI(TIOEndpoint):
         if 'filter_type' in kw:
             payload['filter.search_type'] = self._check(
                 'filter_type', kw['filter_type'], str, choices=['and', 'or'])
+        timeout = self._check('timeout', kw.get('timeout'), int)
 
         # Now we need to set the FileObject.  If one was passed to us, then lets
         # just use that, otherwise we will need to instantiate a BytesIO object
@@ -970,7 +974,8 @@ class ScansAPI(TIOEndpoint):
         # ready.
         _ = self._wait_for_download(
             'scans/{}/export/{}/status'.format(scan_id, fid),
-            'scans', scan_id, fid, params=dl_params)
+            'scans', scan_id, fid, params=dl_params,
+            deadline=timeout)
 
         # Now that the status has reported back as "ready", we can actually
         # download the file.
@@ -1144,7 +1149,7 @@ class ScansAPI(TIOEndpoint):
 
         return self._api.get('scans', params=params).json()['scans']
 
-    def pause(self, scan_id, block=False):
+    def pause(self, scan_id, block=False, timeout=None):
         '''
         Pauses a running scan.
 
@@ -1154,6 +1159,10 @@ class ScansAPI(TIOEndpoint):
             scan_id (int or uuid): The unique identifier of the scan to pause.
             block (bool, optional):
                 Block until the scan is actually paused.  Default is False.
+            timeout (int, optional):
+                When blocking, the number of seconds to wait for the scan to
+                pause before raising a :obj:`PollingTimeout`.  If left
+                unspecified, the scan will be waited on indefinitely.
 
         Returns:
             :obj:`None`:
@@ -1164,7 +1173,8 @@ class ScansAPI(TIOEndpoint):
         '''
         self._api.post('scans/{}/pause'.format(scan_id), json={})
         if block:
-            self._block_while_running(scan_id)
+            self._block_while_running(scan_id,
+                deadline=self._check('timeout', timeout, int))
 
     def plugin_output(self, scan_id, host_id, plugin_id, history_id=None, history_uuid=None):
         '''
@@ -1265,7 +1275,7 @@ class ScansAPI(TIOEndpoint):
         return self._api.put('scans/{}/schedule'.format(scan_id), json={
             'enabled': self._check('enabled', enabled, bool)}).json()
 
-    def stop(self, scan_id, block=False):
+    def stop(self, scan_id, block=False, timeout=None):
         '''
         Stop a running scan.
 
@@ -1275,6 +1285,10 @@ class ScansAPI(TIOEndpoint):
             scan_id (int): The unique identifier for the scan.
             block (bool, optional):
                 Block until the scan is actually stopped.  Default is False.
+            timeout (int, optional):
+                When blocking, the number of seconds to wait for the scan to
+                stop before raising a :obj:`PollingTimeout`.  If left
+                unspecified, the scan will be waited on indefinitely.
 
         Returns:
             :obj:`None`:
@@ -1291,7 +1305,8 @@ class ScansAPI(TIOEndpoint):
         '''
         self._api.post('scans/{}/stop'.format(scan_id))
         if block:
-            self._block_while_running(scan_id)
+            self._block_while_running(scan_id,
+                deadline=self._check('timeout', timeout, int))
 
     def status(self, scan_id):
         '''
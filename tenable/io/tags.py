@@ -10,6 +10,9 @@ Methods available on ``tio.tags``:
 .. rst-class:: hide-signature
 .. autoclass:: TagsAPI
 
+    .. automethod:: assign
+    .. automethod:: bulk_assign
+    .. automethod:: bulk_unassign
     .. automethod:: create
     .. automethod:: create_category
     .. automethod:: delete
@@ -20,12 +23,19 @@ Methods available on ``tio.tags``:
     .. automethod:: edit_category
     .. automethod:: list
     .. automethod:: list_categories
+    .. automethod:: unassign
+
+.. autoclass:: BulkTagAssignment
+    :members:
 '''
+from concurrent.futures import ThreadPoolExecutor
 import json
 import re
+import threading
+import time
 
 from tenable.utils import dict_merge
-from tenable.io.base import TIOEndpoint, TIOIterator
+from tenable.io.base import TIOEndpoint, TIOIterator, StatusPoller
 
 class TagsIterator(TIOIterator):
     '''
@@ -48,6 +58,175 @@ class TagsIterator(TIOIterator):
     '''
     pass
 
+class BulkTagAssignment(object):
+    '''
+    The bulk tag assignment engine splits the assets and tags into batches
+    that the API will accept, submits the batches concurrently (optionally
+    under a rate limit), and then tracks each of the assignment jobs until
+    they have completed.  A failing batch doesn't stop the rest of the batches
+    from being submitted, as the error is reported within that batch's result
+    instead and the batch's status is set to ``FAILED``.
+
+    Tenable.io only returns a job UUID for each assignment.  To track the jobs
+    to completion, pass a ``job_status`` callable that is given the job UUID
+    and returns the current status of the job.  The job is considered complete
+    once the status is one of the ``done`` statuses (compared
+    case-insensitively).
+
+    Args:
+        api (TenableIO): The Tenable.io session.
+        action (str): The action to perform, either ``add`` or ``remove``.
+        assets (list): A list of Asset UUIDs.
+        tags (list): A list of tag category/value pair UUIDs.
+        batch_size (int, optional):
+            The maximum number of assets to send within each request.  The
+            default is ``5000``.
+        tag_batch_size (int, optional):
+            The maximum number of tags to send within each request.  The
+            default is ``100``.
+        workers (int, optional):
+            The number of batches to submit and track at once.  The default is
+            ``4``.
+        rate_limit (float, optional):
+            The maximum number of batches to submit per second.  If left
+            unspecified, the batches are submitted as quickly as the workers
+            allow.
+        job_status (callable, optional):
+            Is passed the job UUID and returns the status of the job.  If left
+            unspecified, the jobs aren't tracked after being submitted.
+        done (list, optional):
+            The statuses of a job that has completed.  The default is
+            ``['COMPLETED', 'FAILED', 'CANCELLED']``.
+        poller (dict, optional):
+            The keyword arguments to build the :obj:`StatusPoller` for each job
+            with.  The default is ``{'delay': 2, 'max_delay': 30}``.
+
+    Attributes:
+        results (list):
+            A result dictionary for each batch, in the order that the batches
+            were built.  Each result has the ``batch`` number, the number of
+            ``assets`` and ``tags`` within the batch, the ``job_uuid``, the
+            last ``status`` of the job, any ``error`` raised while submitting
+            or tracking the batch, and the ``elapsed`` seconds.
+
+    Examples:
+        >>> engine = BulkTagAssignment(tio, 'add', assets, tags,
+        ...     rate_limit=2, job_status=get_status)
+        >>> for result in engine.run():
+        ...     if result['error']:
+        ...         print(result)
+    '''
+    def __init__(self, api, action, assets, tags, batch_size=5000,
+                 tag_batch_size=100, workers=4, rate_limit=None,
+                 job_status=None, done=None, poller=None):
+        self._api = api
+        self.action = action
+        self.assets = assets
+        self.tags = tags
+        self.batch_size = batch_size
+        self.tag_batch_size = tag_batch_size
+        self.workers = workers
+        self.rate_limit = rate_limit
+        self.job_status = job_status
+        self.done = [d.upper() for d in (done or
+            ['COMPLETED', 'FAILED', 'CANCELLED'])]
+        self.poller = poller or {'delay': 2, 'max_delay': 30}
+        self.results = list()
+        self._lock = threading.Lock()
+        self._next_submit = 0
+
+    def batches(self):
+        '''
+        Splits the assets and tags into batches.
+
+        Returns:
+            :obj:`list`:
+                A list of (assets, tags) tuples.
+        '''
+        resp = list()
+        for i in range(0, len(self.tags), self.tag_batch_size):
+            tags = self.tags[i:i + self.tag_batch_size]
+            for j in range(0, len(self.assets), self.batch_size):
+                resp.append((self.assets[j:j + self.batch_size], tags))
+        return resp
+
+    def _throttle(self):
+        '''
+        Blocks until the next batch may be submitted under the rate limit.
+        '''
+        if not self.rate_limit:
+            return
+        with self._lock:
+            now = time.time()
+            wait = self._next_submit - now
+            self._next_submit = max(now, self._next_submit) + 1.0 / self.rate_limit
+        if wait > 0:
+            time.sleep(wait)
+
+    def _status(self, job_uuid):
+        '''
+        Returns the status of the job, normalized for comparison.
+        '''
+        return str(self.job_status(job_uuid)).upper()
+
+    def _process(self, result, assets, tags):
+        '''
+        Submits a single batch and tracks the job until it has completed.
+        '''
+        started = time.time()
+        try:
+            self._throttle()
+            result['job_uuid'] = self._api.post('tags/assets/assignments',
+                json={
+                    'action': self.action,
+                    'assets': assets,
+                    'tags': tags,
+                }).json()['job_uuid']
+            result['status'] = 'SUBMITTED'
+            if self.job_status:
+                result['status'] = StatusPoller(**self.poller).poll(
+                    lambda: self._status(result['job_uuid']),
+                    lambda s: s in self.done)
+        except Exception as err:
+            # Any error is kept within the batch's result so that a single
+            # failing batch (or job status lookup) doesn't abort the others.
+            result['error'] = err
+            result['status'] = 'FAILED'
+        result['elapsed'] = time.time() - started
+        return result
+
+    def run(self):
+        '''
+        Submits all of the batches and waits for them to complete.
+
+        Returns:
+            :obj:`list`:
+                The result for each batch.
+        '''
+        self.results = list()
+        batches = self.batches()
+        for idx, batch in enumerate(batches):
+            self.results.append({
+                'batch': idx,
+                'assets': len(batch[0]),
+                'tags': len(batch[1]),
+                'job_uuid': None,
+                'status': None,
+                'error': None,
+                'elapsed': None,
+            })
+        if not batches:
+            return self.results
+
+        with ThreadPoolExecutor(
+          max_workers=max(1, min(self.workers, len(batches)))) as pool:
+            futures = [pool.submit(self._process, self.results[i], a, t)
+                for i, (a, t) in enumerate(batches)]
+            for future in futures:
+                future.result()
+        return self.results
+
+
 class TagsAPI(TIOEndpoint):
     '''
     This will contain all methods related to tags
@@ -268,7 +447,7 @@ class TagsAPI(TIOEndpoint):
         # if filters are defined, run the filters through the filter parser...
         if self._check('filters', filters, list):
             payload['filters'] = self._tag_value_constructor(
-                filters, self._api.filters.asset_tag_filters(), filter_type)
+                filters, self._api.filters._filterset('tags'), filter_type)
 
         return self._api.post('tags/values', json=payload).json()
 
@@ -323,9 +502,8 @@ class TagsAPI(TIOEndpoint):
                 self._check('tag_value_uuid', tag_value_uuids[0], 'uuid')))
         else:
             self._api.post('tags/values/delete-requests',
-                json={'values': [
-                    self._check('tag_value_uuid', i, 'uuid') for i in tag_value_uuids
-                ]})
+                json={'values': self._check_list(
+                    'tag_value_uuid', tag_value_uuids, 'uuid')})
 
     def delete_category(self, tag_category_uuid):
         '''
@@ -484,7 +662,7 @@ class TagsAPI(TIOEndpoint):
         if filters is not None:
             self._check('filters', filters, list)
             payload['filters'] = self._tag_value_constructor(
-                filters, self._api.filters.asset_tag_filters(), filter_type)
+                filters, self._api.filters._filterset('tags'), filter_type)
         elif 'filters' in current and current['filters']:
             # current value in filters are in form of string.
             # we have to first convert it into dict() form before applying
@@ -677,8 +855,8 @@ class TagsAPI(TIOEndpoint):
         self._check('tags', tags, list)
         return self._api.post('tags/assets/assignments', json={
             'action': 'add',
-            'assets': [self._check('asset', a, 'uuid') for a in assets],
-            'tags': [self._check('tag', t, 'uuid') for t in tags],
+            'assets': self._check_list('asset', assets, 'uuid'),
+            'tags': self._check_list('tag', tags, 'uuid'),
         }).json()['job_uuid']
 
     def unassign(self, assets, tags):
@@ -706,6 +884,97 @@ class TagsAPI(TIOEndpoint):
         self._check('tags', tags, list)
         return self._api.post('tags/assets/assignments', json={
             'action': 'remove',
-            'assets': [self._check('asset', a, 'uuid') for a in assets],
-            'tags': [self._check('tag', t, 'uuid') for t in tags],
+            'assets': self._check_list('asset', assets, 'uuid'),
+            'tags': self._check_list('tag', tags, 'uuid'),
         }).json()['job_uuid']
+
+    def _bulk(self, action, assets, tags, kw):
+        '''
+        Validates the inputs and runs the bulk assignment engine.
+        '''
+        self._check('assets', assets, list)
+        self._check('tags', tags, list)
+        return BulkTagAssignment(self._api, action,
+            assets=self._check_list('asset', assets, 'uuid'),
+            tags=self._check_list('tag', tags, 'uuid'),
+            batch_size=self._check('batch_size',
+                kw.get('batch_size'), int, default=5000),
+            tag_batch_size=self._check('tag_batch_size',
+                kw.get('tag_batch_size'), int, default=100),
+            workers=self._check('workers', kw.get('workers'), int, default=4),
+            rate_limit=self._check('rate_limit',
+                kw.get('rate_limit'), [int, float]),
+            job_status=kw.get('job_status'),
+            done=self._check('done', kw.get('done'), list),
+            poller=self._check('poller', kw.get('poller'), dict),
+        ).run()
+
+    def bulk_assign(self, assets, tags, **kw):
+        '''
+        Assigns the tag category/value pairs defined to any number of assets.
+        The assets and tags are split into batches which are submitted
+        concurrently, and each of the resulting jobs can be tracked until it
+        has completed.  Refer to :obj:`BulkTagAssignment` for details.
+
+        :devportal:`tags: assign tags <tags-assign-asset-tags>`
+
+        Args:
+            assets (list):
+                A list of Asset UUIDs.
+            tags (list):
+                A list of tag category/value pair UUIDs.
+            batch_size (int, optional):
+                The maximum number of assets to send within each request.  The
+                default is ``5000``.
+            tag_batch_size (int, optional):
+                The maximum number of tags to send within each request.  The
+                default is ``100``.
+            workers (int, optional):
+                The number of batches to submit and track at once.  The
+                default is ``4``.
+            rate_limit (float, optional):
+                The maximum number of batches to submit per second.
+            job_status (callable, optional):
+                Is passed the job UUID and returns the status of the job.  If
+                specified, each job is polled until it has completed.
+            done (list, optional):
+                The statuses of a job that has completed.  The default is
+                ``['COMPLETED', 'FAILED', 'CANCELLED']``.
+            poller (dict, optional):
+                The keyword arguments for the :obj:`StatusPoller` used to poll
+                each job.
+
+        Returns:
+            :obj:`list`:
+                The result of each batch.
+
+        Examples:
+            >>> results = tio.tags.bulk_assign(assets, tags, rate_limit=2)
+            >>> failed = [r for r in results if r['error']]
+        '''
+        return self._bulk('add', assets, tags, kw)
+
+    def bulk_unassign(self, assets, tags, **kw):
+        '''
+        Un-assigns the tag category/value pairs defined from any number of
+        assets.  Takes the same arguments as :obj:`bulk_assign`.
+
+        :devportal:`tags: assign tags <tags-assign-asset-tags>`
+
+        Args:
+            assets (list):
+                A list of Asset UUIDs.
+            tags (list):
+                A list of tag category/value pair UUIDs.
+            **kw (dict):
+                The batching and tracking options supported by
+                :obj:`bulk_assign`.
+
+        Returns:
+            :obj:`list`:
+                The result of each batch.
+
+        Examples:
+            >>> results = tio.tags.bulk_unassign(assets, tags, workers=8)
+        '''
+        return self._bulk('remove', assets, tags, kw)
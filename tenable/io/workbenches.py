@@ -103,7 +103,7 @@ class WorkbenchesAPI(TIOEndpoint):
         '''
         # Call the query builder to handle construction
         query = self._workbench_query(filters, kw,
-            self._api.filters.workbench_asset_filters())
+            self._api.filters._filterset('asset'))
 
         # If all_fields is set to true or is unspecified, then we will set the
         # all_fields parameter to "full".
@@ -205,7 +205,7 @@ class WorkbenchesAPI(TIOEndpoint):
         '''
         # Call the query builder to handle construction
         query = self._workbench_query(filters, kw,
-            self._api.filters.workbench_vuln_filters())
+            self._api.filters._filterset('vulns'))
 
         return self._api.get(
             'workbenches/assets/{}/vulnerabilities'.format(
@@ -248,7 +248,7 @@ class WorkbenchesAPI(TIOEndpoint):
         '''
         # Call the query builder to handle construction
         query = self._workbench_query(filters, kw,
-            self._api.filters.workbench_vuln_filters())
+            self._api.filters._filterset('vulns'))
 
         return self._api.get(
             'workbenches/assets/{}/vulnerabilities/{}/info'.format(
@@ -292,7 +292,7 @@ class WorkbenchesAPI(TIOEndpoint):
         '''
         # Call the query builder to handle construction
         query = self._workbench_query(filters, kw,
-            self._api.filters.workbench_vuln_filters())
+            self._api.filters._filterset('vulns'))
 
         return self._api.get(
             'workbenches/assets/{}/vulnerabilities/{}/outputs'.format(
@@ -349,7 +349,7 @@ class WorkbenchesAPI(TIOEndpoint):
         '''
         # Call the query builder to handle construction
         query = self._workbench_query(filters, kw,
-            self._api.filters.workbench_vuln_filters())
+            self._api.filters._filterset('vulns'))
 
         return self._api.get(
             'workbenches/assets/vulnerabilities', params=query).json()['assets']
@@ -396,6 +396,10 @@ class WorkbenchesAPI(TIOEndpoint):
                 data.  While this is an optional parameter, it is highly
                 recommended to use this parameter as exported files can be quite
                 large, and BytesIO objects are stored in memory, not on disk.
+            timeout (int, optional):
+                The number of seconds to wait for the export to become ready
+                before raising a :obj:`PollingTimeout`.  If left unspecified,
+                the export will be waited on indefinitely.
 
         Returns:
             :obj:`FileObject`:
@@ -408,7 +412,7 @@ class WorkbenchesAPI(TIOEndpoint):
 
         # initiate the payload and parameters dictionaries.
         params = self._parse_filters(filters,
-            self._api.filters.workbench_vuln_filters())
+            self._api.filters._filterset('vulns'))
         params['report'] = 'vulnerabilities'
         params['chapter'] = 'vuln_by_asset'
         params['format'] = 'nessus'
@@ -450,6 +454,7 @@ class WorkbenchesAPI(TIOEndpoint):
         if 'filter_type' in kw:
             params['filter.search_type'] = self._check(
                     'filter_type', kw['filter_type'], str, choices=['and', 'or'])
+        timeout = self._check('timeout', kw.get('timeout'), int)
 
         # Now we need to set the FileObject.  If one was passed to us, then lets
         # just use that, otherwise we will need to instantiate a BytesIO object
@@ -470,7 +475,7 @@ class WorkbenchesAPI(TIOEndpoint):
         # response we're looking for.
         self._wait_for_download(
             'workbenches/export/{}/status'.format(fid),
-            'workbenches', 'export', fid)
+            'workbenches', 'export', fid, deadline=timeout)
 
         # Now that the status has reported back as "ready", we can actually
         # download the file.
@@ -525,7 +530,7 @@ class WorkbenchesAPI(TIOEndpoint):
         '''
         # Call the query builder to handle construction
         query = self._workbench_query(filters, kw,
-            self._api.filters.workbench_vuln_filters())
+            self._api.filters._filterset('vulns'))
 
         if 'authenticated' in kw and self._check('authenticated', kw['authenticated'], bool):
             query['authenticated'] = True
@@ -571,7 +576,7 @@ class WorkbenchesAPI(TIOEndpoint):
         '''
         # Call the query builder to handle construction
         query = self._workbench_query(filters, kw,
-            self._api.filters.workbench_vuln_filters())
+            self._api.filters._filterset('vulns'))
 
         return self._api.get(
             'workbenches/vulnerabilities/{}/info'.format(
@@ -608,7 +613,7 @@ class WorkbenchesAPI(TIOEndpoint):
         '''
         # Call the query builder to handle construction
         query = self._workbench_query(filters, kw,
-            self._api.filters.workbench_vuln_filters())
+            self._api.filters._filterset('vulns'))
 
         return self._api.get(
             'workbenches/vulnerabilities/{}/outputs'.format(
@@ -1,4 +1,5 @@
 from restfly.iterator import APIIterator
+from tenable.errors import UnexpectedValueError
 from box import BoxList
 from copy import copy
 
@@ -32,4 +33,63 @@ class OTIterator(APIIterator):
 
         # make the call and update the offset.
         self.page = self._api.post(self._path, json=p, box=BoxList)
-        self.offset += self.limit
\ No newline at end of file
+        self.offset += self.limit
+
+def graph_query(root, fields):
+    '''
+    Builds a cursor-paginated GraphQL query for the root connection, selecting
+    the fields specified on each of the nodes.  Nested selections can be
+    passed as a field, for example ``'connections { local direct }'``.
+    '''
+    return '''
+        query {root}($limit: Int, $cursor: String) {{
+            {root}(first: $limit, after: $cursor) {{
+                nodes {{
+                    {fields}
+                }}
+                pageInfo {{
+                    endCursor
+                    hasNextPage
+                }}
+            }}
+        }}
+    '''.format(root=root, fields='\n'.join(fields))
+
+
+class OTGraphIterator(APIIterator):
+    '''
+    Walks through a cursor-paginated GraphQL connection, requesting the next
+    page using the end cursor of the previous page until the API reports that
+    there are no further pages.
+    '''
+    limit = 500
+    _cursor = None
+    _has_next = True
+
+    def __init__(self, api, **kwargs):
+        self._root = kwargs.pop('root')
+        self._query = kwargs.pop('query')
+        self._variables = kwargs.pop('variables', {})
+        self.limit = kwargs.pop('limit', self.limit)
+        super(OTGraphIterator, self).__init__(api, **kwargs)
+
+    def _get_page(self):
+        '''
+        Retrieves the next page of data
+        '''
+        if not self._has_next:
+            raise StopIteration()
+
+        variables = copy(self._variables)
+        variables['limit'] = self.limit
+        variables['cursor'] = self._cursor
+        resp = self._api.graphql(query=self._query, variables=variables)
+        if resp.get('errors'):
+            raise UnexpectedValueError('GraphQL query for {} failed: {}'.format(
+                self._root, '; '.join([e.get('message', str(e))
+                    for e in resp['errors']])))
+
+        data = resp['data'][self._root]
+        self.page = data['nodes']
+        self._cursor = data['pageInfo']['endCursor']
+        self._has_next = data['pageInfo']['hasNextPage']
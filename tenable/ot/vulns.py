@@ -11,12 +11,105 @@ These methods can be accessed at ``TenableOT.vulns``.
 
 .. autoclass:: VulnAssetIntermixer
     :members:
+
+.. autoclass:: AssetCache
+    :members:
+
+.. autoclass:: VulnGraphExtractor
+    :members:
 '''
 from tenable.base.endpoint import APIEndpoint
 from .schemas.paging import PaginationSchema
-from .schemas.iterators import OTIterator
+from .schemas.iterators import OTIterator, OTGraphIterator, graph_query
 from box import Box, BoxList
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import copy
+from threading import Lock
+import time
+
+
+class AssetCache(object):
+    '''
+    A bounded least-recently-used cache for the asset connection data used by
+    the :obj:`VulnAssetIntermixer`.  Entries can optionally expire after a
+    set number of seconds.  Each extraction gets its own cache unless one is
+    passed in, allowing several extractions to share the same warm data on
+    purpose.
+
+    Args:
+        maxsize (int, optional):
+            The maximum number of assets to hold within the cache.  Once
+            full, the least recently used asset is evicted.  The default is
+            ``10000``.
+        ttl (int, optional):
+            The number of seconds an entry is valid for.  If left unspecified,
+            the entries don't expire.
+
+    Attributes:
+        hits (int): The number of lookups that were served from the cache.
+        misses (int): The number of lookups that weren't in the cache.
+        evictions (int): The number of entries evicted to make room.
+        expirations (int): The number of entries dropped as they had expired.
+
+    Example:
+        >>> cache = AssetCache(maxsize=50000, ttl=3600)
+        >>> for vuln in ot.vulns.extract(cache=cache):
+        ...     print(vuln)
+        >>> print(cache.hits, cache.misses)
+    '''
+    def __init__(self, maxsize=10000, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        entry = self._data.get(key)
+        return entry is not None and not self._expired(entry)
+
+    def _expired(self, entry):
+        return self.ttl is not None and time.time() - entry[0] >= self.ttl
+
+    def get(self, key, default=None):
+        '''
+        Returns the cached value for the key, or the default if the key isn't
+        cached (or has expired).
+        '''
+        entry = self._data.get(key)
+        if entry is not None and self._expired(entry):
+            del self._data[key]
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key, value):
+        '''
+        Stores the value within the cache, evicting the least recently used
+        entries if the cache is full.
+        '''
+        self._data[key] = (time.time(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        '''
+        Empties the cache.
+        '''
+        self._data.clear()
 
 
 class VulnAssetIntermixer(object):
@@ -25,6 +118,15 @@ class VulnAssetIntermixer(object):
     instance" similar to the Tenable.io vuln export APIs and the Tenable.sc
     analysis APIs.
 
+    The connections (and the network interfaces of those connections) for the
+    assets are retrieved ahead of time using a pool of worker threads.  The
+    iterator will look ahead at the upcoming assets and enrich them in the
+    background while the current item is being worked on.  Each network
+    interface is only ever requested once, no matter how many assets share it.
+
+    The connection data for each asset is held within an :obj:`AssetCache`
+    that is scoped to the iterator unless a cache is passed in.
+
     .. note::
         This iterator should not be instantiated on your own.  It relies on
         parameters passed from :py:meth:`tenable.ot.vulns.VulnsAPI.export`.
@@ -34,10 +136,10 @@ class VulnAssetIntermixer(object):
         >>> for vuln in vulns:
         ...     print(vuln)
     '''
-    _asset_cache = dict()
     _va_iterator = None
     _vulns = None
     _vulns_idx = 0
+    _pool = None
     count = 0
     asset_count = 0
     vuln_count = 0
@@ -48,35 +150,113 @@ class VulnAssetIntermixer(object):
     def __next__(self):
         return self.next()
 
-    def __init__(self, api):
+    def __init__(self, api, workers=8, lookahead=None, cache=None):
         self._api = api
+        self._asset_cache = cache if cache is not None else AssetCache()
+        self._workers = workers
+        self._lookahead = lookahead or workers * 4
+        self._buffer = deque()
+        self._pending = dict()
+        self._interfaces = dict()
+        self._lock = Lock()
+        self._pairs = self._vuln_assets()
+
+    def _interface(self, iface_id):
+        '''
+        Returns the details for the network interface.  Each interface is only
+        requested once; any other worker asking for the same interface will
+        wait on the first request instead.
+        '''
+        with self._lock:
+            future = self._interfaces.get(iface_id)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._interfaces[iface_id] = future
+        if owner:
+            try:
+                future.set_result(self._api.network_interfaces.details(iface_id))
+            except Exception as err:
+                # Don't cache the failure so that a later asset can retry.
+                with self._lock:
+                    del self._interfaces[iface_id]
+                future.set_exception(err)
+        return future.result()
+
+    def _get_connections(self, asset_id):
+        '''
+        Retrieves the connections for the asset along with the network
+        interface details for each connection.
+        '''
+        connections = self._api.assets.connections(asset_id)
+        for con in connections:
+            iface = copy(self._interface(con['networkInterface']))
+            iface['id'] = con['networkInterface']
+            con['networkInterface'] = iface
+        return connections
+
+    def _vuln_assets(self):
+        '''
+        Generates the index of the vulnerability definition and the asset for
+        every asset of every vulnerability definition.
+        '''
+        if not self._vulns:
+            self._vulns = self._api.vulns.list(box=False).json()
+
+        for idx in range(len(self._vulns)):
+            self._va_iterator = self._api.vulns.vuln_assets(
+                self._vulns[idx]['id'])
+            self.vuln_count += 1
+            for asset in self._va_iterator:
+                yield idx, asset
+
+    def _fill_buffer(self):
+        '''
+        Reads ahead into the upcoming assets, scheduling the retrieval of the
+        connections for any asset that isn't already cached or scheduled.
+        '''
+        if not self._pool:
+            self._pool = ThreadPoolExecutor(max_workers=self._workers)
+        while len(self._buffer) < self._lookahead:
+            try:
+                idx, asset = next(self._pairs)
+            except StopIteration:
+                break
+            self._buffer.append((idx, asset))
+            if (asset['id'] not in self._asset_cache
+              and asset['id'] not in self._pending):
+                self._pending[asset['id']] = self._pool.submit(
+                    self._get_connections, asset['id'])
+
+    def _close_pool(self):
+        '''
+        Cancels any outstanding requests and shuts down the worker pool.
+        '''
+        if self._pool:
+            for future in self._pending.values():
+                future.cancel()
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self._pending = dict()
 
     def _merge_cache(self, asset):
         '''
         Returns a "vuln instance" of a merged asset, vuln def, and connections.
         '''
-        if asset['id'] not in self._asset_cache:
-            connections = self._api.assets.connections(asset['id'])
-            for con in connections:
-                iface = self._api.network_interfaces.details(con['networkInterface'])
-                iface['id'] = con['networkInterface']
-                con['networkInterface'] = iface
-            self._asset_cache[asset['id']] = connections
+        connections = self._asset_cache.get(asset['id'])
+        if connections is None:
+            future = self._pending.pop(asset['id'], None)
+            if future:
+                connections = future.result()
+            else:
+                connections = self._get_connections(asset['id'])
+            self._asset_cache.set(asset['id'], connections)
             self.asset_count += 1
-        asset.connections = self._asset_cache[asset.id]
+        asset.connections = connections
         vuln = copy(self._vulns[self._vulns_idx])
         vuln['asset'] = asset
         return Box(vuln, **self._api._box_attrs)
 
-    def _get_next_vai(self):
-        '''
-        Gets the next Vulnerability Asset Iterator
-        '''
-        self._va_iterator = self._api.vulns.vuln_assets(
-            self._vulns[self._vulns_idx]['id']
-        )
-        self.vuln_count += 1
-
     def next(self):
         '''
         Retrieves the next item.
@@ -91,23 +271,182 @@ class VulnAssetIntermixer(object):
             :obj:`dict`:
                 The next vulnerability instance item.
         '''
-        if not self._vulns:
-            self._vulns = self._api.vulns.list(box=False).json()
+        self._fill_buffer()
+        if not self._buffer:
+            self._close_pool()
+            raise StopIteration()
+
+        self._vulns_idx, asset = self._buffer.popleft()
+        try:
+            resp = self._merge_cache(asset)
+        except Exception:
+            self._close_pool()
+            raise
+        self.count += 1
+        return resp
 
-        if not self._va_iterator:
-            self._get_next_vai()
 
-        resp = None
-        while not resp:
-            try:
-                resp = self._merge_cache(self._va_iterator.next())
-                self.count += 1
-            except StopIteration:
-                self._vulns_idx += 1
-                try:
-                    self._get_next_vai()
-                except IndexError:
-                    raise StopIteration
+class VulnGraphExtractor(object):
+    '''
+    This iterator returns the same "vulnerability instance" records as the
+    :obj:`VulnAssetIntermixer`, however the data is pulled in bulk from the
+    GraphQL API instead of requesting the connections and network interfaces
+    for every asset.  The assets (along with their connections), the network
+    interfaces, and the vulnerabilities (along with the ids of the affected
+    assets) are each retrieved using cursor-paginated queries, and the records
+    are then blended together locally.
+
+    The fields selected for each of the resources may be overridden to only
+    pull back the data that is needed.  The ``id`` fields (and the fields
+    needed to join the resources together) are always selected.
+
+    .. note::
+        This iterator should not be instantiated on your own.  It relies on
+        parameters passed from :py:meth:`tenable.ot.vulns.VulnsAPI.bulk_extract`.
+
+    Example:
+        >>> vulns = ot.vulns.bulk_extract()
+        >>> for vuln in vulns:
+        ...     print(vuln)
+    '''
+    vuln_fields = [
+        'comment',
+        'publishedDate',
+        'lastModifiedDate',
+        'cvss { score accessVector accessComplexity authentication '
+        'availabilityImpact confidentialityImpact integrityImpact }',
+    ]
+    asset_fields = [
+        'name',
+        'type',
+        'addresses',
+        'directAddresses',
+        'firstSeen',
+        'lastSeen',
+        'purdueLevel',
+        'vendor',
+        'runStatus',
+        'os',
+        'family',
+        'firmwareVersion',
+        'risk',
+        'criticality',
+        'hidden',
+        'site',
+    ]
+    connection_fields = [
+        'local',
+        'direct',
+    ]
+    interface_fields = [
+        'ips',
+        'dnsNames',
+        'firstSeen',
+        'lastSeen',
+        'family',
+    ]
+    count = 0
+    asset_count = 0
+    vuln_count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    def __init__(self, api, limit=500, vuln_fields=None, asset_fields=None,
+                 connection_fields=None, interface_fields=None):
+        self._api = api
+        self._limit = limit
+        if vuln_fields is not None:
+            self.vuln_fields = vuln_fields
+        if asset_fields is not None:
+            self.asset_fields = asset_fields
+        if connection_fields is not None:
+            self.connection_fields = connection_fields
+        if interface_fields is not None:
+            self.interface_fields = interface_fields
+        self._assets = None
+        self._interfaces = None
+        self._vulns = None
+        self._items = None
+
+    def _iterator(self, root, fields):
+        '''
+        Returns the GraphQL iterator for the root connection.
+        '''
+        return OTGraphIterator(self._api,
+            root=root,
+            query=graph_query(root, fields),
+            limit=self._limit
+        )
+
+    def _load(self):
+        '''
+        Pulls down all of the assets and network interfaces and indexes them
+        by their ids.
+        '''
+        self._interfaces = dict()
+        for iface in self._iterator('networkInterfaces',
+                                    ['id'] + self.interface_fields):
+            self._interfaces[iface['id']] = iface
+
+        self._assets = dict()
+        connections = 'connections {{ networkInterface {{ id }} {} }}'.format(
+            ' '.join(self.connection_fields))
+        for asset in self._iterator('assets',
+                                    ['id'] + self.asset_fields + [connections]):
+            self._assets[asset['id']] = asset
+            self.asset_count += 1
+
+        self._vulns = self._iterator('vulnerabilities',
+            ['id'] + self.vuln_fields + ['assets { id }'])
+
+    def _merge(self, vuln, asset_id):
+        '''
+        Returns a "vuln instance" of a merged asset, vuln def, and connections.
+        '''
+        asset = copy(self._assets.get(asset_id) or {'id': asset_id})
+        connections = list()
+        for con in asset.get('connections') or list():
+            con = copy(con)
+            iface_id = con.get('networkInterface')
+            if isinstance(iface_id, dict):
+                iface_id = iface_id.get('id')
+            iface = copy(self._interfaces.get(iface_id) or dict())
+            iface['id'] = iface_id
+            con['asset'] = asset_id
+            con['networkInterface'] = iface
+            connections.append(con)
+        asset['connections'] = connections
+        vuln = copy(vuln)
+        vuln['asset'] = asset
+        return Box(vuln, **self._api._box_attrs)
+
+    def _generate(self):
+        '''
+        Generates the vuln instances for every asset of every vulnerability.
+        '''
+        for vuln in self._vulns:
+            self.vuln_count += 1
+            assets = vuln.pop('assets', None) or list()
+            for asset in assets:
+                yield self._merge(vuln, asset['id'])
+
+    def next(self):
+        '''
+        Retrieves the next item.
+
+        Returns:
+            :obj:`dict`:
+                The next vulnerability instance item.
+        '''
+        if self._items is None:
+            self._load()
+            self._items = self._generate()
+        resp = next(self._items)
+        self.count += 1
         return resp
 
 
@@ -165,12 +504,25 @@ class VulnsAPI(APIEndpoint):
             payload=schema.load(kwargs)
         )
 
-    def extract(self):
+    def extract(self, workers=8, lookahead=None, cache=None):
         '''
         Returns an iterator that handles blending the vulnerability definition
         data and asset data into a "vulnerability instance" as is commonly seen
         in Tenable.io and Tenable.sc
 
+        Args:
+            workers (int, optional):
+                The number of worker threads used to retrieve the asset
+                connections and network interfaces.  The default is ``8``.
+            lookahead (int, optional):
+                The number of upcoming assets to read ahead and enrich in the
+                background.  The default is 4 times the number of workers.
+            cache (AssetCache, optional):
+                The cache to hold the asset connection data within.  Passing
+                the same cache to several extractions allows them to reuse the
+                data.  If left unspecified, a new cache is created for the
+                extraction.
+
         Returns:
             :obj:`VulnAssetIntermixer`:
                 The iterator object handling the data blending.
@@ -179,4 +531,48 @@ class VulnsAPI(APIEndpoint):
             >>> for vuln in ot.vulns.extract():
             ...     print(vuln)
         '''
-        return VulnAssetIntermixer(self._api)
\ No newline at end of file
+        return VulnAssetIntermixer(self._api,
+            workers=workers, lookahead=lookahead, cache=cache)
+
+    def bulk_extract(self, limit=500, vuln_fields=None, asset_fields=None,
+                     connection_fields=None, interface_fields=None):
+        '''
+        Returns an iterator that blends the vulnerability definitions, assets,
+        connections, and network interfaces into "vulnerability instance"
+        records, the same as :py:meth:`extract`, using a handful of
+        cursor-paginated GraphQL queries instead of several REST calls per
+        asset.  This is intended for large sites, where the per-asset calls
+        made by :py:meth:`extract` would number in the tens of thousands.
+
+        Args:
+            limit (int, optional):
+                The number of records to request within each page.  The default
+                is ``500``.
+            vuln_fields (list, optional):
+                The vulnerability fields to select.
+            asset_fields (list, optional):
+                The asset fields to select.
+            connection_fields (list, optional):
+                The fields of the asset connections to select.
+            interface_fields (list, optional):
+                The network interface fields to select.
+
+        Returns:
+            :obj:`VulnGraphExtractor`:
+                The iterator object handling the data blending.
+
+        Example:
+            >>> for vuln in ot.vulns.bulk_extract():
+            ...     print(vuln)
+
+            Only selecting the asset fields needed:
+
+            >>> vulns = ot.vulns.bulk_extract(asset_fields=['name', 'type'])
+        '''
+        return VulnGraphExtractor(self._api,
+            limit=limit,
+            vuln_fields=vuln_fields,
+            asset_fields=asset_fields,
+            connection_fields=connection_fields,
+            interface_fields=interface_fields
+        )
@@ -15,4 +15,4 @@ easily compressible and well understood.
 
 .. automodule:: tenable.reports.nessusv2
 '''
-from .nessusv2 import NessusReportv2
+from .nessusv2 import NessusReportv2, NessusReportv2Pool
@@ -1,5 +1,9 @@
 '''
 .. autoclass:: NessusReportv2
+    :members: hosts, columns
+
+.. autoclass:: NessusReportv2Pool
+    :members: stats
 '''
 from tenable.errors import PackageMissingError
 
@@ -9,7 +13,21 @@ except ImportError:
     raise PackageMissingError(
         'The python package defusedxml is required for NessusReportv2')
 
-import dateutil.parser, time
+try:
+    from lxml.etree import iterparse as lxml_iterparse
+except ImportError:
+    lxml_iterparse = None
+
+from concurrent.futures import (
+    ProcessPoolExecutor, FIRST_COMPLETED, wait)
+from collections import deque
+from datetime import datetime
+import dateutil.parser, io, logging, mmap, os, pickle, tempfile, time
+
+# The known date formats used within the Nessus file.  The plugin dates use
+# the first format, whereas the HOST_START and HOST_END properties use the
+# second.  Anything else will be handed off to dateutil.
+_DATE_FORMATS = ('%Y/%m/%d', '%a %b %d %H:%M:%S %Y')
 
 
 class NessusReportv2(object):
@@ -21,12 +39,21 @@ class NessusReportv2(object):
     the resulting dictionary, what attributes are returned, and what is not.
 
     Please note that in order to use this generator, you must install the python
-    ``lxml`` package.
+    ``defusedxml`` package.
 
     Args:
         fobj (File object or string path):
             Either a File-like object or a string path pointing to the file to
             be parsed.
+        fast (bool, optional):
+            Should the fast parser be used?  The fast parser converts the
+            fields using a precomputed conversion table, converts the host
+            properties only once per host, and parses the dates using the fixed
+            formats within the Nessus file (memoized per host).  If the
+            ``lxml`` package is installed, it will be used to parse the XML
+            (with entity resolution and network access disabled).  The
+            returned items are the same as the standard parser.  The default
+            is ``False``.
 
     Examples:
         For example, if we wanted to load a Nessus report from disk and iterate
@@ -36,9 +63,32 @@ class NessusReportv2(object):
         ...     report = NessusReportv2(nessus_file)
         ...     for item in report:
         ...         print(item)
+
+        For larger files, the fast parser can be used instead:
+
+        >>> with open('example.nessus', 'rb') as nessus_file:
+        ...     for item in NessusReportv2(nessus_file, fast=True):
+        ...         print(item)
+
+        Instead of items with the host properties copied into each of them,
+        the report may also be read host by host using
+        :py:meth:`NessusReportv2.hosts`, or in column batches using
+        :py:meth:`NessusReportv2.columns`.  Both of these use the fast
+        field conversions.
     '''
-    def __init__(self, fobj):
-        self._iter = iterparse(fobj, events=('start', 'end'))
+    _lxml = False
+
+    def __init__(self, fobj, fast=False):
+        self._fast = fast
+        self._cache = dict()
+        self._converters = self._build_converters()
+        self._dates = dict()
+        if fast and lxml_iterparse:
+            self._lxml = True
+            self._iter = lxml_iterparse(fobj, events=('start', 'end'),
+                resolve_entities=False, no_network=True, huge_tree=True)
+        else:
+            self._iter = iterparse(fobj, events=('start', 'end'))
 
     def __iter__(self):
         return self
@@ -68,6 +118,62 @@ class NessusReportv2(object):
         else:
             return value
 
+    def _build_converters(self):
+        '''
+        Builds the field conversion table used by the fast parser as well as
+        the host and column outputs.  The table maps the field names to the
+        same conversions that _defs performs.
+        '''
+        converters = dict()
+        for name in ['cvss_vector', 'cvss_temporal_vector']:
+            converters[name] = lambda value: value.split('/')
+        for name in ['cvss_base_score', 'cvss_temporal_score']:
+            converters[name] = float
+        for name in ['first_found', 'last_found', 'plugin_modification_date',
+                     'plugin_publication_date', 'HOST_END', 'HOST_START']:
+            converters[name] = self._date
+        for name in ['port', 'pluginID', 'severity']:
+            converters[name] = int
+        return converters
+
+    def _date(self, value):
+        '''
+        Converts the date string into a datetime object using the fixed date
+        formats, falling back to dateutil if none of them match.  As the same
+        handful of dates are repeated over and over within a host, the results
+        are memoized until the next host is reached.
+        '''
+        if value not in self._dates:
+            for fmt in _DATE_FORMATS:
+                try:
+                    self._dates[value] = datetime.strptime(value, fmt)
+                    break
+                except ValueError:
+                    pass
+            else:
+                self._dates[value] = dateutil.parser.parse(value)
+        return self._dates[value]
+
+    def _convert(self, name, value):
+        '''
+        Converts the value using the conversion table.
+        '''
+        converter = self._converters.get(name)
+        if converter:
+            return converter(value)
+        return value
+
+    def _clear(self, elem):
+        '''
+        Clears out the element.  When using lxml, the already processed
+        siblings are also removed from the parent as lxml will otherwise keep
+        the empty elements in the tree.
+        '''
+        elem.clear()
+        if self._lxml:
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
     def next(self):
         '''
         Get the next ReportItem from the nessus file and return it as a
@@ -83,18 +189,25 @@ class NessusReportv2(object):
                     # the host information cache, starting with the ReportHost's
                     # name for the host.
                     self._cache = {'host-report-name': elem.get('name')}
+                    self._dates = dict()
 
                 if event == 'end' and elem.tag == 'HostProperties':
                     # Once we have finished parsing out all of the host properties,
                     # we need to update the host cache with this new information.
+                    # The fast parser will convert the host properties here once
+                    # instead of for every ReportItem.
                     for child in elem:
-                        self._cache[child.get('name')] = child.text
-                    elem.clear()
+                        if self._fast:
+                            self._cache[child.get('name')] = self._convert(
+                                child.get('name'), child.text)
+                        else:
+                            self._cache[child.get('name')] = child.text
+                    self._clear(elem)
 
                 if event == 'end' and elem.tag == 'ReportHost':
                     # If we reach the end of the ReportHost tree, then clear out
                     # the element.
-                    elem.clear()
+                    self._clear(elem)
                 if event == 'end' and elem.tag == 'NessusClientData_v2':
                     # If we reach the end of the Nessus file, then we need to raise
                     # a StopIteration exception to inform the code downstream that
@@ -106,6 +219,11 @@ class NessusReportv2(object):
                     # ReportItem, lets go ahead and parse out the ReportItem, graft
                     # on the cached HostProperties that we gathered before, and then
                     # return the data as a python dictionary.
+                    if self._fast:
+                        vuln = self._report_item(elem, self._cache)
+                        self._clear(elem)
+                        return vuln
+
                     vuln = dict(elem.attrib)
                     vuln.update(self._cache)
 
@@ -139,3 +257,494 @@ class NessusReportv2(object):
                 raise TypeError('File object not opened in binary mode.')
             else:
                 raise err
+
+    def _report_item(self, elem, host=None):
+        '''
+        Builds the item dictionary for the ReportItem using the conversion
+        table.  If the host properties are passed, they are merged into the
+        item.  As the host properties were already converted when they were
+        cached, only the ReportItem's attributes and children are converted.
+        '''
+        convert = self._convert
+        vuln = dict()
+        for key, value in elem.attrib.items():
+            vuln[key] = convert(key, value)
+        if host:
+            vuln.update(host)
+
+        for c in elem:
+            tag = c.tag
+            value = convert(tag, c.text)
+            if tag in vuln:
+                if not isinstance(vuln[tag], list):
+                    vuln[tag] = [vuln[tag],]
+                elif host and tag in host:
+                    # Don't append onto the list shared with the host cache.
+                    vuln[tag] = list(vuln[tag])
+                vuln[tag].append(value)
+            else:
+                vuln[tag] = value
+        return vuln
+
+    def _walk(self):
+        '''
+        Walks through the report, yielding a tuple of the converted host
+        properties and the ReportItem (without the host properties) for each
+        ReportItem.  At the end of each ReportHost, the host properties are
+        yielded with an item of None.  The host properties dictionary is shared
+        between all of the items for the host.
+        '''
+        host = dict()
+        try:
+            for event, elem in self._iter:
+                if event == 'start' and elem.tag == 'ReportHost':
+                    host = {'host-report-name': elem.get('name')}
+                    self._dates = dict()
+
+                elif event == 'end' and elem.tag == 'HostProperties':
+                    for child in elem:
+                        host[child.get('name')] = self._convert(
+                            child.get('name'), child.text)
+                    self._clear(elem)
+
+                elif event == 'end' and elem.tag == 'ReportItem':
+                    item = self._report_item(elem)
+                    self._clear(elem)
+                    yield host, item
+
+                elif event == 'end' and elem.tag == 'ReportHost':
+                    self._clear(elem)
+                    yield host, None
+
+                elif event == 'end' and elem.tag == 'NessusClientData_v2':
+                    return
+        except TypeError as err:
+            if err.args[0] == 'reading file objects must return bytes objects':
+                raise TypeError('File object not opened in binary mode.')
+            else:
+                raise err
+
+    def hosts(self):
+        '''
+        Returns a generator of host records instead of individual items.  Each
+        host record contains the host properties once along with the list of
+        items found on the host.  Instead of a copy of the host properties,
+        each item has a ``host`` key referencing the host record's properties.
+
+        Yields:
+            :obj:`dict`:
+                The host record with the ``name`` of the host, the
+                ``properties`` of the host, and the ``items`` for the host.
+
+        Examples:
+            >>> with open('example.nessus', 'rb') as nessus_file:
+            ...     for host in NessusReportv2(nessus_file).hosts():
+            ...         print(host['name'], len(host['items']))
+        '''
+        items = list()
+        for host, item in self._walk():
+            if item is not None:
+                item['host'] = host
+                items.append(item)
+            else:
+                yield {
+                    'name': host['host-report-name'],
+                    'properties': host,
+                    'items': items
+                }
+                items = list()
+
+    def columns(self, size=1000, host_fields=None):
+        '''
+        Returns a generator of column batches of up to the number of items
+        specified.  Each batch is a dictionary of lists keyed by the field
+        name, with one entry in each list per item.  If an item doesn't have
+        a field that other items in the batch have, then the entry for that
+        item will be None.  This format can be handed directly to the likes of
+        ``pandas.DataFrame`` or used for bulk inserts into a database.
+
+        Args:
+            size (int, optional):
+                The maximum number of items within each batch.  The default is
+                ``1000``.
+            host_fields (list, optional):
+                The host properties to add as columns.  The default is to only
+                add the ``host-report-name`` column.
+
+        Yields:
+            :obj:`dict`:
+                The column batch.
+
+        Examples:
+            >>> with open('example.nessus', 'rb') as nessus_file:
+            ...     report = NessusReportv2(nessus_file)
+            ...     for batch in report.columns(5000, ['host-ip']):
+            ...         df = pandas.DataFrame(batch)
+        '''
+        if host_fields is None:
+            host_fields = ['host-report-name']
+        rows = list()
+        for host, item in self._walk():
+            if item is None:
+                continue
+            row = dict((f, host.get(f)) for f in host_fields)
+            row.update(item)
+            rows.append(row)
+            if len(rows) >= size:
+                yield self._columnize(rows)
+                rows = list()
+        if rows:
+            yield self._columnize(rows)
+
+    @staticmethod
+    def _columnize(rows):
+        '''
+        Converts the list of row dictionaries into a dictionary of columns.
+        '''
+        fields = list()
+        seen = set()
+        for row in rows:
+            for field in row:
+                if field not in seen:
+                    seen.add(field)
+                    fields.append(field)
+        return dict((f, [row.get(f) for row in rows]) for f in fields)
+
+
+class _SegmentReader(io.RawIOBase):
+    '''
+    A read-only file-like object presenting the segment of the file between
+    the start and end offsets, wrapped within the prefix and suffix, without
+    reading the segment into memory.
+    '''
+    def __init__(self, fobj, start, end, prefix, suffix):
+        fobj.seek(start)
+        self._fobj = fobj
+        self._parts = [io.BytesIO(prefix), fobj, io.BytesIO(suffix)]
+        self._remaining = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        while self._parts:
+            part = self._parts[0]
+            size = len(buf)
+            if part is self._fobj:
+                size = min(size, self._remaining)
+            data = part.read(size) if size else b''
+            if data:
+                if part is self._fobj:
+                    self._remaining -= len(data)
+                buf[:len(data)] = data
+                return len(data)
+            self._parts.pop(0)
+        return 0
+
+
+def _parse_segment(path, start=None, end=None, header=None, fast=True,
+                   spool_dir=None):
+    '''
+    Parses the file (or the segment of the file between the start and end
+    offsets) within a worker process.  Segments are wrapped within the
+    NessusClientData_v2 and Report tags (using the original Report tag so that
+    the namespaces are retained) before parsing.  The file is streamed through
+    the parser and each item is spooled to a temporary file as it's parsed, so
+    that neither the worker nor the parent needs to hold a whole file's items
+    in memory.  Returns the path of the spool file and the number of items.
+    '''
+    fd, spool = tempfile.mkstemp(
+        prefix='nessus-', suffix='.spool', dir=spool_dir)
+    count = 0
+    try:
+        with os.fdopen(fd, 'wb') as out, open(path, 'rb') as fobj:
+            if start is not None:
+                fobj = io.BufferedReader(_SegmentReader(fobj, start, end,
+                    b'<NessusClientData_v2>' + header,
+                    b'</Report></NessusClientData_v2>'))
+            for item in NessusReportv2(fobj, fast=fast):
+                pickle.dump(item, out, pickle.HIGHEST_PROTOCOL)
+                count += 1
+    except Exception:
+        os.remove(spool)
+        raise
+    return spool, count
+
+
+def _read_spool(spool):
+    '''
+    Yields the items from the spool file, removing the file once it has been
+    read (or the caller has stopped reading).
+    '''
+    try:
+        with open(spool, 'rb') as fobj:
+            while True:
+                try:
+                    yield pickle.load(fobj)
+                except EOFError:
+                    return
+    finally:
+        _remove(spool)
+
+
+def _remove(path):
+    '''
+    Removes the file, ignoring it if it's already gone.
+    '''
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class NessusReportv2Pool(object):
+    '''
+    Parses many Nessus version 2 files across a pool of worker processes and
+    returns the items from all of them as a single stream.  Large files may
+    also be split on the ReportHost boundaries so that the hosts within a
+    single file are parsed in parallel.
+
+    Each file (or segment of a file) is streamed through the parser within a
+    worker, and the parsed items are spooled to a temporary file that the
+    items are then read back from one at a time.  Files that aren't split
+    (including files that can't be split because the ReportHost boundaries
+    couldn't be found) are therefore parsed with the same bounded memory as
+    :obj:`NessusReportv2`, at the cost of the temporary disk space for the
+    spooled items.
+
+    Each file (or segment of a file) is parsed independently.  If a file
+    fails to parse, then the error is logged and recorded within the
+    ``errors`` attribute and the pool moves on to the next file.  Items that
+    had already been parsed from the failing file (or segment) are
+    discarded.
+
+    Args:
+        files (list):
+            The list of paths to the Nessus files to parse.
+        workers (int, optional):
+            The number of worker processes to use.  If left unspecified, the
+            number of CPUs is used.
+        ordered (bool, optional):
+            Should the items be returned in the order of the files (and the
+            hosts within the files)?  If set to ``False``, the items will be
+            returned in the order that the files finish parsing.  The default
+            is ``True``.
+        split (int, optional):
+            If specified, files larger than this many bytes will be split on
+            the ReportHost boundaries into segments of roughly this size, each
+            of which is parsed separately.
+        fast (bool, optional):
+            Should the fast parser be used within the workers?  Refer to
+            :obj:`NessusReportv2` for details.  The default is ``True``.
+        spool_dir (str, optional):
+            The directory to spool the parsed items within.  If left
+            unspecified, the system's temporary directory is used.
+
+    Attributes:
+        errors (list):
+            A list of tuples of the path and the exception for every file (or
+            segment) that failed to parse.
+
+    Examples:
+        >>> files = glob.glob('/path/to/reports/*.nessus')
+        >>> pool = NessusReportv2Pool(files, ordered=False)
+        >>> for item in pool:
+        ...     print(item)
+        >>> pool.stats
+        {'files': 200, 'failed': 1, 'segments': 200, 'items': 8462901, ...}
+
+        Splitting a single large file into 64MB segments:
+
+        >>> for item in NessusReportv2Pool(['huge.nessus'], split=64 * 2**20):
+        ...     print(item)
+    '''
+    def __init__(self, files, workers=None, ordered=True, split=None,
+                 fast=True, spool_dir=None):
+        self._files = list(files)
+        self._workers = workers or os.cpu_count() or 1
+        self._ordered = ordered
+        self._split = split
+        self._fast = fast
+        self._spool_dir = spool_dir
+        self._log = logging.getLogger('{}.{}'.format(
+            self.__module__, self.__class__.__name__))
+        self._iter = None
+        self.errors = list()
+        self._stats = {
+            'files': 0,
+            'failed': 0,
+            'segments': 0,
+            'items': 0,
+            'bytes': 0,
+        }
+        self._started = None
+        self._finished = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    def next(self):
+        '''
+        Returns the next item from the pool.
+        '''
+        if not self._iter:
+            self._iter = self._run()
+        return next(self._iter)
+
+    @property
+    def stats(self):
+        '''
+        The throughput counters for the pool.
+
+        Returns:
+            :obj:`dict`:
+                The number of ``files`` processed, the number of files that
+                ``failed``, the number of ``segments`` parsed, the number of
+                ``items`` returned, the number of ``bytes`` parsed, the
+                ``elapsed`` seconds, and the ``items_per_sec`` and
+                ``bytes_per_sec`` throughput.
+        '''
+        stats = dict(self._stats)
+        elapsed = 0
+        if self._started:
+            elapsed = (self._finished or time.time()) - self._started
+        stats['elapsed'] = elapsed
+        stats['items_per_sec'] = stats['items'] / elapsed if elapsed else 0
+        stats['bytes_per_sec'] = stats['bytes'] / elapsed if elapsed else 0
+        return stats
+
+    def _segments(self, path):
+        '''
+        Returns the list of segments for the file.  Each segment is a tuple of
+        the path, start offset, end offset, and the Report tag.  If the file
+        isn't being split, then a single segment without offsets is returned.
+        '''
+        size = os.path.getsize(path)
+        if not self._split or size <= self._split:
+            return [(path, None, None, None)]
+
+        with open(path, 'rb') as fobj:
+            mm = mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # The Report tag is retained so that any namespaces that were
+                # declared within it carry forward into each segment.
+                tag_start = mm.find(b'<Report ')
+                tag_end = mm.find(b'>', tag_start) + 1
+                report_end = mm.rfind(b'</Report>')
+                if tag_start < 0 or report_end < 0:
+                    return [(path, None, None, None)]
+                header = mm[tag_start:tag_end]
+
+                segments = list()
+                pos = mm.find(b'<ReportHost', tag_end, report_end)
+                while 0 <= pos < report_end:
+                    nxt = mm.find(b'<ReportHost', pos + self._split, report_end)
+                    if nxt < 0:
+                        nxt = report_end
+                    segments.append((path, pos, nxt, header))
+                    pos = nxt
+                return segments
+            finally:
+                mm.close()
+
+    def _tasks(self):
+        '''
+        Generates the segments to parse for all of the files, recording any
+        files that couldn't be read.
+        '''
+        for path in self._files:
+            try:
+                segments = self._segments(path)
+            except (IOError, OSError, ValueError) as err:
+                self._failed(path, err)
+                continue
+            self._stats['files'] += 1
+            for segment in segments:
+                yield segment
+
+    def _failed(self, path, err, count=True):
+        '''
+        Records the failure for the file.
+        '''
+        self._log.error('Failed to parse {}: {}'.format(path, str(err)))
+        if count:
+            self._stats['failed'] += 1
+        self.errors.append((path, err))
+
+    def _run(self):
+        '''
+        Submits the segments to the process pool, keeping a couple of segments
+        per worker in flight, and yields the items as the segments complete.
+        '''
+        self._started = time.time()
+        tasks = self._tasks()
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=self._workers) as pool:
+            def fill():
+                while len(pending) < self._workers * 2:
+                    try:
+                        path, start, end, header = next(tasks)
+                    except StopIteration:
+                        return
+                    future = pool.submit(
+                        _parse_segment, path, start, end, header, self._fast,
+                        self._spool_dir)
+                    future.path = path
+                    future.size = (end - start if start is not None
+                                   else os.path.getsize(path))
+                    pending.append(future)
+
+            fill()
+            try:
+                for item in self._drain(pending, fill):
+                    yield item
+            finally:
+                # If the caller stopped iterating early, then there is no
+                # reason to wait on the segments that haven't started yet.
+                # The segments that were already parsed (or are still being
+                # parsed) need to have their spool files removed.
+                for future in pending:
+                    future.cancel()
+                pool.shutdown(wait=True)
+                for future in pending:
+                    if not future.cancelled() and not future.exception():
+                        _remove(future.result()[0])
+        self._finished = time.time()
+
+    def _drain(self, pending, fill):
+        '''
+        Yields the items from the pending segments as they complete, refilling
+        the pending queue as each segment is consumed.
+        '''
+        failed = set()
+        while pending:
+            if self._ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+
+            try:
+                spool, _ = future.result()
+            except Exception as err:
+                # A file is only counted as failed once, even if multiple
+                # segments of the file failed to parse.
+                self._failed(future.path, err, future.path not in failed)
+                failed.add(future.path)
+                spool = None
+            self._stats['segments'] += 1
+            self._stats['bytes'] += future.size
+            fill()
+
+            if spool:
+                items = _read_spool(spool)
+                try:
+                    for item in items:
+                        self._stats['items'] += 1
+                        yield item
+                finally:
+                    items.close()
@@ -80,11 +80,61 @@ Methods available on ``sc.analysis``:
     .. automethod:: scan
     .. automethod:: vulns
 '''
+from concurrent.futures import ThreadPoolExecutor
 from .base import SCEndpoint, SCResultsIterator
 from tenable.utils import dict_merge
 from tenable.errors import UnexpectedValueError
 
 class AnalysisResultsIterator(SCResultsIterator):
+    '''
+    The analysis results iterator walks through the analysis API results one
+    window of records at a time.  If more than one worker is specified, then
+    once the total number of records is known the following windows will be
+    requested concurrently.  The results are still returned in order.  If the
+    iteration is stopped early, then the iterator should either be closed or
+    used as a context manager so that the outstanding windows are cancelled.
+    '''
+    _workers = 1
+    _pool = None
+    _pending = None
+
+    def _next_query(self):
+        '''
+        Construct the query for the next window of records and advance the
+        offset to the window following it.
+        '''
+        query = dict(self._query)
+        query['query'] = dict(self._query['query'])
+        query['query']['startOffset'] = self._offset
+        query['query']['endOffset'] = self._limit + self._offset
+        self._offset += self._limit
+        return query
+
+    def _schedule(self):
+        '''
+        Request the windows following the current page in the background.
+        '''
+        if not self._pool:
+            self._pool = ThreadPoolExecutor(max_workers=self._workers)
+            self._pending = list()
+        while (len(self._pending) < self._workers
+          and self._offset < self.total
+          and not (self._pages_total and self._pages_requested
+                   + len(self._pending) >= self._pages_total)):
+            self._pending.append(self._pool.submit(
+                self._api.post, 'analysis', json=self._next_query()))
+
+    def _close_pool(self):
+        '''
+        Cancel any outstanding requests and shut down the worker pool.
+        '''
+        if self._pool:
+            for future in self._pending:
+                future.cancel()
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self._pending = list()
+
     def _get_page(self):
         '''
         Retrieves the next page of results when the current page has been
@@ -96,20 +146,18 @@ class AnalysisResultsIterator(SCResultsIterator):
         if self._pages_total and self._pages_requested >= self._pages_total:
             raise StopIteration()
 
-        # Now we need to do is construct the query with the current offset
-        # and limits
-        query = self._query
-        query['query']['startOffset'] = self._offset
-        query['query']['endOffset'] = self._limit + self._offset
-
-        # Lets actually call the API for the data at this point.
-        resp = self._api.post('analysis', json=query).json()
+        # Lets actually call the API for the data at this point.  If the
+        # window was already requested by one of the workers, then we will
+        # simply wait for that response instead.
+        if self._pending:
+            resp = self._pending.pop(0).result().json()
+        else:
+            resp = self._api.post('analysis', json=self._next_query()).json()
 
         # Now that we have the response, lets reset any counters we need to,
         # and increment things like the page counter, offset, etc.
         self.page_count = 0
         self._pages_requested += 1
-        self._offset += self._limit
         self._raw = resp
         self.page = resp['response']['results']
 
@@ -141,6 +189,22 @@ class AnalysisResultsIterator(SCResultsIterator):
             else:
                 self.total = self.count + self._limit + 1
 
+        # Now that we know the total, the remaining windows can be requested
+        # by the workers while this page is being worked through.  If the
+        # total had to be estimated, then this will only look one window ahead.
+        if self._workers > 1:
+            self._schedule()
+
+    def next(self):
+        '''
+        Ask for the next record
+        '''
+        try:
+            return super(AnalysisResultsIterator, self).next()
+        except StopIteration:
+            self._close_pool()
+            raise
+
 
 class AnalysisAPI(SCEndpoint):
     def _analysis(self, *filters, **kw):
@@ -180,6 +244,8 @@ class AnalysisAPI(SCEndpoint):
         if 'pages' in kw:
             pages = self._check('pages', kw['pages'], int)
 
+        workers = self._check('workers', kw.get('workers'), int, default=1)
+
         if payload.get('sourceType') in ['individual']:
             payload['query']['view'] = self._check(
                 'view', kw.get('view', 'all'), str,
@@ -200,6 +266,7 @@ class AnalysisAPI(SCEndpoint):
                 _limit=limit,
                 _query=payload,
                 _pages_total=pages,
+                _workers=workers,
             )
 
     def vulns(self, *filters, **kw):
@@ -222,6 +289,11 @@ class AnalysisAPI(SCEndpoint):
                 mutually exclusive with the tuple filters.
             pages (int, optional):
                 The number of pages to query.  Default is all.
+            workers (int, optional):
+                The number of pages to request concurrently.  Once the total
+                number of records is known, the following pages will be
+                requested in parallel while still being returned in order.
+                Default is 1.
             limit (int, optional):
                 How many entries should be in each page?  Default is 200.
             offset (int, optional):
@@ -372,6 +444,11 @@ class AnalysisAPI(SCEndpoint):
                 (field, operator, value).
             pages (int, optional):
                 The number of pages to query.  Default is all.
+            workers (int, optional):
+                The number of pages to request concurrently.  Once the total
+                number of records is known, the following pages will be
+                requested in parallel while still being returned in order.
+                Default is 1.
             limit (int, optional):
                 How many entries should be in each page?  Default is 200.
             offset (int, optional):
@@ -450,6 +527,11 @@ class AnalysisAPI(SCEndpoint):
                 (field, operator, value).
             pages (int, optional):
                 The number of pages to query.  Default is all.
+            workers (int, optional):
+                The number of pages to request concurrently.  Once the total
+                number of records is known, the following pages will be
+                requested in parallel while still being returned in order.
+                Default is 1.
             limit (int, optional):
                 How many entries should be in each page?  Default is 200.
             offset (int, optional):
@@ -552,6 +634,11 @@ class AnalysisAPI(SCEndpoint):
                 A date in YYYYMM format.  the default is simply "all".
             pages (int, optional):
                 The number of pages to query.  Default is all.
+            workers (int, optional):
+                The number of pages to request concurrently.  Once the total
+                number of records is known, the following pages will be
+                requested in parallel while still being returned in order.
+                Default is 1.
             limit (int, optional):
                 How many entries should be in each page?  Default is 200.
             offset (int, optional):
@@ -591,6 +678,11 @@ class AnalysisAPI(SCEndpoint):
                 (field, operator, value).
             pages (int, optional):
                 The number of pages to query.  Default is all.
+            workers (int, optional):
+                The number of pages to request concurrently.  Once the total
+                number of records is known, the following pages will be
+                requested in parallel while still being returned in order.
+                Default is 1.
             limit (int, optional):
                 How many entries should be in each page?  Default is 200.
             offset (int, optional):
@@ -1,39 +1,134 @@
+import codecs
+import json
+import re
 from restfly.utils import dict_merge, url_validator
 
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_JSON_NUMBER_END = ' \t\n\r,]'
+
+_SETTING_TYPES = (
+    'file',
+    'checkbox',
+    'entry',
+    'textarea',
+    'medium-fixed-entry',
+    'password',
+)
+
 def policy_settings(item):
     '''
-    Recursive function to attempt to pull out the various settings from scan
-    policy settings in the editor format.
+    Walks the editor document and pulls out the various settings from scan
+    policy settings in the editor format.  The document is walked depth-first
+    with an explicit stack, writing each setting straight into the response
+    dictionary, so that the settings found later in the document override the
+    ones found earlier without needing to merge each sub-document's settings.
     '''
     resp = dict()
-    if 'id' in item and ('default' in item
-        or ('type' in item and item['type'] in [
-            'file',
-            'checkbox',
-            'entry',
-            'textarea',
-            'medium-fixed-entry',
-            'password'])):
-        # if we find both an 'id' and a 'default' attribute, or if we find
-        # a 'type' attribute matching one of the known attribute types, then
-        # we will parse out the data and append it to the response dictionary
-        if not 'default' in item:
-            item['default'] = ""
-        resp[item['id']] = item['default']
-
-    for key in item.keys():
-        # here we will attempt to recurse down both a list of sub-
-        # documents and an explicitly defined sub-document within the
-        # editor data-structure.
-        if key == 'modes':
-            continue
-        if (isinstance(item[key], list)
-            and len(item[key]) > 0
-            and isinstance(item[key][0], dict)):
-            for i in item[key]:
-                resp = dict_merge(resp, policy_settings(i))
-        if isinstance(item[key], dict):
-            resp = dict_merge(resp, policy_settings(item[key]))
+    stack = [item]
+    while stack:
+        node = stack.pop()
+        if 'id' in node and ('default' in node
+            or node.get('type') in _SETTING_TYPES):
+            # if we find both an 'id' and a 'default' attribute, or if we find
+            # a 'type' attribute matching one of the known attribute types,
+            # then we will parse out the data and add it to the response
+            # dictionary.
+            value = node.get('default', '')
+            current = resp.get(node['id'])
+            if isinstance(current, dict) and isinstance(value, dict):
+                dict_merge(current, value)
+            else:
+                resp[node['id']] = value
+
+        # here we will queue up both a list of sub-documents and an explicitly
+        # defined sub-document within the editor data-structure.  They're
+        # pushed in reverse so that they are walked in the order they appear.
+        children = list()
+        for key, value in node.items():
+            if key == 'modes':
+                continue
+            if isinstance(value, list):
+                if len(value) > 0 and isinstance(value[0], dict):
+                    children.extend(value)
+            elif isinstance(value, dict):
+                children.append(value)
+        children.reverse()
+        stack.extend(children)
 
     # Return the key-value pair.
-    return resp
\ No newline at end of file
+    return resp
+
+def json_array_iterator(chunks):
+    '''
+    Incrementally decodes a JSON array from an iterable of byte (or string)
+    chunks, such as ``Response.iter_content()``, and yields each element of
+    the array as soon as it has been read.  Only the element currently being
+    decoded is held in memory, instead of the whole document.
+
+    Raises:
+        :obj:`json.JSONDecodeError`:
+            If the document is not a valid JSON array.
+    '''
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder('utf-8')()
+    buf = ''
+    state = 'open'
+    final = False
+    chunks = iter(chunks)
+
+    while not final:
+        chunk = next(chunks, None)
+        if chunk is None:
+            final = True
+            buf += text.decode(b'', final=True)
+        elif isinstance(chunk, bytes):
+            buf += text.decode(chunk)
+        else:
+            buf += chunk
+
+        pos = 0
+        while True:
+            pos = _JSON_WHITESPACE.match(buf, pos).end()
+            if pos >= len(buf):
+                break
+            char = buf[pos]
+            if state == 'open':
+                # The document must open with the array bracket.
+                if char != '[':
+                    raise json.JSONDecodeError('Expecting "["', buf, pos)
+                state = 'first'
+                pos += 1
+            elif state == 'done':
+                raise json.JSONDecodeError('Extra data', buf, pos)
+            elif char == ']' and state in ['first', 'separator']:
+                state = 'done'
+                pos += 1
+            elif state == 'separator':
+                if char != ',':
+                    raise json.JSONDecodeError('Expecting "," delimiter', buf, pos)
+                state = 'value'
+                pos += 1
+            else:
+                # Attempt to decode the next element.  If the element is
+                # incomplete, then we need to read more data.
+                try:
+                    obj, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # A number is decoded from any valid prefix of itself (``1``
+                # from ``1e5`` or ``0`` from ``0.1``), so unless this is the
+                # last chunk, a number is only accepted once it's followed by
+                # whitespace, a delimiter, or the closing bracket.
+                if not final and (end >= len(buf) or (
+                  isinstance(obj, (int, float)) and not isinstance(obj, bool)
+                  and buf[end] not in _JSON_NUMBER_END)):
+                    break
+                yield obj
+                state = 'separator'
+                pos = end
+        buf = buf[pos:]
+
+    if state != 'done':
+        raise json.JSONDecodeError('Unterminated array', buf, len(buf))
@@ -0,0 +1,61 @@
+from tenable.base.v1 import APIEndpoint
+from tenable.errors import UnexpectedValueError
+import pytest, uuid
+
+
+@pytest.fixture
+def endpoint():
+    return APIEndpoint(None)
+
+
+def test_check_fast_path(endpoint):
+    value = str(uuid.uuid4())
+    assert endpoint._check('id', value, 'uuid') is value
+    assert endpoint._check('num', 1, int) == 1
+    assert endpoint._check('name', None, str, default='a') == 'a'
+
+
+def test_check_recast(endpoint):
+    assert endpoint._check('num', '1', int) == 1
+    assert endpoint._check('flag', 'yes', bool) is True
+
+
+def test_check_errors(endpoint):
+    with pytest.raises(UnexpectedValueError):
+        endpoint._check('id', 'nope', 'uuid')
+    with pytest.raises(TypeError):
+        endpoint._check('id', 1, 'uuid')
+    with pytest.raises(UnexpectedValueError):
+        endpoint._check('name', 'abc', str, pattern=r'^\d+$')
+
+
+def test_check_expected_type_list_not_modified(endpoint):
+    etypes = ['uuid', int]
+    endpoint._check('id', str(uuid.uuid4()), etypes)
+    assert etypes == ['uuid', int]
+
+
+def test_check_choices(endpoint):
+    assert endpoint._check('sev', 'HIGH', str,
+        choices=['low', 'high'], case='lower') == 'high'
+    assert endpoint._check('sevs', ['low'], list,
+        choices=['low', 'high']) == ['low']
+    assert endpoint._check('item', {'a': 1}, dict,
+        choices=[{'a': 1}]) == {'a': 1}
+    with pytest.raises(UnexpectedValueError):
+        endpoint._check('sev', 'medium', str, choices=['low', 'high'])
+    with pytest.raises(UnexpectedValueError):
+        endpoint._check('sevs', ['low', ['high']], list,
+            choices=['low', 'high'])
+
+
+def test_check_list(endpoint):
+    values = [str(uuid.uuid4()) for _ in range(10)]
+    assert endpoint._check_list('asset', values, 'uuid') == values
+    assert endpoint._check_list('num', [1, '2'], int) == [1, 2]
+    assert endpoint._check_list('sev', ['LOW'], str,
+        choices=['low'], case='lower') == ['low']
+    with pytest.raises(UnexpectedValueError):
+        endpoint._check_list('asset', values + ['nope'], 'uuid')
+    with pytest.raises(TypeError):
+        endpoint._check_list('asset', values + [1], 'uuid')
@@ -0,0 +1,73 @@
+from tenable.base.v1 import APISession
+import json, logging, pytest, responses
+
+
+@pytest.fixture
+def session():
+    return APISession(url='https://localhost')
+
+
+@responses.activate
+def test_request_log_skipped_when_disabled(session, monkeypatch):
+    responses.add(responses.POST, 'https://localhost/example')
+    calls = list()
+    monkeypatch.setattr(session, '_request_log',
+        lambda *a: calls.append(a) or '')
+    session._log.setLevel(logging.INFO)
+    session.post('example', json={'a': 1})
+    assert calls == []
+
+
+def test_request_log_full(session):
+    msg = json.loads(session._request_log('POST', 'example',
+        {'params': {'a': 1}, 'json': {'b': [1, 2]}}))
+    assert msg == {
+        'method': 'POST',
+        'url': 'https://localhost/example',
+        'params': {'a': 1},
+        'body': {'b': [1, 2]},
+    }
+
+
+def test_request_log_truncated(session):
+    session._log_body_limit = 100
+    msg = json.loads(session._request_log('POST', 'example',
+        {'json': {'assets': [{'fqdn': 'host{}'.format(i)}
+            for i in range(50000)]}}))
+    assert isinstance(msg['body'], str)
+    assert len(msg['body']) == 103
+    assert msg['body'].endswith('...')
+
+
+def test_request_log_redacted(session):
+    session._restricted_paths = ['token']
+    msg = json.loads(session._request_log('POST', 'token',
+        {'json': {'password': 'secret'}}))
+    assert msg['params'] == 'REDACTED'
+    assert msg['body'] == 'REDACTED'
+
+
+@responses.activate
+def test_request_hook(session, monkeypatch):
+    monkeypatch.setattr('tenable.base.v1.time.sleep', lambda s: None)
+    responses.add(responses.GET, 'https://localhost/example', status=503,
+        headers={'x-request-uuid': 'abc'})
+    responses.add(responses.GET, 'https://localhost/example', json={})
+    events = list()
+    session.request_hook = events.append
+    session.get('example')
+    assert [e['status'] for e in events] == [503, 200]
+    assert [e['attempt'] for e in events] == [0, 1]
+    assert events[0]['request_uuid'] == 'abc'
+    assert events[0]['path'] == 'example'
+    assert events[0]['elapsed'] >= 0
+
+
+@responses.activate
+def test_request_hook_errors_ignored(session):
+    responses.add(responses.GET, 'https://localhost/example', json={})
+
+    def hook(event):
+        raise ValueError('broken')
+    session.request_hook = hook
+    assert session.get('example').json() == {}
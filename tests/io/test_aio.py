@@ -0,0 +1,133 @@
+'''
+test aio
+'''
+import asyncio
+import threading
+import uuid
+import pytest
+import responses
+from tenable.errors import NotFoundError
+from tenable.io.aio import AsyncTenableIO, AsyncResultsIterator
+
+
+@pytest.fixture(name='aio')
+def fixture_aio():
+    '''
+    fixture to return the asyncio client
+    '''
+    client = AsyncTenableIO(
+        'ffffffffffffffffffffffffffffffff',
+        'ffffffffffffffffffffffffffffffff',
+        vendor='pytest',
+        product='pytenable-automated-testing',
+        backoff=0.01,
+        workers=4)
+    yield client
+    client.close()
+
+
+def run(coro):
+    '''
+    runs the coroutine within a new event loop
+    '''
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@responses.activate
+def test_aio_endpoint_gather(aio):
+    '''test to run several endpoint calls concurrently'''
+    tags = [str(uuid.uuid4()) for _ in range(5)]
+    for tag in tags:
+        responses.add(
+            method='GET',
+            url='https://cloud.tenable.com/tags/values/{}'.format(tag),
+            json={'uuid': tag}
+        )
+
+    async def main():
+        return await asyncio.gather(*[aio.tags.details(t) for t in tags])
+
+    resp = run(main())
+    assert [t['uuid'] for t in resp] == tags
+
+
+@responses.activate
+def test_aio_iterator(aio):
+    '''test to walk an iterator asynchronously'''
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/vulns/export/0000/status',
+        json={'status': 'FINISHED', 'chunks_available': [1, 2]}
+    )
+    for chunk in [1, 2]:
+        responses.add(
+            method='GET',
+            url='https://cloud.tenable.com/vulns/export/0000/chunks/{}'.format(chunk),
+            json=[{'chunk': chunk}]
+        )
+
+    async def main():
+        vulns = await aio.exports.vulns(uuid='0000')
+        assert isinstance(vulns, AsyncResultsIterator)
+        return [v['chunk'] async for v in vulns]
+
+    assert run(main()) == [1, 2]
+
+
+@responses.activate
+def test_aio_retry_headers(aio):
+    '''test that retried calls carry the same retry headers as TenableIO'''
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/scans',
+        status=429,
+        headers={'X-Request-Uuid': 'abcdef', 'Retry-After': '0'}
+    )
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/scans',
+        json={'scans': []}
+    )
+    resp = run(aio.get('scans'))
+    assert resp.json() == {'scans': []}
+    assert responses.calls[1].request.headers['X-Tio-Retry-Count'] == '1'
+    assert responses.calls[1].request.headers['X-Tio-Last-Request-Uuid'] == 'abcdef'
+
+
+@responses.activate
+def test_aio_errors(aio):
+    '''test that errors are raised from the coroutine'''
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/scans/1',
+        status=404
+    )
+    with pytest.raises(NotFoundError):
+        run(aio.get('scans/1'))
+
+
+def test_aio_context_close_off_loop(monkeypatch):
+    '''test that exiting the context shuts down the pool off the event loop'''
+    closed = list()
+    client = AsyncTenableIO(
+        'ffffffffffffffffffffffffffffffff',
+        'ffffffffffffffffffffffffffffffff',
+        workers=2)
+    close = client.close
+    monkeypatch.setattr(client, 'close',
+        lambda: closed.append(threading.get_ident()) or close())
+
+    async def main():
+        async with client:
+            pass
+        return threading.get_ident()
+
+    loop_thread = run(main())
+    assert len(closed) == 1
+    assert closed[0] != loop_thread
+    with pytest.raises(RuntimeError):
+        client._executor.submit(print)
@@ -1,10 +1,13 @@
 '''
 test assets
 '''
+import json
 import time
 import uuid
 import pytest
-from tenable.errors import UnexpectedValueError, PermissionError
+import responses
+from tenable.errors import UnexpectedValueError, PermissionError, ServerError
+from tenable.io.assets import AssetImporter
 from tests.checker import check, single
 from tests.io.test_networks import fixture_network
 
@@ -396,3 +399,154 @@ def test_assets_details_success_fields(api):
     check(resp, 'gcp_instance_id', list)
     check(resp, 'security_protections', list)
     check(resp, 'exposure_confidence_value', float, allow_none=True)
+
+
+def cmdb(count):
+    '''
+    generates asset records as a CMDB dump would be read
+    '''
+    for i in range(count):
+        yield {'fqdn': ['host{}.example.com'.format(i)],
+               'ipv4': ['192.168.0.{}'.format(i)]}
+
+
+def import_callback(request):
+    '''
+    returns a job uuid for each import, failing the batch containing host 9
+    '''
+    body = json.loads(request.body)
+    first = body['assets'][0]['fqdn'][0].split('.')[0]
+    if any(a['fqdn'][0].startswith('host9.') for a in body['assets']):
+        return (500, {}, json.dumps({'error': 'server error'}))
+    return (200, {}, json.dumps({'asset_import_job_uuid': 'job-' + first}))
+
+
+def test_assets_importer_batches(api):
+    '''
+    test that the assets are serialized into batches as they are read
+    '''
+    read = list()
+
+    def assets():
+        for asset in cmdb(5):
+            read.append(asset)
+            yield asset
+
+    batches = AssetImporter(api, 'cmdb', assets(), batch_size=2).batches()
+    count, body, rejected = next(batches)
+    assert count == 2
+    assert len(read) == 3
+    assert json.loads(body) == {'source': 'cmdb', 'assets': list(cmdb(2))}
+    assert rejected == []
+    assert [c for c, b, r in batches] == [2, 1]
+
+
+def test_assets_importer_max_bytes(api):
+    '''
+    test that the batches are split to stay within the byte limit
+    '''
+    importer = AssetImporter(api, 'cmdb', cmdb(10), max_bytes=200)
+    batches = list(importer.batches())
+    assert sum(c for c, b, r in batches) == 10
+    assert all(len(b) <= 200 for c, b, r in batches)
+    assert len(batches) > 1
+
+
+def test_assets_bulk_import_asset_typeerror(api):
+    '''
+    test that an asset that isn't a dictionary is rejected without a request
+    '''
+    importer = api.assets.bulk_import('cmdb', ['nope'], wait=False)
+    assert len(importer.results) == 1
+    assert importer.results[0]['status'] == 'FAILED'
+    assert importer.results[0]['job_uuid'] is None
+    assert isinstance(importer.results[0]['error'], TypeError)
+    assert importer.stats['rejected_assets'] == 1
+
+
+@responses.activate
+def test_assets_bulk_import_rejected_midstream(api):
+    '''
+    test that invalid assets are recorded against their batch and the rest of
+    the stream is still imported
+    '''
+    responses.add_callback(responses.POST,
+        'https://cloud.tenable.com/import/assets', callback=import_callback)
+    assets = list(cmdb(4))
+    assets.insert(3, 'nope')
+    assets.insert(1, {'fqdn': {1, 2}})
+    importer = api.assets.bulk_import('cmdb', assets, batch_size=2,
+        workers=1, wait=False)
+    results = importer.results
+    assert len(responses.calls) == 2
+    assert [r['assets'] for r in results] == [2, 2]
+    assert [r['status'] for r in results] == ['SUBMITTED', 'SUBMITTED']
+    assert [r['index'] for r in results[0]['rejected']] == [1]
+    assert [r['index'] for r in results[1]['rejected']] == [4]
+    assert isinstance(results[1]['rejected'][0]['error'], TypeError)
+    assert importer.stats['rejected_assets'] == 2
+    assert importer.stats['assets'] == 4
+
+
+@responses.activate
+def test_assets_bulk_import(api):
+    '''
+    test that the batches are imported and the jobs polled to completion
+    '''
+    responses.add_callback(responses.POST,
+        'https://cloud.tenable.com/import/assets', callback=import_callback)
+    for name in ['host0', 'host3', 'host6']:
+        responses.add(responses.GET,
+            'https://cloud.tenable.com/import/asset-jobs/job-{}'.format(name),
+            json={'status': 'PROCESSING'})
+        responses.add(responses.GET,
+            'https://cloud.tenable.com/import/asset-jobs/job-{}'.format(name),
+            json={'status': 'COMPLETE', 'uploaded_assets': 3,
+                  'failed_assets': 0})
+    importer = api.assets.bulk_import('cmdb', cmdb(10), batch_size=3,
+        workers=2, poller={'delay': 0, 'jitter': 0})
+    results = importer.results
+    assert [r['assets'] for r in results] == [3, 3, 3, 1]
+    assert [r['status'] for r in results] == [
+        'COMPLETE', 'COMPLETE', 'COMPLETE', 'FAILED']
+    assert results[1]['job_uuid'] == 'job-host3'
+    assert isinstance(results[3]['error'], ServerError)
+    stats = importer.stats
+    assert stats['batches'] == 4
+    assert stats['failed'] == 1
+    assert stats['assets'] == 10
+    assert stats['uploaded_assets'] == 9
+    assert stats['bytes'] == sum(r['bytes'] for r in results)
+    assert stats['assets_per_sec'] > 0
+
+
+@responses.activate
+def test_assets_bulk_import_midstream_error(api):
+    '''
+    test that a non-api error in one batch doesn't stop the stream
+    '''
+    def callback(request):
+        first = json.loads(request.body)['assets'][0]['fqdn'][0]
+        if first.startswith('host4.'):
+            return (200, {}, json.dumps({'unexpected': 'response'}))
+        return (200, {}, json.dumps(
+            {'asset_import_job_uuid': 'job-' + first.split('.')[0]}))
+
+    responses.add_callback(responses.POST,
+        'https://cloud.tenable.com/import/assets', callback=callback)
+    read = list()
+
+    def assets():
+        for asset in cmdb(10):
+            read.append(asset)
+            yield asset
+
+    importer = api.assets.bulk_import('cmdb', assets(), batch_size=2,
+        workers=1, wait=False)
+    results = importer.results
+    assert len(read) == 10
+    assert [r['status'] for r in results] == [
+        'SUBMITTED', 'SUBMITTED', 'FAILED', 'SUBMITTED', 'SUBMITTED']
+    assert isinstance(results[2]['error'], KeyError)
+    assert results[4]['job_uuid'] == 'job-host8'
+    assert importer.stats['failed'] == 1
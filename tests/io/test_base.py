@@ -1,7 +1,13 @@
 '''
 test base
 '''
+import json
+import threading
+from concurrent.futures import wait
 import pytest
+import responses
+from tenable.errors import PollingTimeout
+from tenable.io.base import StatusPoller, TIOIterator
 
 @pytest.fixture(name='fitem')
 def fixture_fitem():
@@ -67,3 +73,135 @@ def test_base_parse_filter_assets(api, fitem, fset):
         'operator': 'match',
         'value': 'win'
     }]} == getattr(api.agents, '_parse_filters')(fitem, fset, rtype='assets')
+
+@pytest.fixture(name='sleeps')
+def fixture_sleeps(monkeypatch):
+    '''
+    fixture to record the sleep calls made by the status poller
+    '''
+    sleeps = list()
+    monkeypatch.setattr('tenable.io.base.time.sleep', sleeps.append)
+    return sleeps
+
+def test_base_status_poller_backoff(sleeps):
+    '''
+    test the status poller backs off exponentially up to the max delay
+    '''
+    statuses = iter(['running'] * 6 + ['ready'])
+    poller = StatusPoller(delay=1, max_delay=8, jitter=0)
+    assert poller.poll(lambda: next(statuses), lambda s: s == 'ready') == 'ready'
+    assert sleeps == [1, 2, 4, 8, 8, 8]
+
+def test_base_status_poller_jitter(sleeps):
+    '''
+    test the status poller never sleeps longer than the delay with jitter
+    '''
+    statuses = iter(['running'] * 4 + ['ready'])
+    poller = StatusPoller(delay=4, max_delay=4, jitter=0.5)
+    poller.poll(lambda: next(statuses), lambda s: s == 'ready')
+    assert len(sleeps) == 4
+    assert all(2 <= s <= 4 for s in sleeps)
+
+def test_base_status_poller_progress_reset(sleeps):
+    '''
+    test the status poller resets the delay when progress is reported
+    '''
+    statuses = iter([0, 0, 0, 1, 1, 2])
+    poller = StatusPoller(delay=1, max_delay=30, jitter=0,
+        progress=lambda s: s)
+    assert poller.poll(lambda: next(statuses), lambda s: s == 2) == 2
+    assert sleeps == [1, 2, 4, 1, 2]
+
+def test_base_status_poller_deadline(sleeps):
+    '''
+    test the status poller raises a PollingTimeout once past the deadline
+    '''
+    poller = StatusPoller(delay=1, jitter=0, deadline=0)
+    with pytest.raises(PollingTimeout):
+        poller.poll(lambda: 'running', lambda s: s == 'ready')
+    assert sleeps == []
+
+@responses.activate
+def test_base_wait_for_download(api, sleeps):
+    '''
+    test waiting for a file download to become ready
+    '''
+    responses.add('GET', 'https://cloud.tenable.com/scans/1/export/2/status',
+        json={'status': 'loading'})
+    responses.add('GET', 'https://cloud.tenable.com/scans/1/export/2/status',
+        json={'status': 'ready'})
+    assert getattr(api.scans, '_wait_for_download')(
+        'scans/1/export/2/status', 'scans', 1, 2) == 'ready'
+    assert len(sleeps) == 1
+
+def load_paged_responses(total, limit):
+    '''
+    registers an offset/limit paginated listing of the total records given
+    '''
+    def callback(request):
+        offset = int(request.params['offset'])
+        records = [{'id': i} for i in range(offset, min(offset + limit, total))]
+        return (200, {}, json.dumps({
+            'things': records,
+            'pagination': {'total': total, 'offset': offset, 'limit': limit}
+        }))
+    responses.add_callback('GET', 'https://cloud.tenable.com/things',
+        callback=callback)
+
+@responses.activate
+@pytest.mark.parametrize('prefetch', [0, 1, 4])
+def test_base_iterator_prefetch(api, prefetch):
+    '''
+    test the iterator returns the records in order when prefetching pages
+    '''
+    load_paged_responses(total=23, limit=5)
+    things = TIOIterator(api, _limit=5, _offset=0, _query={},
+        _path='things', _resource='things', prefetch=prefetch)
+    assert [t['id'] for t in things] == list(range(23))
+    assert len(responses.calls) == 5
+    assert things._pool is None
+
+@responses.activate
+def test_base_iterator_prefetch_pages_total(api):
+    '''
+    test the iterator honors the page limit when prefetching pages
+    '''
+    load_paged_responses(total=100, limit=10)
+    things = TIOIterator(api, _limit=10, _offset=0, _query={}, _pages_total=3,
+        _path='things', _resource='things', prefetch=8)
+    assert [t['id'] for t in things] == list(range(30))
+    assert len(responses.calls) == 3
+
+@responses.activate
+def test_base_iterator_prefetch_close(api):
+    '''
+    test breaking out of a prefetching iterator cancels the pending pages
+    '''
+    release = threading.Event()
+
+    def callback(request):
+        offset = int(request.params['offset'])
+        if offset > 0:
+            release.wait(5)
+        return (200, {}, json.dumps({
+            'things': [{'id': i} for i in range(offset, offset + 5)],
+            'pagination': {'total': 100, 'offset': offset, 'limit': 5}
+        }))
+    responses.add_callback('GET', 'https://cloud.tenable.com/things',
+        callback=callback)
+    with TIOIterator(api, _limit=5, _offset=0, _query={},
+            _path='things', _resource='things', prefetch=2) as things:
+        for thing in things:
+            break
+        pending = list(things._pending)
+        assert len(pending) == 2
+    assert things._pool is None
+    assert things._pending == []
+
+    # The pages that were already in flight are left to finish, however no
+    # further pages are requested.
+    release.set()
+    running = [f for f in pending if not f.cancelled()]
+    wait(running, timeout=5)
+    assert len(responses.calls) == 1 + len(running)
+
@@ -3,7 +3,12 @@ test editor
 '''
 import uuid
 import pytest
-from tenable.errors import UnexpectedValueError
+import responses
+from tenable.io import TenableIO
+from tenable.io.base import tenant_key
+from tenable.io.editor import EditorAPI
+from tenable.utils import policy_settings
+from tenable.errors import UnexpectedValueError, UnknownError
 
 
 ###
@@ -170,3 +175,284 @@ def test_editor_details(api):
     for each_scan_id in scan_ids_list:
         api.scans.delete(each_scan_id)
 
+
+
+def load_family_responses(etype, id, fids):
+    '''
+    registers the plugin listing responses for the mixed families
+    '''
+    for fid in fids:
+        responses.add(responses.GET,
+            'https://cloud.tenable.com/editor/{}/{}/families/{}'.format(
+                etype, id, fid),
+            json={'plugins': [
+                {'id': fid * 10, 'status': 'enabled'},
+                {'id': fid * 10 + 1, 'status': 'disabled'},
+            ]})
+
+
+@responses.activate
+def test_editor_parse_plugins_mixed(api):
+    '''
+    test that the mixed families are all resolved concurrently
+    '''
+    families = {
+        'Family {}'.format(i): {
+            'id': i, 'status': 'mixed' if i % 2 else 'enabled'}
+        for i in range(1, 11)
+    }
+    load_family_responses('scan', 1, range(1, 11, 2))
+    resp = api.editor.parse_plugins('scan', families, 1)
+    assert list(resp.keys()) == list(families.keys())
+    assert len(responses.calls) == 5
+    assert resp['Family 2'] == {'status': 'enabled'}
+    assert resp['Family 3'] == {
+        'mixedDefault': 'enabled',
+        'status': 'mixed',
+        'individual': {30: 'enabled', 31: 'disabled'},
+    }
+
+
+@responses.activate
+def test_editor_parse_plugins_serial(api, monkeypatch):
+    '''
+    test that the mixed families are resolved without a pool with 1 worker
+    '''
+    monkeypatch.setattr(EditorAPI, 'family_workers', 1)
+    families = {'A': {'id': 1, 'status': 'mixed'},
+                'B': {'id': 2, 'status': 'mixed'}}
+    load_family_responses('scan', 1, [1, 2])
+    resp = api.editor.parse_plugins('scan', families, 1)
+    assert resp['B']['individual'] == {20: 'enabled', 21: 'disabled'}
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_editor_parse_plugins_template_memo(cached_api):
+    '''
+    test that the mixed families for a cached template are only fetched once
+    '''
+    families = {'A': {'id': 1, 'status': 'mixed'},
+                'B': {'id': 2, 'status': 'mixed'}}
+    load_template_responses()
+    load_family_responses('policy', 'abcdef', [2, 3])
+    cached_api.editor.template_details('policy', 'abcdef')
+    first = cached_api.editor.parse_plugins(
+        'policy', families, 'abcdef', template=True)
+    first['A']['individual'][10] = 'disabled'
+    families['C'] = {'id': 3, 'status': 'mixed'}
+    second = cached_api.editor.parse_plugins(
+        'policy', families, 'abcdef', template=True)
+    assert len(responses.calls) == 4
+    assert second['A']['individual'] == {10: 'enabled', 11: 'disabled'}
+    assert second['C']['individual'] == {30: 'enabled', 31: 'disabled'}
+    entry = list(cached_api._template_cache.values())[0]
+    assert sorted(entry['families']) == [1, 2, 3]
+
+
+@responses.activate
+def test_editor_parse_plugins_template_no_cache(api):
+    '''
+    test that the mixed families for a template aren't memoized unless the
+    template cache is enabled
+    '''
+    families = {'A': {'id': 1, 'status': 'mixed'}}
+    load_family_responses('policy', 'abcdef', [1])
+    api.editor.parse_plugins('policy', families, 'abcdef', template=True)
+    api.editor.parse_plugins('policy', families, 'abcdef', template=True)
+    assert len(responses.calls) == 2
+    assert api._template_cache == dict()
+
+
+@responses.activate
+def test_editor_parse_plugins_no_memo(cached_api):
+    '''
+    test that the mixed families for scans are always refetched
+    '''
+    families = {'A': {'id': 1, 'status': 'mixed'}}
+    load_family_responses('scan', 1, [1])
+    cached_api.editor.parse_plugins('scan', families, 1)
+    cached_api.editor.parse_plugins('scan', families, 1)
+    assert len(responses.calls) == 2
+    assert cached_api._template_cache == dict()
+
+
+TEMPLATE = {
+    'uuid': 'abcdef',
+    'settings': {'basic': {'groups': [], 'inputs': [
+        {'id': 'name', 'default': 'example', 'type': 'entry'},
+    ]}},
+    'plugins': {'families': {
+        'A': {'id': 1, 'status': 'mixed'},
+        'B': {'id': 2, 'status': 'enabled'},
+    }},
+}
+
+
+def load_template_responses(etag=None):
+    '''
+    registers the policy template listing and template document responses
+    '''
+    responses.add(responses.GET,
+        'https://cloud.tenable.com/editor/policy/templates',
+        json={'templates': [{'name': 'basic', 'uuid': 'abcdef'}]})
+    responses.add(responses.GET,
+        'https://cloud.tenable.com/editor/policy/templates/abcdef',
+        json=TEMPLATE, headers={'ETag': etag} if etag else {})
+    load_family_responses('policy', 'abcdef', [1])
+
+
+@pytest.fixture
+def cached_api():
+    '''
+    api fixture with the template cache enabled
+    '''
+    return TenableIO('ffffffffffffffffffffffffffffffff',
+                     'ffffffffffffffffffffffffffffffff',
+                     vendor='pytest',
+                     product='pytenable-automated-testing',
+                     template_cache_ttl=3600)
+
+
+@responses.activate
+def test_editor_template_cache_disabled(api):
+    '''
+    test that the templates aren't cached unless the session asks for it
+    '''
+    load_template_responses()
+    api.editor.template_details('policy', 'abcdef')
+    api.editor.template_details('policy', 'abcdef')
+    api.editor.template_list('policy')
+    api.editor.template_list('policy')
+    assert len(responses.calls) == 4
+    assert api._template_cache == dict()
+
+
+@responses.activate
+def test_editor_template_cache(cached_api):
+    '''
+    test that the template documents are only fetched once
+    '''
+    load_template_responses()
+    first = cached_api.editor.template_details('policy', 'abcdef')
+    first['uuid'] = 'changed'
+    second = cached_api.editor.template_details('policy', 'abcdef')
+    assert second == TEMPLATE
+    assert cached_api.editor.template_list('policy') == [
+        {'name': 'basic', 'uuid': 'abcdef'}]
+    cached_api.editor.template_list('policy')
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_editor_template_cache_per_session(cached_api):
+    '''
+    test that the template cache isn't shared between sessions
+    '''
+    other = TenableIO('00000000000000000000000000000000',
+                      '00000000000000000000000000000000',
+                      template_cache_ttl=3600)
+    load_template_responses()
+    cached_api.editor.template_details('policy', 'abcdef')
+    other.editor.template_details('policy', 'abcdef')
+    assert len(responses.calls) == 2
+    assert len(cached_api._template_cache) == 1
+    assert len(other._template_cache) == 1
+
+
+@responses.activate
+def test_editor_template_cache_policy_details(cached_api):
+    '''
+    test that the parsed policy template is cached with the template
+    '''
+    load_template_responses()
+    first = cached_api.policies.template_details('basic')
+    first['plugins']['A']['individual'][10] = 'disabled'
+    second = cached_api.policies.template_details('basic')
+    assert second['settings'] == {'name': 'example'}
+    assert second['plugins']['A']['individual'] == {
+        10: 'enabled', 11: 'disabled'}
+    assert second['plugins']['B'] == {'status': 'enabled'}
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_editor_template_cache_etag_unchanged(cached_api):
+    '''
+    test that a stale template is revalidated with the etag
+    '''
+    cached_api._template_cache_ttl = 0
+    load_template_responses(etag='"v1"')
+    cached_api.policies.template_details('basic')
+    responses.replace(responses.GET,
+        'https://cloud.tenable.com/editor/policy/templates/abcdef',
+        status=304)
+    resp = cached_api.policies.template_details('basic')
+    assert resp['plugins']['A']['individual'] == {
+        10: 'enabled', 11: 'disabled'}
+    calls = [c for c in responses.calls
+             if c.request.url.endswith('/templates/abcdef')]
+    assert len(calls) == 2
+    assert calls[1].request.headers['If-None-Match'] == '"v1"'
+    assert len([c for c in responses.calls
+                if '/families/' in c.request.url]) == 1
+
+
+@responses.activate
+def test_editor_template_cache_etag_changed(cached_api):
+    '''
+    test that a changed template replaces the cached template
+    '''
+    cached_api._template_cache_ttl = 0
+    load_template_responses(etag='"v1"')
+    cached_api.policies.template_details('basic')
+    changed = dict(TEMPLATE, plugins={'families': {
+        'A': {'id': 1, 'status': 'disabled'}}})
+    responses.replace(responses.GET,
+        'https://cloud.tenable.com/editor/policy/templates/abcdef',
+        json=changed, headers={'ETag': '"v2"'})
+    resp = cached_api.policies.template_details('basic')
+    assert resp['plugins'] == {'A': {'status': 'disabled'}}
+    assert 'families' not in cached_api._template_cache[
+        (tenant_key(cached_api), 'policy', 'abcdef')]
+
+
+@responses.activate
+def test_session_unconditional_304(api):
+    '''
+    test that a 304 is only returned for conditional requests
+    '''
+    responses.add(responses.GET, 'https://cloud.tenable.com/test', status=304)
+    assert api.get('test', headers={'If-None-Match': '"v1"'}).status_code == 304
+    with pytest.raises(UnknownError):
+        api.get('test')
+
+
+def test_policy_settings_walk_order():
+    '''
+    test that the settings found later in the document override earlier ones
+    '''
+    doc = {
+        'id': 'top', 'default': 1,
+        'inputs': [
+            {'id': 'a', 'default': 'first'},
+            {'id': 'b', 'type': 'entry'},
+            {'id': 'c', 'type': 'unknown'},
+            {'id': 'd', 'default': {'x': 1}},
+        ],
+        'modes': {'id': 'mode', 'default': 'skipped'},
+        'sections': {'inputs': [
+            {'id': 'a', 'default': 'second'},
+            {'id': 'd', 'default': {'y': 2}},
+        ]},
+        'values': [1, 2, 3],
+    }
+    resp = policy_settings(doc)
+    assert resp == {
+        'top': 1,
+        'a': 'second',
+        'b': '',
+        'd': {'x': 1, 'y': 2},
+    }
+    assert list(resp.keys()) == ['top', 'a', 'b', 'd']
+    assert 'default' not in doc['inputs'][1]
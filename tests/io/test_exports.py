@@ -1,13 +1,19 @@
 '''
 test exports
 '''
+import gzip
+import json
+import os
 import time
 import uuid
+from concurrent.futures import wait
 import pytest
+import responses
 from ..checker import check
-from tenable.io.exports import ExportsIterator
+from tenable.io.exports import ExportsIterator, ExportCheckpoint
 from tests.pytenable_log_handler import log_exception
 from tenable.errors import UnexpectedValueError, TioExportsError
+from tenable.utils import json_array_iterator
 
 
 @pytest.mark.vcr()
@@ -385,3 +391,387 @@ def test_exports_compliance(api):
     except TioExportsError as error:
         print('\nNo data available. Please retry')
         log_exception(error)
+
+
+def load_export_responses(rsps, chunks=3, records=5):
+    '''
+    registers the status and chunk responses for a finished vuln export made
+    up of the number of chunks specified.
+    '''
+    rsps.add(
+        method='GET',
+        url='https://cloud.tenable.com/vulns/export/0000/status',
+        json={'status': 'FINISHED',
+              'chunks_available': list(range(1, chunks + 1))}
+    )
+    for chunk in range(1, chunks + 1):
+        rsps.add(
+            method='GET',
+            url='https://cloud.tenable.com/vulns/export/0000/chunks/{}'.format(chunk),
+            json=[{'chunk': chunk, 'record': i} for i in range(records)]
+        )
+
+
+@responses.activate
+def test_exports_iterator_serial(api):
+    '''test to walk through the export chunks one at a time'''
+    load_export_responses(responses)
+    vulns = api.exports.vulns(uuid='0000')
+    records = [(v['chunk'], v['record']) for v in vulns]
+    assert records == [(c, r) for c in range(1, 4) for r in range(5)]
+    assert vulns.processed == [1, 2, 3]
+
+
+@responses.activate
+def test_exports_iterator_workers(api):
+    '''test to walk through the export chunks using a pool of workers'''
+    load_export_responses(responses, chunks=10)
+    vulns = api.exports.vulns(uuid='0000', workers=4)
+    assert vulns.workers == 4
+    records = [(v['chunk'], v['record']) for v in vulns]
+    assert records == [(c, r) for c in range(1, 11) for r in range(5)]
+    assert vulns.processed == list(range(1, 11))
+    assert vulns._pool is None
+
+
+@responses.activate
+def test_exports_iterator_workers_empty_chunk(api):
+    '''test to skip empty chunks when using a pool of workers'''
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/assets/export/0000/status',
+        json={'status': 'FINISHED', 'chunks_available': [1, 2, 3]}
+    )
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/assets/export/0000/chunks/1',
+        json=[{'id': 1}]
+    )
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/assets/export/0000/chunks/2',
+        json=[]
+    )
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/assets/export/0000/chunks/3',
+        json=[{'id': 3}]
+    )
+    assets = api.exports.assets(uuid='0000', workers=2)
+    assert [a['id'] for a in assets] == [1, 3]
+
+
+@responses.activate
+def test_exports_iterator_workers_status_error(api):
+    '''test to shut down the worker pool when the export errors midstream'''
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/vulns/export/0000/status',
+        json={'status': 'PROCESSING', 'chunks_available': [1, 2]}
+    )
+    for chunk in [1, 2]:
+        responses.add(
+            method='GET',
+            url='https://cloud.tenable.com/vulns/export/0000/chunks/{}'.format(chunk),
+            json=[{'chunk': chunk, 'record': i} for i in range(5)]
+        )
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/vulns/export/0000/status',
+        json={'status': 'ERROR', 'chunks_available': [1, 2]}
+    )
+    vulns = api.exports.vulns(uuid='0000', workers=4)
+    for _ in range(5):
+        assert vulns.next()['chunk'] == 1
+
+    # let the download of the second chunk finish before the status is
+    # refreshed, so that it doesn't outlive the mocked responses.
+    wait([f for _, f in vulns._futures])
+    with pytest.raises(TioExportsError):
+        vulns.next()
+    assert vulns._pool is None
+    assert vulns._futures == list()
+
+
+def test_exports_iterator_workers_connection_pool(api):
+    '''test to size the connection pool to the number of workers'''
+    api.exports.vulns(uuid='0000', workers=32)
+    adapter = api._session.get_adapter('https://cloud.tenable.com')
+    assert adapter._pool_maxsize == 32
+    api.exports.vulns(uuid='0000', workers=4)
+    adapter = api._session.get_adapter('https://cloud.tenable.com')
+    assert adapter._pool_maxsize == 32
+
+
+def test_exports_vuln_workers_typeerror(api):
+    '''test to raise the exception when type of workers is not as defined'''
+    with pytest.raises(TypeError):
+        api.exports.vulns(uuid='0000', workers='nope')
+
+
+@responses.activate
+def test_exports_checkpoint_resume(api, tmpdir):
+    '''test to resume an export from a checkpoint'''
+    load_export_responses(responses)
+    path = str(tmpdir.join('vulns.checkpoint'))
+    checkpoint = ExportCheckpoint(path)
+    checkpoint.attach('vulns', '0000')
+    checkpoint.complete(1)
+
+    vulns = api.exports.vulns(checkpoint=path)
+    assert vulns.uuid == '0000'
+    vuln = vulns.next()
+    assert vuln['chunk'] == 2
+    for _ in range(5):
+        vulns.next()
+    assert ExportCheckpoint(path).chunks == [1, 2]
+
+    # once the export has been completely consumed, the checkpoint should be
+    # removed so that the next run will request a new export.
+    assert len(list(vulns)) == 4
+    assert not tmpdir.join('vulns.checkpoint').exists()
+
+
+@responses.activate
+def test_exports_checkpoint_type_mismatch(api, tmpdir):
+    '''test to request a new export when the checkpoint is for another type'''
+    responses.add(
+        method='POST',
+        url='https://cloud.tenable.com/assets/export',
+        json={'export_uuid': '1111'}
+    )
+    checkpoint = ExportCheckpoint(str(tmpdir.join('export.checkpoint')))
+    checkpoint.attach('vulns', '0000')
+    checkpoint.complete(1)
+    assets = api.exports.assets(checkpoint=checkpoint)
+    assert assets.uuid == '1111'
+    assert assets.processed == []
+    assert checkpoint.type == 'assets'
+    assert checkpoint.uuid == '1111'
+
+
+@responses.activate
+@pytest.mark.parametrize('status', ['ERROR', 'CANCELLED', 404])
+def test_exports_checkpoint_restart(api, tmpdir, status):
+    '''test to request a new export when the checkpointed export is gone'''
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/vulns/export/0000/status',
+        **({'status': 404} if status == 404 else {'json': {'status': status}})
+    )
+    responses.add(
+        method='POST',
+        url='https://cloud.tenable.com/vulns/export',
+        json={'export_uuid': '1111'}
+    )
+    checkpoint = ExportCheckpoint(str(tmpdir.join('vulns.checkpoint')))
+    checkpoint.attach('vulns', '0000')
+    checkpoint.complete(1)
+    vulns = api.exports.vulns(checkpoint=checkpoint)
+    assert vulns.uuid == '1111'
+    assert vulns.processed == []
+    assert checkpoint.uuid == '1111'
+
+
+@responses.activate
+def test_exports_checkpoint_cleared_on_cancelled(api, tmpdir):
+    '''test to clear the checkpoint when the export is cancelled server-side'''
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/vulns/export/0000/status',
+        json={'status': 'CANCELLED', 'chunks_available': []}
+    )
+    path = tmpdir.join('vulns.checkpoint')
+    vulns = api.exports.vulns(uuid='0000', checkpoint=str(path))
+    assert path.exists()
+    with pytest.raises(TioExportsError):
+        vulns.next()
+    assert not path.exists()
+
+
+@responses.activate
+def test_exports_checkpoint_cleared_on_cancel(api, tmpdir):
+    '''test to clear the checkpoint when the export is cancelled'''
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/vulns/export/0000/cancel',
+        json={'status': 'CANCELLED'}
+    )
+    path = tmpdir.join('vulns.checkpoint')
+    vulns = api.exports.vulns(uuid='0000', checkpoint=str(path))
+    vulns.cancel()
+    assert not path.exists()
+
+
+def test_exports_vuln_checkpoint_typeerror(api):
+    '''test to raise the exception when type of checkpoint is not as defined'''
+    with pytest.raises(TypeError):
+        api.exports.vulns(uuid='0000', checkpoint=1)
+
+
+@responses.activate
+def test_exports_iterator_streaming(api):
+    '''test to decode the export chunks as they are streamed'''
+    load_export_responses(responses)
+    vulns = api.exports.vulns(uuid='0000', streaming=True)
+    records = [(v['chunk'], v['record']) for v in vulns]
+    assert records == [(c, r) for c in range(1, 4) for r in range(5)]
+    assert vulns.count == 15
+
+
+@responses.activate
+def test_exports_iterator_streaming_workers(api):
+    '''test to stream the export chunks using a pool of workers'''
+    load_export_responses(responses, chunks=6)
+    vulns = api.exports.vulns(uuid='0000', streaming=True, workers=3)
+    records = [(v['chunk'], v['record']) for v in vulns]
+    assert records == [(c, r) for c in range(1, 7) for r in range(5)]
+
+
+@responses.activate
+def test_exports_iterator_streaming_retry(api):
+    '''test to retry a chunk that fails to decode while streaming'''
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/vulns/export/0000/status',
+        json={'status': 'FINISHED', 'chunks_available': [1]}
+    )
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/vulns/export/0000/chunks/1',
+        body='[{"id": 1}, {"id": 2}, {"id":'
+    )
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/vulns/export/0000/chunks/1',
+        json=[{'id': 1}, {'id': 2}, {'id': 3}]
+    )
+    vulns = api.exports.vulns(uuid='0000', streaming=True)
+    assert [v['id'] for v in vulns] == [1, 2, 3]
+
+
+def test_exports_vuln_streaming_typeerror(api):
+    '''test to raise the exception when type of streaming is not as defined'''
+    with pytest.raises(TypeError):
+        api.exports.vulns(uuid='0000', streaming=1)
+
+
+@responses.activate
+def test_exports_spool(api, tmpdir):
+    '''test to write the raw export chunks to disk'''
+    load_export_responses(responses)
+    manifest = api.exports.vulns(uuid='0000').spool(str(tmpdir))
+    assert [c['chunk_id'] for c in manifest] == [1, 2, 3]
+    for chunk in manifest:
+        with open(chunk['path']) as fobj:
+            data = json.load(fobj)
+        assert len(data) == 5
+        assert data[0]['chunk'] == chunk['chunk_id']
+        assert chunk['size'] == os.path.getsize(chunk['path'])
+
+
+@responses.activate
+def test_exports_spool_compressed_workers(api, tmpdir):
+    '''test to write gzip-compressed export chunks using a pool of workers'''
+    load_export_responses(responses, chunks=8)
+    manifest = api.exports.vulns(uuid='0000', workers=4).spool(
+        str(tmpdir.join('spool')), compress=True)
+    assert [c['chunk_id'] for c in manifest] == list(range(1, 9))
+    for chunk in manifest:
+        assert chunk['path'].endswith('.json.gz')
+        with gzip.open(chunk['path']) as fobj:
+            assert json.load(fobj)[0]['chunk'] == chunk['chunk_id']
+
+
+@responses.activate
+def test_exports_multi(api):
+    '''test to work through several exports at the same time'''
+    responses.add(
+        method='POST',
+        url='https://cloud.tenable.com/vulns/export',
+        json={'export_uuid': '0000'}
+    )
+    responses.add(
+        method='POST',
+        url='https://cloud.tenable.com/assets/export',
+        json={'export_uuid': '1111'}
+    )
+    load_export_responses(responses, chunks=4)
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/assets/export/1111/status',
+        json={'status': 'FINISHED', 'chunks_available': [1, 2]}
+    )
+    for chunk in [1, 2]:
+        responses.add(
+            method='GET',
+            url='https://cloud.tenable.com/assets/export/1111/chunks/{}'.format(chunk),
+            json=[{'chunk': chunk, 'id': i} for i in range(3)]
+        )
+    multi = api.exports.multi(vulns={'severity': ['critical']}, assets={},
+                              workers=3)
+    records = list(multi)
+    assert len(records) == 26
+    assert multi.counts == {'vulns': 20, 'assets': 6}
+
+    # the chunk downloads should be interleaved across the exports.
+    types = [t for t, _ in records]
+    assert types.index('assets') < types.index('vulns') + 10
+
+
+@responses.activate
+def test_exports_multi_route(api):
+    '''test to route the records of each export to their own sinks'''
+    load_export_responses(responses, chunks=2)
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/assets/export/1111/status',
+        json={'status': 'FINISHED', 'chunks_available': [1]}
+    )
+    responses.add(
+        method='GET',
+        url='https://cloud.tenable.com/assets/export/1111/chunks/1',
+        json=[{'id': 1}]
+    )
+    sinks = {'vulns': list(), 'assets': list()}
+    counts = api.exports.multi(vulns={'uuid': '0000'}, assets={'uuid': '1111'}
+        ).route(dict([(k, v.append) for k, v in sinks.items()]))
+    assert counts == {'vulns': 10, 'assets': 1}
+    assert sinks['assets'] == [{'id': 1}]
+    assert len(sinks['vulns']) == 10
+
+
+def test_exports_multi_unexpectedvalueerror(api):
+    '''test to raise the exception when an unknown export type is passed'''
+    with pytest.raises(UnexpectedValueError):
+        api.exports.multi(findings={})
+    with pytest.raises(UnexpectedValueError):
+        api.exports.multi()
+
+
+@pytest.mark.parametrize('doc', [
+    '[12345, -678]',
+    '[0.125, -3.5]',
+    '[1e5, 2.5E-3, -7e+2]',
+    '[1, {"a": 10.5}, 20]',
+])
+def test_json_array_iterator_split_numbers(doc):
+    '''test that numbers split across chunks at any offset are decoded whole'''
+    expected = json.loads(doc)
+    for split in range(1, len(doc)):
+        chunks = [doc[:split], doc[split:]]
+        assert list(json_array_iterator(chunks)) == expected, chunks
+        bchunks = [c.encode('utf-8') for c in chunks]
+        assert list(json_array_iterator(bchunks)) == expected, chunks
+
+
+def test_json_array_iterator_single_characters():
+    '''test that a document fed one character at a time is decoded'''
+    doc = '[1e5, 0.1, -20, true, null, "x", [3.25]]'
+    assert list(json_array_iterator(list(doc))) == json.loads(doc)
+
+
+def test_json_array_iterator_invalid_number():
+    '''test that a malformed number still raises a decode error'''
+    with pytest.raises(json.JSONDecodeError):
+        list(json_array_iterator(['[1x', '2]']))
@@ -1,7 +1,8 @@
 '''
 test filters
 '''
-import pytest
+import pytest, responses
+from tenable.io.filters import FiltersAPI
 from tests.checker import check
 
 @pytest.mark.vcr()
@@ -152,4 +153,97 @@ def test_filters_credentials_false_filters(api):
         check(data[1], 'name', str, allow_none=True)
         check(data[1], 'readable_name', str, allow_none=True)
         check(data[1], 'operators', list, allow_none=True)
-        check(data[1], 'control', dict, allow_none=True)
\ No newline at end of file
+        check(data[1], 'control', dict, allow_none=True)
+
+FILTERS = {'filters': [{
+    'name': 'plugin_id',
+    'operators': ['eq', 'neq'],
+    'control': {'type': 'entry', 'regex': '^[0-9]+$'}
+}, {
+    'name': 'severity',
+    'operators': ['eq'],
+    'control': {'type': 'dropdown', 'list': ['Info', 'Low', 'Medium']}
+}]}
+
+
+@pytest.fixture
+def filter_cache(monkeypatch):
+    monkeypatch.setattr(FiltersAPI, '_cache', dict())
+    monkeypatch.setattr(FiltersAPI, 'cache_ttl', 3600)
+    monkeypatch.setattr(FiltersAPI, 'cache_dir', None)
+    return FiltersAPI
+
+
+@responses.activate
+def test_filter_cache_normalized_once(api, filter_cache, monkeypatch):
+    responses.add(responses.GET,
+        'https://cloud.tenable.com/filters/workbenches/vulnerabilities',
+        json=FILTERS)
+    normalize = FiltersAPI._normalize
+    calls = list()
+    monkeypatch.setattr(FiltersAPI, '_normalize',
+        lambda self, f: calls.append(f) or normalize(self, f))
+    first = api.filters.workbench_vuln_filters()
+    assert api.filters.workbench_vuln_filters() == first
+    assert api.filters.workbench_vuln_filters(normalize=False) == (
+        FILTERS['filters'])
+    assert first['severity']['choices'] == ['Info', 'Low', 'Medium']
+    assert len(calls) == 1
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_filter_cache_copies(api, filter_cache):
+    responses.add(responses.GET,
+        'https://cloud.tenable.com/filters/workbenches/vulnerabilities',
+        json=FILTERS)
+    first = api.filters.workbench_vuln_filters()
+    first['severity']['choices'].append('Critical')
+    del first['plugin_id']
+    api.filters.workbench_vuln_filters(normalize=False).pop()
+    second = api.filters.workbench_vuln_filters()
+    assert second is not first
+    assert second['severity']['choices'] == ['Info', 'Low', 'Medium']
+    assert 'plugin_id' in second
+    assert len(api.filters.workbench_vuln_filters(normalize=False)) == 2
+
+    # The internal filter set is shared with the cache, so the filters are
+    # only normalized once no matter how many times they are parsed.
+    assert api.filters._filterset('vulns') is api.filters._filterset('vulns')
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_filter_cache_ttl(api, filter_cache, monkeypatch):
+    responses.add(responses.GET,
+        'https://cloud.tenable.com/filters/scans/agents', json=FILTERS)
+    now = [1000.0]
+    monkeypatch.setattr('tenable.io.filters.time.time', lambda: now[0])
+    api.filters.agents_filters()
+    now[0] += 3599
+    api.filters.agents_filters()
+    assert len(responses.calls) == 1
+    now[0] += 2
+    api.filters.agents_filters()
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_filter_cache_disk(api, filter_cache, tmpdir):
+    responses.add(responses.GET,
+        'https://cloud.tenable.com/filters/scans/reports', json=FILTERS)
+    filter_cache.cache_dir = str(tmpdir)
+    expected = api.filters.scan_filters()
+    assert len(tmpdir.listdir()) == 1
+
+    # A new process would start with an empty in-memory cache, and should load
+    # the filters from disk instead of fetching them.
+    filter_cache._cache = dict()
+    assert api.filters.scan_filters() == expected
+    assert len(responses.calls) == 1
+
+    # Once the filters on disk are stale, they should be fetched again.
+    filter_cache._cache = dict()
+    filter_cache.cache_ttl = 0
+    api.filters.scan_filters()
+    assert len(responses.calls) == 2
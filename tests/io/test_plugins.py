@@ -1,6 +1,6 @@
 from ..checker import check, single
 from datetime import date
-import pytest
+import os, pytest, responses
 from tenable.io.plugins import PluginIterator
 
 
@@ -97,4 +97,114 @@ def test_plugins_list_success(api):
 
 @pytest.mark.vcr()
 def test_plugin_iterator_populate_family_cache(api):
-    api.pluginsIterator._populate_family_cache()
\ No newline at end of file
+    api.pluginsIterator._populate_family_cache()
+
+def load_family_responses(rsps, plugin_set='201812051251', counts=(2, 3)):
+    rsps.add(responses.GET, 'https://cloud.tenable.com/server/properties',
+        json={'plugin_set': plugin_set})
+    rsps.add(responses.GET, 'https://cloud.tenable.com/plugins/families',
+        json={'families': [{'id': i + 1, 'name': 'Family {}'.format(i + 1),
+            'count': count} for i, count in enumerate(counts)]})
+    for i, count in enumerate(counts):
+        rsps.add(responses.GET,
+            'https://cloud.tenable.com/plugins/families/{}'.format(i + 1),
+            json={'id': i + 1, 'name': 'Family {}'.format(i + 1),
+                'plugins': [{'id': (i + 1) * 100 + p, 'name': 'plugin'}
+                    for p in range(count)]})
+
+
+def test_plugin_iterator_family_cache(api, tmpdir):
+    with responses.RequestsMock() as rsps:
+        load_family_responses(rsps)
+        plugins = api.plugins.list()
+        plugins.family_cache = str(tmpdir)
+        plugins._populate_family_cache()
+        assert plugins._maptable['families'] == {1: 'Family 1', 2: 'Family 2'}
+        assert plugins._maptable['plugins'] == {
+            100: 1, 101: 1, 200: 2, 201: 2, 202: 2}
+        assert len(tmpdir.listdir()) == 1
+
+    # As the plugin feed hasn't changed, only the server properties should be
+    # requested.
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.GET, 'https://cloud.tenable.com/server/properties',
+            json={'plugin_set': '201812051251'})
+        plugins = api.plugins.list()
+        plugins.family_cache = str(tmpdir)
+        plugins._populate_family_cache()
+        assert plugins._maptable['plugins'][202] == 2
+
+
+def test_plugin_iterator_family_cache_refresh(api, tmpdir):
+    with responses.RequestsMock() as rsps:
+        load_family_responses(rsps)
+        plugins = api.plugins.list()
+        plugins.family_cache = str(tmpdir)
+        plugins._populate_family_cache()
+
+    # The plugin feed has changed and a plugin was added to the first family,
+    # so only the first family should be requested again.
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        load_family_responses(rsps, '201901010000', (3, 3))
+        plugins = api.plugins.list()
+        plugins.family_cache = str(tmpdir)
+        plugins._populate_family_cache()
+        urls = [c.request.url for c in rsps.calls]
+        assert 'https://cloud.tenable.com/plugins/families/1' in urls
+        assert 'https://cloud.tenable.com/plugins/families/2' not in urls
+        assert plugins._maptable['plugins'][102] == 1
+        assert plugins._maptable['plugins'][202] == 2
+
+
+def load_plugin_list_responses(rsps, plugins, last_updated='1970-01-01'):
+    rsps.add(responses.GET, 'https://cloud.tenable.com/plugins/plugin',
+        match_querystring=False,
+        json={'data': {'plugin_details': plugins},
+            'total_count': len(plugins),
+            'params': {'last_updated': last_updated}})
+
+
+def plugin_list_url(rsps):
+    return [c.request.url for c in rsps.calls if 'plugins/plugin' in
+        c.request.url][0]
+
+
+def test_plugin_catalog_sync(api, tmpdir):
+    path = os.path.join(str(tmpdir), 'plugins.db')
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        load_family_responses(rsps)
+        load_plugin_list_responses(rsps, [
+            {'id': 100, 'name': 'a', 'attributes': {'cve': ['CVE-2019-0001']}},
+            {'id': 200, 'name': 'b', 'attributes': {
+                'cve': ['CVE-2019-0001', 'CVE-2019-0002']}},
+            {'id': 201, 'name': 'c', 'attributes': {}},
+        ])
+        with api.plugins.catalog(path, family_cache=str(tmpdir)) as catalog:
+            assert catalog.last_updated is None
+            assert catalog.sync() == 3
+            assert 'last_updated=1970-01-01' in plugin_list_url(rsps)
+            assert len(catalog) == 3
+            assert catalog.get(100)['family_name'] == 'Family 1'
+            assert catalog.get(999) is None
+            assert 201 in catalog
+            assert [p['id'] for p in catalog.family('Family 2')] == [200, 201]
+            assert [p['id'] for p in catalog.family(1)] == [100]
+            assert [p['id'] for p in catalog.cve('cve-2019-0001')] == [100, 200]
+            assert catalog.last_updated is not None
+
+    # The second sync should only ask for the plugins updated since the last
+    # sync, and update the stored plugins.
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        load_family_responses(rsps)
+        load_plugin_list_responses(rsps, [
+            {'id': 200, 'name': 'b2', 'attributes': {'cve': ['CVE-2019-0002']}},
+        ])
+        with api.plugins.catalog(path, family_cache=str(tmpdir)) as catalog:
+            assert catalog.get(200)['name'] == 'b'
+            assert catalog.sync() == 1
+            assert 'last_updated={}'.format(
+                catalog.last_updated.strftime('%Y-%m-%d')
+            ) in plugin_list_url(rsps)
+            assert catalog.get(200)['name'] == 'b2'
+            assert [p['id'] for p in catalog.cve('CVE-2019-0001')] == [100]
+            assert len(catalog) == 3
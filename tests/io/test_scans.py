@@ -7,8 +7,11 @@ import os
 from io import BytesIO
 from sys import stdout
 import pytest
+import responses
 from tenable.reports.nessusv2 import NessusReportv2
-from tenable.errors import UnexpectedValueError, NotFoundError, InvalidInputError
+from tenable.errors import (
+    UnexpectedValueError, NotFoundError, InvalidInputError, PollingTimeout
+)
 from tests.checker import check, single
 from tests.io.conftest import SCAN_ID_WITH_RESULTS
 from tests.pytenable_log_handler import log_exception
@@ -1376,6 +1379,37 @@ def test_scan_export_was_typeerror(api):
     with pytest.raises(UnexpectedValueError):
         api.scans.export(SCAN_ID_WITH_RESULTS, scan_type='bad-value')
 
+@responses.activate
+def test_scan_export_timeout(api):
+    '''
+    test to raise a PollingTimeout when the export isn't ready in time
+    '''
+    responses.add(responses.GET,
+        'https://cloud.tenable.com/filters/scans/reports',
+        json={'filters': []})
+    responses.add(responses.POST,
+        'https://cloud.tenable.com/scans/1/export', json={'file': 2})
+    responses.add(responses.GET,
+        'https://cloud.tenable.com/scans/1/export/2/status',
+        json={'status': 'loading'})
+    with pytest.raises(TypeError):
+        api.scans.export(1, timeout='nope')
+    assert not [c for c in responses.calls if c.request.method == 'POST']
+    with pytest.raises(PollingTimeout):
+        api.scans.export(1, timeout=0)
+    assert not [c for c in responses.calls if 'download' in c.request.url]
+
+@responses.activate
+def test_scan_stop_block_timeout(api):
+    '''
+    test to raise a PollingTimeout when the scan doesn't stop in time
+    '''
+    responses.add(responses.POST, 'https://cloud.tenable.com/scans/1/stop')
+    responses.add(responses.GET, 'https://cloud.tenable.com/scans/1',
+        json={'info': {'status': 'stopping'}})
+    with pytest.raises(PollingTimeout):
+        api.scans.stop(1, block=True, timeout=0)
+
 @pytest.mark.vcr()
 def test_scan_export_bytesio_stream_hook(api, scan_results):
     '''
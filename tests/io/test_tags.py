@@ -1,12 +1,14 @@
 '''
 test tags
 '''
+import json
 import uuid
 import pytest
+import responses
 from tests.checker import check, single
-from tenable.io.tags import TagsIterator
+from tenable.io.tags import TagsIterator, BulkTagAssignment
 from tests.pytenable_log_handler import log_exception
-from tenable.errors import UnexpectedValueError
+from tenable.errors import UnexpectedValueError, ServerError
 
 
 @pytest.fixture(name='tagfilters')
@@ -1080,3 +1082,131 @@ def tag_exists(api, tag_uuid):
         return True
     else:
         return False
+
+
+ASSIGN_URL = 'https://cloud.tenable.com/tags/assets/assignments'
+
+
+def assignment_callback(request):
+    '''
+    returns a job uuid for each assignment request, failing the requests for
+    the asset uuid ending in 9.
+    '''
+    body = json.loads(request.body)
+    if any(a.endswith('9') for a in body['assets']):
+        return (500, {}, json.dumps({'error': 'server error'}))
+    return (200, {}, json.dumps({'job_uuid': 'job-{}'.format(body['assets'][0])}))
+
+
+def uuids(count, prefix='00000000'):
+    '''
+    builds a list of uuids
+    '''
+    return ['{}-0000-0000-0000-{:012d}'.format(prefix, i) for i in range(count)]
+
+
+def test_tags_bulk_assign_batches(api):
+    '''
+    test that the assets and tags are split into batches
+    '''
+    engine = BulkTagAssignment(api, 'add', uuids(5), uuids(3),
+        batch_size=2, tag_batch_size=2)
+    batches = engine.batches()
+    assert len(batches) == 6
+    assert [len(a) for a, t in batches] == [2, 2, 1, 2, 2, 1]
+    assert [len(t) for a, t in batches] == [2, 2, 2, 1, 1, 1]
+
+
+def test_tags_bulk_assign_batch_size_typeerror(api):
+    '''
+    test to raise exception when type of batch_size param does not match
+    '''
+    with pytest.raises(TypeError):
+        api.tags.bulk_assign(uuids(1), uuids(1), batch_size=1.5)
+
+
+@responses.activate
+def test_tags_bulk_assign_results(api):
+    '''
+    test that each batch is submitted and the failures are isolated
+    '''
+    responses.add_callback(responses.POST, ASSIGN_URL,
+        callback=assignment_callback)
+    results = api.tags.bulk_assign(uuids(10), uuids(1), batch_size=3,
+        workers=2)
+    assert [r['batch'] for r in results] == [0, 1, 2, 3]
+    assert [r['assets'] for r in results] == [3, 3, 3, 1]
+    assert [r['status'] for r in results] == [
+        'SUBMITTED', 'SUBMITTED', 'SUBMITTED', 'FAILED']
+    assert results[0]['job_uuid'] == 'job-00000000-0000-0000-0000-000000000000'
+    assert isinstance(results[3]['error'], ServerError)
+    sent = [json.loads(c.request.body) for c in responses.calls]
+    assert {b['action'] for b in sent} == {'add'}
+    assert sorted(a for b in sent for a in b['assets']) == uuids(10)
+
+
+@responses.activate
+def test_tags_bulk_unassign_job_status(api):
+    '''
+    test that each job is polled until it has completed
+    '''
+    responses.add_callback(responses.POST, ASSIGN_URL,
+        callback=assignment_callback)
+    polls = dict()
+
+    def job_status(job_uuid):
+        polls[job_uuid] = polls.get(job_uuid, 0) + 1
+        return 'completed' if polls[job_uuid] > 1 else 'running'
+
+    results = api.tags.bulk_unassign(uuids(4), uuids(1), batch_size=2,
+        job_status=job_status, poller={'delay': 0, 'jitter': 0})
+    assert [r['status'] for r in results] == ['COMPLETED', 'COMPLETED']
+    assert list(polls.values()) == [2, 2]
+    assert {json.loads(c.request.body)['action']
+        for c in responses.calls} == {'remove'}
+
+
+@responses.activate
+def test_tags_bulk_assign_job_status_error(api):
+    '''
+    test that an error from the job status callable only fails its batch
+    '''
+    responses.add_callback(responses.POST, ASSIGN_URL,
+        callback=assignment_callback)
+
+    def job_status(job_uuid):
+        if job_uuid.endswith('2'):
+            raise RuntimeError('status lookup failed')
+        return 'COMPLETED'
+
+    results = api.tags.bulk_assign(uuids(6), uuids(1), batch_size=2,
+        job_status=job_status, poller={'delay': 0, 'jitter': 0})
+    assert [r['status'] for r in results] == [
+        'COMPLETED', 'FAILED', 'COMPLETED']
+    assert isinstance(results[1]['error'], RuntimeError)
+    assert results[1]['job_uuid'] == 'job-00000000-0000-0000-0000-000000000002'
+    assert results[0]['error'] is None and results[2]['error'] is None
+
+
+@responses.activate
+def test_tags_bulk_assign_missing_job_uuid(api):
+    '''
+    test that a response without a job uuid only fails its batch
+    '''
+    responses.add(responses.POST, ASSIGN_URL, json={})
+    results = api.tags.bulk_assign(uuids(4), uuids(1), batch_size=2)
+    assert [r['status'] for r in results] == ['FAILED', 'FAILED']
+    assert all(isinstance(r['error'], KeyError) for r in results)
+
+
+def test_tags_bulk_assign_rate_limit(api, monkeypatch):
+    '''
+    test that the batch submissions are spaced out by the rate limit
+    '''
+    sleeps = list()
+    monkeypatch.setattr('tenable.io.tags.time.sleep', sleeps.append)
+    monkeypatch.setattr('tenable.io.tags.time.time', lambda: 100.0)
+    engine = BulkTagAssignment(api, 'add', [], [], rate_limit=4)
+    for _ in range(3):
+        engine._throttle()
+    assert sleeps == [0.25, 0.5]
@@ -4,7 +4,8 @@ test workbenches
 import uuid
 from io import BytesIO
 import pytest
-from tenable.errors import UnexpectedValueError, NotFoundError
+import responses
+from tenable.errors import UnexpectedValueError, NotFoundError, PollingTimeout
 from tests.checker import check
 
 @pytest.mark.vcr()
@@ -1145,3 +1146,20 @@ def test_workbench_asset_info_success(api):
     '''
     asset = api.workbenches.assets()
     api.workbenches.asset_info(asset[0]['id'], all_fields=False)
+
+
+@responses.activate
+def test_workbench_export_timeout(api):
+    '''
+    test to raise a PollingTimeout when the export isn't ready in time
+    '''
+    responses.add(responses.GET,
+        'https://cloud.tenable.com/filters/workbenches/vulnerabilities',
+        json={'filters': []})
+    responses.add(responses.GET,
+        'https://cloud.tenable.com/workbenches/export', json={'file': 2})
+    responses.add(responses.GET,
+        'https://cloud.tenable.com/workbenches/export/2/status',
+        json={'status': 'loading'})
+    with pytest.raises(PollingTimeout):
+        api.workbenches.export(timeout=0)
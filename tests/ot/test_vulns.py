@@ -1,10 +1,13 @@
 '''
 test vulns
 '''
+import json
 import re
 import pytest
 import responses
 from box import Box
+from tenable.ot.vulns import AssetCache
+from tenable.errors import UnexpectedValueError
 from tests.ot.conftest import ot as fixture_ot
 
 def load_responses(responses):
@@ -174,3 +177,190 @@ def test_assets_list(fixture_ot):
     for count in counts:
         assert count.cveId
         assert count.assetCount
+
+
+@responses.activate
+def test_vuln_asset_intermixer_shared_interfaces(fixture_ot):
+    '''
+    Tests that the enrichment is deduplicated across assets and vulns
+    '''
+    responses.add(
+        method='GET',
+        url='https://localhost:443/v1/vulnerabilities',
+        json=[{'id': 'CVE-2020-0001'}, {'id': 'CVE-2020-0002'}]
+    )
+    for cve, assets in (('CVE-2020-0001', ['a1', 'a2', 'a3']),
+                        ('CVE-2020-0002', ['a2', 'a4'])):
+        responses.add(
+            method='POST',
+            url='https://localhost:443/v1/vulnerabilities/{}/assets'.format(cve),
+            json=[{'id': a, 'name': a} for a in assets]
+        )
+    for asset in ('a1', 'a2', 'a3', 'a4'):
+        responses.add(
+            method='GET',
+            url='https://localhost:443/v1/assets/{}/connections'.format(asset),
+            json=[{'asset': asset, 'networkInterface': 'shared'},
+                  {'asset': asset, 'networkInterface': 'own-{}'.format(asset)}]
+        )
+    responses.add(
+        method='GET',
+        url=re.compile('https://localhost:443/v1/networkinterfaces/.*'),
+        json={'ips': ['192.168.101.154']}
+    )
+    vulns = fixture_ot.vulns.extract(workers=4)
+    items = list(vulns)
+
+    assert [(v.id, v.asset.id) for v in items] == [
+        ('CVE-2020-0001', 'a1'),
+        ('CVE-2020-0001', 'a2'),
+        ('CVE-2020-0001', 'a3'),
+        ('CVE-2020-0002', 'a2'),
+        ('CVE-2020-0002', 'a4'),
+    ]
+    assert items[4].asset.connections[1].networkInterface.id == 'own-a4'
+    assert vulns.asset_count == 4
+    assert vulns.vuln_count == 2
+    urls = [c.request.url for c in responses.calls]
+    assert len([u for u in urls if 'connections' in u]) == 4
+    assert len([u for u in urls if 'networkinterfaces' in u]) == 5
+
+
+def graph_callback(pages):
+    '''
+    Returns a responses callback serving the pages of each GraphQL root
+    connection based on the cursor requested.
+    '''
+    def callback(request):
+        body = json.loads(request.body)
+        root = re.search(r'query (\w+)', body['query']).group(1)
+        cursor = int(body['variables']['cursor'] or 0)
+        nodes = pages[root][cursor]
+        return (200, {}, json.dumps({'data': {root: {
+            'nodes': nodes,
+            'pageInfo': {
+                'endCursor': str(cursor + 1),
+                'hasNextPage': cursor + 1 < len(pages[root])
+            }
+        }}}))
+    return callback
+
+
+@responses.activate
+def test_vuln_graph_extractor(fixture_ot):
+    '''
+    Tests the GraphQL bulk extractor
+    '''
+    responses.add_callback(
+        method='POST',
+        url='https://localhost:443/graphql',
+        content_type='application/json',
+        callback=graph_callback({
+            'networkInterfaces': [
+                [{'id': 'n1', 'ips': ['10.0.0.1']}],
+                [{'id': 'n2', 'ips': ['10.0.0.2']}],
+            ],
+            'assets': [[
+                {'id': 'a1', 'name': 'PLC 1', 'connections': [
+                    {'networkInterface': {'id': 'n1'}, 'local': True}]},
+                {'id': 'a2', 'name': 'PLC 2', 'connections': [
+                    {'networkInterface': {'id': 'n1'}, 'local': False},
+                    {'networkInterface': {'id': 'n2'}, 'local': True}]},
+            ]],
+            'vulnerabilities': [
+                [{'id': 'CVE-2020-0001', 'comment': '',
+                  'assets': [{'id': 'a1'}, {'id': 'a2'}]}],
+                [{'id': 'CVE-2020-0002', 'comment': '',
+                  'assets': [{'id': 'a2'}]}],
+            ],
+        })
+    )
+    vulns = fixture_ot.vulns.bulk_extract(limit=1, asset_fields=['name'])
+    items = list(vulns)
+
+    assert [(v.id, v.asset.id) for v in items] == [
+        ('CVE-2020-0001', 'a1'),
+        ('CVE-2020-0001', 'a2'),
+        ('CVE-2020-0002', 'a2'),
+    ]
+    assert 'assets' not in items[0]
+    assert items[0].asset.name == 'PLC 1'
+    assert items[1].asset.connections[1].networkInterface.id == 'n2'
+    assert items[1].asset.connections[1].networkInterface.ips == ['10.0.0.2']
+    assert items[1].asset.connections[0].asset == 'a2'
+    assert vulns.count == 3
+    assert vulns.asset_count == 2
+    assert vulns.vuln_count == 2
+    assert len(responses.calls) == 5
+
+    query = json.loads(responses.calls[2].request.body)['query']
+    assert 'name' in query and 'firmwareVersion' not in query
+
+
+@responses.activate
+def test_vuln_graph_extractor_errors(fixture_ot):
+    '''
+    Tests that GraphQL errors are raised
+    '''
+    responses.add(
+        method='POST',
+        url='https://localhost:443/graphql',
+        json={'errors': [{'message': 'Cannot query field "nope"'}]}
+    )
+    with pytest.raises(UnexpectedValueError):
+        list(fixture_ot.vulns.bulk_extract(interface_fields=['nope']))
+
+
+def test_asset_cache_lru():
+    '''
+    Tests the size bounds of the asset cache
+    '''
+    cache = AssetCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses, cache.evictions) == (3, 1, 1)
+
+
+def test_asset_cache_ttl(monkeypatch):
+    '''
+    Tests the expiry of the asset cache entries
+    '''
+    now = [1000.0]
+    monkeypatch.setattr('tenable.ot.vulns.time.time', lambda: now[0])
+    cache = AssetCache(ttl=60)
+    cache.set('a', 1)
+    now[0] += 59
+    assert cache.get('a') == 1
+    now[0] += 1
+    assert 'a' not in cache
+    assert cache.get('a') is None
+    assert cache.expirations == 1
+
+
+@responses.activate
+def test_vuln_asset_intermixer_cache(fixture_ot):
+    '''
+    Tests that the asset cache is scoped to the extraction unless shared
+    '''
+    load_responses(responses)
+    first = list(fixture_ot.vulns.extract())
+    second = list(fixture_ot.vulns.extract())
+    assert len(first) == len(second) == 1
+    urls = [c.request.url for c in responses.calls]
+    assert len([u for u in urls if 'connections' in u]) == 2
+
+    cache = AssetCache()
+    list(fixture_ot.vulns.extract(cache=cache))
+    vulns = fixture_ot.vulns.extract(cache=cache)
+    list(vulns)
+    assert vulns.asset_count == 0
+    assert cache.hits >= 1
+    urls = [c.request.url for c in responses.calls]
+    assert len([u for u in urls if 'connections' in u]) == 3
@@ -1,10 +1,13 @@
 '''
 test nessusv2
 '''
+import io
 import os
 import datetime
 import pytest
-from tenable.reports.nessusv2 import NessusReportv2
+from tenable.reports.nessusv2 import (
+    NessusReportv2, NessusReportv2Pool, _SegmentReader, _parse_segment,
+    _read_spool)
 from ..checker import check
 
 
@@ -30,3 +33,195 @@ def test_nessus_report(datafiles):
             check(item, 'severity', int)
             check(item, 'solution', str)
             check(item, 'synopsis', str)
+
+
+@pytest.mark.datafiles(os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    '..', 'test_files', 'example.nessus'))
+def test_nessus_report_fast(datafiles):
+    path = os.path.join(str(datafiles), 'example.nessus')
+    with open(path, 'rb') as nobj:
+        expected = list(NessusReportv2(nobj))
+    with open(path, 'rb') as nobj:
+        assert list(NessusReportv2(nobj, fast=True)) == expected
+
+
+@pytest.mark.datafiles(os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    '..', 'test_files', 'example.nessus'))
+def test_nessus_report_fast_without_lxml(datafiles, monkeypatch):
+    monkeypatch.setattr('tenable.reports.nessusv2.lxml_iterparse', None)
+    path = os.path.join(str(datafiles), 'example.nessus')
+    with open(path, 'rb') as nobj:
+        expected = list(NessusReportv2(nobj))
+    with open(path, 'rb') as nobj:
+        report = NessusReportv2(nobj, fast=True)
+        assert not report._lxml
+        assert list(report) == expected
+
+
+def test_nessus_report_fast_dates():
+    report = NessusReportv2(
+        io.BytesIO(b'<NessusClientData_v2/>'), fast=True)
+    assert report._date('2018/08/22') == datetime.datetime(2018, 8, 22)
+    assert report._date('Fri Sep 14 03:33:11 2018') == datetime.datetime(
+        2018, 9, 14, 3, 33, 11)
+    assert report._date('2018-08-22T10:00:00') == datetime.datetime(
+        2018, 8, 22, 10)
+
+
+@pytest.mark.datafiles(os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    '..', 'test_files', 'example.nessus'))
+def test_nessus_report_hosts(datafiles):
+    path = os.path.join(str(datafiles), 'example.nessus')
+    with open(path, 'rb') as nobj:
+        expected = list(NessusReportv2(nobj))
+    with open(path, 'rb') as nobj:
+        hosts = list(NessusReportv2(nobj).hosts())
+    assert sum(len(h['items']) for h in hosts) == len(expected)
+    for host in hosts:
+        check(host, 'name', str)
+        check(host['properties'], 'HOST_START', datetime.datetime)
+        for item in host['items']:
+            assert item['host'] is host['properties']
+            assert 'HOST_START' not in item
+            check(item, 'pluginID', int)
+    item = dict(hosts[0]['items'][0])
+    item.update(item.pop('host'))
+    assert item == expected[0]
+
+
+@pytest.mark.datafiles(os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    '..', 'test_files', 'example.nessus'))
+def test_nessus_report_columns(datafiles):
+    path = os.path.join(str(datafiles), 'example.nessus')
+    with open(path, 'rb') as nobj:
+        expected = list(NessusReportv2(nobj))
+    with open(path, 'rb') as nobj:
+        batches = list(NessusReportv2(nobj).columns(100, ['host-ip']))
+    assert [len(b['pluginID']) for b in batches] == [100, 100, 30]
+    for batch in batches:
+        assert len(set(len(c) for c in batch.values())) == 1
+    assert batches[0]['host-ip'][0] == expected[0]['host-ip']
+    assert 'host-report-name' not in batches[0]
+    assert [p for b in batches for p in b['pluginID']] == [
+        i['pluginID'] for i in expected]
+
+
+@pytest.fixture
+def nessus_files(tmpdir):
+    '''
+    Builds a couple of multi-host reports out of the example report.
+    '''
+    path = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+        '..', 'test_files', 'example.nessus')
+    with open(path, 'rb') as fobj:
+        content = fobj.read()
+    start = content.index(b'<ReportHost ')
+    end = content.index(b'</ReportHost>') + len(b'</ReportHost>')
+    host = content[start:end]
+    name = host[:host.index(b'>')]
+
+    files = list()
+    for fnum in range(2):
+        hosts = [host.replace(name, '<ReportHost name="host-{}-{}"'.format(
+            fnum, hnum).encode(), 1) for hnum in range(3)]
+        fpath = os.path.join(str(tmpdir), 'report{}.nessus'.format(fnum))
+        with open(fpath, 'wb') as fobj:
+            fobj.write(content[:start] + b''.join(hosts) + content[end:])
+        files.append(fpath)
+    return files
+
+
+def parse_serially(files):
+    items = list()
+    for path in files:
+        with open(path, 'rb') as nobj:
+            items.extend(NessusReportv2(nobj))
+    return items
+
+
+def test_nessus_report_pool_ordered(nessus_files):
+    expected = parse_serially(nessus_files)
+    pool = NessusReportv2Pool(nessus_files, workers=2)
+    assert list(pool) == expected
+    stats = pool.stats
+    assert stats['files'] == 2
+    assert stats['segments'] == 2
+    assert stats['items'] == len(expected)
+    assert stats['failed'] == 0
+    assert stats['items_per_sec'] > 0
+
+
+def test_nessus_report_pool_unordered(nessus_files):
+    expected = parse_serially(nessus_files)
+    items = list(NessusReportv2Pool(nessus_files, workers=2, ordered=False))
+    key = lambda i: (i['host-report-name'], i['pluginID'], i['port'])
+    assert sorted(items, key=key) == sorted(expected, key=key)
+
+
+def test_nessus_report_pool_split(nessus_files):
+    expected = parse_serially(nessus_files)
+    pool = NessusReportv2Pool(nessus_files, workers=2, split=1024)
+    assert list(pool) == expected
+    assert pool.stats['segments'] == 6
+    assert pool.stats['bytes'] < sum(os.path.getsize(f) for f in nessus_files)
+
+
+def test_nessus_report_pool_errors(nessus_files, tmpdir):
+    broken = os.path.join(str(tmpdir), 'broken.nessus')
+    with open(broken, 'wb') as fobj:
+        fobj.write(b'<NessusClientData_v2><Report name="x"><ReportHost')
+    missing = os.path.join(str(tmpdir), 'missing.nessus')
+    expected = parse_serially(nessus_files)
+    pool = NessusReportv2Pool(
+        [broken, nessus_files[0], missing, nessus_files[1]], workers=2)
+    assert list(pool) == expected
+    assert [e[0] for e in pool.errors] == [missing, broken]
+    assert pool.stats['failed'] == 2
+    assert pool.stats['files'] == 3
+
+
+def test_nessus_report_segment_reader(tmpdir):
+    path = os.path.join(str(tmpdir), 'segment.txt')
+    with open(path, 'wb') as fobj:
+        fobj.write(b'0123456789')
+    with open(path, 'rb') as fobj:
+        reader = io.BufferedReader(
+            _SegmentReader(fobj, 2, 7, b'<', b'>'), buffer_size=2)
+        assert reader.read(3) == b'<23'
+        assert reader.read() == b'456>'
+
+
+def test_nessus_report_pool_unsplit_streamed(nessus_files, tmpdir):
+    spool_dir = str(tmpdir.mkdir('spool'))
+    expected = parse_serially(nessus_files[:1])
+    spool, count = _parse_segment(nessus_files[0], spool_dir=spool_dir)
+    assert os.path.dirname(spool) == spool_dir
+    assert count == len(expected)
+    assert list(_read_spool(spool)) == expected
+    assert os.listdir(spool_dir) == []
+
+
+def test_nessus_report_pool_segment_streamed(nessus_files, tmpdir):
+    pool = NessusReportv2Pool(nessus_files[:1], split=1024)
+    segments = pool._segments(nessus_files[0])
+    items = list()
+    for path, start, end, header in segments:
+        spool, _ = _parse_segment(path, start, end, header,
+            spool_dir=str(tmpdir))
+        items.extend(_read_spool(spool))
+    assert items == parse_serially(nessus_files[:1])
+
+
+def test_nessus_report_pool_spool_cleanup(nessus_files, tmpdir):
+    spool_dir = str(tmpdir.mkdir('spool'))
+    pool = NessusReportv2Pool(nessus_files * 3, workers=2,
+        spool_dir=spool_dir)
+    next(pool)
+    pool._iter.close()
+    assert os.listdir(spool_dir) == []
+    list(NessusReportv2Pool(nessus_files, workers=2, spool_dir=spool_dir))
+    assert os.listdir(spool_dir) == []
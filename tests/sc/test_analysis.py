@@ -1,4 +1,6 @@
+import json
 import pytest
+import responses
 from tenable.sc.analysis import AnalysisResultsIterator
 from ..checker import check
 from tenable.errors import UnexpectedValueError
@@ -1144,3 +1146,71 @@ def test_analysis_events_syslog(sc):
         check(event, 'sensor', str)
         check(event, 'time', str)
         check(event, 'type', str)
+
+
+def load_analysis_responses(sc, total, recordkeeping=True):
+    '''
+    registers an analysis endpoint returning the records for the requested
+    window of offsets.
+    '''
+    def callback(request):
+        query = json.loads(request.body)['query']
+        start, end = query['startOffset'], query['endOffset']
+        results = [{'id': i} for i in range(start, min(end, total))]
+        return (200, {}, json.dumps({
+            'type': 'regular',
+            'response': {
+                'totalRecords': str(total),
+                'returnedRecords': len(results) if recordkeeping else 0,
+                'startOffset': str(start),
+                'endOffset': str(end),
+                'results': results,
+            },
+            'error_code': 0,
+            'error_msg': '',
+            'warnings': [],
+            'timestamp': 1545060739,
+        }))
+    responses.add_callback('POST', '{}/analysis'.format(sc._url),
+                           callback=callback)
+
+
+@responses.activate
+@pytest.mark.parametrize('workers', [1, 4])
+def test_analysis_vulns_workers(sc, workers):
+    load_analysis_responses(sc, total=95)
+    vulns = sc.analysis.vulns(limit=10, workers=workers)
+    assert [v['id'] for v in vulns] == list(range(95))
+    assert len(responses.calls) == 10
+
+
+@responses.activate
+def test_analysis_vulns_workers_pages(sc):
+    load_analysis_responses(sc, total=95)
+    vulns = sc.analysis.vulns(limit=10, pages=3, workers=4)
+    assert [v['id'] for v in vulns] == list(range(30))
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_analysis_vulns_workers_recordkeeping_error(sc):
+    load_analysis_responses(sc, total=25, recordkeeping=False)
+    vulns = sc.analysis.vulns(limit=10, workers=4)
+    assert [v['id'] for v in vulns] == list(range(25))
+
+
+@responses.activate
+def test_analysis_vulns_workers_close(sc):
+    load_analysis_responses(sc, total=95)
+    with sc.analysis.vulns(limit=10, workers=4) as vulns:
+        for vuln in vulns:
+            break
+        pending = list(vulns._pending)
+    assert vulns._pool is None
+    assert vulns._pending == []
+    assert len(responses.calls) <= 1 + len(pending)
+
+
+def test_analysis_vulns_workers_typeerror(sc):
+    with pytest.raises(TypeError):
+        sc.analysis.vulns(workers='nope')